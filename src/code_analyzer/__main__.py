@@ -9,8 +9,11 @@ from typing import Optional
 import click
 from rich.console import Console
 
+from .analyzers.usage_index import DEFAULT_USAGE_INDEX
 from .commands.command_registry import registry
+from .commands.trends import DEFAULT_HISTORY_DB
 from .config.config_loader import ConfigError
+from .results_store import TREND_METRICS
 
 
 @click.group()
@@ -38,10 +41,16 @@ def cli():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["console", "json", "csv"]),
+    type=click.Choice(["console", "json", "csv", "columnar", "sarif", "html"]),
     default="console",
     help="Output format",
 )
+@click.option(
+    "--output-file",
+    "-f",
+    type=click.Path(dir_okay=False),
+    help="File to write file-based output formats such as columnar to",
+)
 @click.option(
     "--min-complexity",
     "-m",
@@ -54,25 +63,60 @@ def cli():
     multiple=True,
     help="Glob patterns to exclude",
 )
+@click.option(
+    "--max-rows",
+    type=click.IntRange(min=0),
+    help="Rows shown per console table, worst first (0 shows all)",
+)
+@click.option(
+    "--export-console",
+    type=click.Path(dir_okay=False),
+    help="Also save console output to this .html, .svg or text file",
+)
+@click.option(
+    "--usage-index",
+    type=click.Path(dir_okay=False),
+    help="Write the usage index queried by 'refs' to this file",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False),
+    help="Only report findings whose fingerprints are not in this baseline file",
+)
+@click.option(
+    "--update-baseline",
+    is_flag=True,
+    help="Write the fingerprints of all current findings to the baseline file",
+)
 @click.option(
     "--verbose",
     "-v",
     is_flag=True,
     help="Enable verbose output",
 )
-def analyze(paths, config, output, min_complexity, exclude, verbose):
+def analyze(paths, config, output, output_file, min_complexity, exclude, max_rows, export_console,
+            usage_index, baseline, update_baseline, verbose):
     """Analyze code complexity and quality."""
     error_console = Console(file=sys.stderr)
     
     try:
+        if update_baseline and not baseline:
+            raise click.UsageError("--update-baseline requires --baseline")
+
         # Create command instance with options
         cmd = registry.get_command(
             "analyze",
             config_path=config,
             verbose=verbose,
             output=output,
+            output_file=output_file,
             min_complexity=min_complexity,
-            exclude=exclude
+            exclude=exclude,
+            max_rows=max_rows,
+            export_console=export_console,
+            usage_index=usage_index,
+            baseline=baseline,
+            update_baseline=update_baseline
         )
         
         if not cmd:
@@ -92,5 +136,59 @@ def analyze(paths, config, output, min_complexity, exclude, verbose):
         raise click.Abort()
 
 
+@cli.command()
+@click.argument("name")
+@click.option(
+    "--index",
+    "-i",
+    "index_path",
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_USAGE_INDEX,
+    show_default=True,
+    help="Usage index written by 'analyze --usage-index'",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Choice(["console", "json"]),
+    default="console",
+    help="Output format",
+)
+def refs(name, index_path, output):
+    """List the places that use a symbol, e.g. 'package.module.Class.method'."""
+    cmd = registry.get_command("refs", index_path=index_path, output=output)
+    if not cmd:
+        raise click.ClickException("Refs command not found")
+    if cmd.run(name) != 0:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=DEFAULT_HISTORY_DB,
+    show_default=True,
+    help="Results history written by 'analyze' when reports.track_trends is set",
+)
+@click.option("--runs", "-n", type=int, default=10, show_default=True, help="Number of recent runs")
+@click.option("--limit", "-l", type=int, default=10, show_default=True, help="Functions to list")
+@click.option(
+    "--metric",
+    type=click.Choice(TREND_METRICS),
+    default="cyclomatic_complexity",
+    show_default=True,
+    help="Metric to compare",
+)
+def trends(db_path, runs, limit, metric):
+    """List the functions whose complexity grew most in recent runs."""
+    cmd = registry.get_command("trends", db_path=db_path, runs=runs, limit=limit, metric=metric)
+    if not cmd:
+        raise click.ClickException("Trends command not found")
+    if cmd.run() != 0:
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
     cli()
@@ -2,14 +2,23 @@
 Code analyzers for various metrics and patterns.
 """
 
+from .architecture import ArchitectureAnalyzer, DependencyGraph, ImportResolver
 from .base_analyzer import BaseAnalyzer
 from .complexity import ComplexityAnalyzer
 from .dead_code import DeadCodeAnalyzer
+from .file_loader import FileLoader, SourceFile
 from .similarity import SimilarityAnalyzer
+from .usage_index import UsageIndex
 
 __all__ = [
+    'ArchitectureAnalyzer',
     'BaseAnalyzer',
     'ComplexityAnalyzer',
     'DeadCodeAnalyzer',
+    'DependencyGraph',
+    'FileLoader',
+    'ImportResolver',
     'SimilarityAnalyzer',
+    'SourceFile',
+    'UsageIndex',
 ]
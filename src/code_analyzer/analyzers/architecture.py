@@ -0,0 +1,347 @@
+"""
+Architecture analyzer for module dependencies.
+Resolves imports to modules in the analyzed tree, builds a module
+dependency graph and reports import cycles and fan-in/fan-out metrics.
+"""
+
+import ast
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .base_analyzer import BaseAnalyzer
+from .file_loader import FileLoader
+
+
+class NodeType(Enum):
+    """Types of nodes in the dependency graph."""
+    MODULE = "module"
+    PACKAGE = "package"
+
+
+class ImportResolver:
+    """Maps dotted and relative imports to files in the analyzed tree.
+
+    Module names are derived from the package structure on disk: a file's
+    name is prefixed by every enclosing directory that has an ``__init__.py``.
+    """
+
+    def __init__(self, file_paths: List[Union[str, Path]]):
+        """Index the module names of the analyzed files.
+
+        Args:
+            file_paths: Paths of all analyzed files
+        """
+        self.modules: Dict[str, str] = {}
+        self.module_names: Dict[str, str] = {}
+        self.packages: Set[str] = set()
+        self._package_dirs: Dict[Path, bool] = {}
+
+        for file_path in file_paths:
+            self.add_file(file_path)
+
+    def add_file(self, file_path: Union[str, Path]):
+        """Index the module name of a file added to the analyzed tree."""
+        if str(file_path) in self.module_names:
+            return
+        name, is_package = self._module_name(Path(file_path))
+        if not name:
+            return
+        self.modules.setdefault(name, str(file_path))
+        self.module_names[str(file_path)] = name
+        if is_package:
+            self.packages.add(name)
+
+    def module_for(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Get the dotted module name of an analyzed file."""
+        return self.module_names.get(str(file_path))
+
+    def resolve(
+        self, importer: Union[str, Path], module: Optional[str], level: int = 0
+    ) -> Optional[str]:
+        """Turn a possibly relative import into an absolute dotted name.
+
+        Args:
+            importer: Path of the importing file
+            module: Module part of the import, ``None`` for ``from . import x``
+            level: Number of leading dots of a relative import
+
+        Returns:
+            The absolute module name, or ``None`` if a relative import
+            cannot be resolved from the importer's location
+        """
+        if not level:
+            return module
+        importer_name = self.module_for(importer)
+        if importer_name is None:
+            return None
+        parts = importer_name.split('.')
+        if importer_name not in self.packages:
+            parts = parts[:-1]
+        if level - 1 > len(parts):
+            return None
+        parts = parts[:len(parts) - (level - 1)]
+        if module:
+            parts.extend(module.split('.'))
+        return '.'.join(parts) or None
+
+    def find_module(self, name: Optional[str]) -> Optional[str]:
+        """Find the longest prefix of a dotted name that is an analyzed module."""
+        while name:
+            if name in self.modules:
+                return name
+            name = name.rpartition('.')[0]
+        return None
+
+    def resolve_from(self, importer: Union[str, Path], module: Optional[str], level: int,
+                     name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve one name of a ``from ... import name`` statement.
+
+        Returns:
+            ``(module, attribute)``: ``attribute`` is ``None`` when the name is
+            itself a submodule; ``module`` is ``None`` when the import does not
+            refer to the analyzed tree
+        """
+        base = self.resolve(importer, module, level)
+        if base is None:
+            return None, None
+        submodule = f"{base}.{name}"
+        if submodule in self.modules:
+            return submodule, None
+        if base in self.modules:
+            return base, name
+        return self.find_module(base), None
+
+    def imported_modules(self, importer: Union[str, Path], tree: ast.AST) -> List[str]:
+        """List the analyzed modules a parsed file imports, in source order."""
+        targets = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    target = self.find_module(alias.name)
+                    if target:
+                        targets.append(target)
+            elif isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name == '*':
+                        target = self.find_module(self.resolve(importer, node.module, node.level))
+                    else:
+                        target, _ = self.resolve_from(importer, node.module, node.level, alias.name)
+                    if target:
+                        targets.append(target)
+        return targets
+
+    def _module_name(self, path: Path) -> Tuple[str, bool]:
+        """Derive the dotted module name of a file and whether it is a package."""
+        is_package = path.stem == '__init__'
+        parts = [] if is_package else [path.stem]
+        directory = path.parent
+        while self._is_package_dir(directory):
+            parts.append(directory.name)
+            if directory.parent == directory:
+                break
+            directory = directory.parent
+        return '.'.join(reversed(parts)), is_package
+
+    def _is_package_dir(self, directory: Path) -> bool:
+        """Check, with caching, if a directory contains an ``__init__.py``."""
+        is_package = self._package_dirs.get(directory)
+        if is_package is None:
+            is_package = (directory / '__init__.py').is_file()
+            self._package_dirs[directory] = is_package
+        return is_package
+
+
+@dataclass
+class DependencyNode:
+    """A module in the dependency graph."""
+    name: str
+    type: NodeType
+    file_path: Optional[str] = None
+    dependencies: Set[str] = field(default_factory=set)
+    dependents: Set[str] = field(default_factory=set)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+class DependencyGraph:
+    """Directed graph of module dependencies.
+
+    Nodes are also numbered densely so cycle detection can run over integer
+    adjacency lists.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, DependencyNode] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._adjacency: List[List[int]] = []
+
+    def add_node(self, name: str, node_type: NodeType = NodeType.MODULE,
+                 file_path: Optional[str] = None) -> DependencyNode:
+        """Add a module, or return it if it is already in the graph."""
+        node = self.nodes.get(name)
+        if node is None:
+            node = DependencyNode(name=name, type=node_type, file_path=file_path)
+            self.nodes[name] = node
+            self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._adjacency.append([])
+        return node
+
+    def add_dependency(self, source: str, target: str):
+        """Record that module ``source`` imports module ``target``."""
+        if source == target:
+            return
+        source_node = self.add_node(source)
+        target_node = self.add_node(target)
+        if target in source_node.dependencies:
+            return
+        source_node.dependencies.add(target)
+        target_node.dependents.add(source)
+        self._adjacency[self._ids[source]].append(self._ids[target])
+
+    def find_cycles(self) -> List[List[str]]:
+        """Find import cycles as the non-trivial strongly connected components.
+
+        Uses Tarjan's algorithm with an explicit stack, so deep import
+        chains cannot exceed the recursion limit, in O(V+E).
+
+        Returns:
+            Each cycle as a sorted list of module names, largest first
+        """
+        adjacency = self._adjacency
+        count = len(adjacency)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = bytearray(count)
+        stack: List[int] = []
+        cycles: List[List[str]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, 0)]
+
+            while work:
+                vertex, edge = work[-1]
+                edges = adjacency[vertex]
+                if edge < len(edges):
+                    work[-1] = (vertex, edge + 1)
+                    target = edges[edge]
+                    if index[target] == -1:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        work.append((target, 0))
+                    elif on_stack[target] and index[target] < low[vertex]:
+                        low[vertex] = index[target]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[vertex] < low[parent]:
+                        low[parent] = low[vertex]
+                if low[vertex] != index[vertex]:
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(self._names[member])
+                    if member == vertex:
+                        break
+                if len(component) > 1:
+                    cycles.append(sorted(component))
+
+        cycles.sort(key=lambda cycle: (-len(cycle), cycle))
+        return cycles
+
+    def calculate_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Calculate fan-in, fan-out and instability of every module.
+
+        Instability is ``fan_out / (fan_in + fan_out)``: 0 for modules that
+        only others depend on, 1 for modules nothing depends on.
+        """
+        metrics = {}
+        for name, node in self.nodes.items():
+            fan_in = len(node.dependents)
+            fan_out = len(node.dependencies)
+            total = fan_in + fan_out
+            node.metrics = {
+                'fan_in': fan_in,
+                'fan_out': fan_out,
+                'instability': round(fan_out / total, 4) if total else 0.0
+            }
+            metrics[name] = node.metrics
+        return metrics
+
+
+class ArchitectureAnalyzer(BaseAnalyzer):
+    """Analyzer for module dependencies and import cycles."""
+
+    def __init__(self, config: Dict[str, Any], file_loader: Optional[FileLoader] = None):
+        """Initialize the analyzer.
+
+        Args:
+            config: Configuration dictionary
+            file_loader: Optional file loader shared with other analyzers
+        """
+        super().__init__(config, file_loader)
+        self.graph = DependencyGraph()
+        self.resolver: Optional[ImportResolver] = None
+
+    def analyze(self, file_paths: List[Path]) -> Dict[str, Any]:
+        """Analyze the import structure of files.
+
+        Args:
+            file_paths: List of paths to analyze
+
+        Returns:
+            Dict containing dependency cycles and per-module metrics
+        """
+        file_paths = [path for path in file_paths if not self.should_ignore_file(path)]
+        self.resolver = ImportResolver(file_paths)
+        self.graph = DependencyGraph()
+
+        for file_path in file_paths:
+            module = self.resolver.module_for(file_path)
+            if module is None:
+                continue
+            node_type = NodeType.PACKAGE if module in self.resolver.packages else NodeType.MODULE
+            self.graph.add_node(module, node_type, str(file_path))
+
+        for file_path in file_paths:
+            module = self.resolver.module_for(file_path)
+            if module is None:
+                continue
+            try:
+                tree = ast.parse(self.file_loader.load(file_path).text)
+            except Exception as e:
+                self._log_error(f"Error parsing {file_path}: {str(e)}")
+                continue
+            for target in self.resolver.imported_modules(file_path, tree):
+                self.graph.add_dependency(module, target)
+
+        metrics = self.graph.calculate_metrics()
+        return {
+            'dependency_cycles': [
+                {
+                    'modules': cycle,
+                    'severity': 'high' if len(cycle) > 2 else 'medium'
+                }
+                for cycle in self.graph.find_cycles()
+                if self.baseline is None or self.baseline.is_new_cycle(cycle)
+            ],
+            'module_metrics': {
+                name: {'file': self.graph.nodes[name].file_path, **values}
+                for name, values in metrics.items()
+            }
+        }
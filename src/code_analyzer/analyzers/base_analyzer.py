@@ -8,15 +8,19 @@ from typing import Any, Dict, Optional
 
 from rich.console import Console
 
+from .file_loader import FileLoader
+
 
 class BaseAnalyzer:
     """Base class for code analyzers."""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 file_loader: Optional[FileLoader] = None):
         """Initialize the analyzer.
         
         Args:
             config: Optional configuration dictionary
+            file_loader: Optional file loader shared with other analyzers
         """
         self.config = config or {
             "analysis": {
@@ -29,6 +33,9 @@ class BaseAnalyzer:
             }
         }
         self.error_console = Console(file=sys.stderr)
+        self.file_loader = file_loader or FileLoader()
+        # Baseline of known findings to leave out, set by the analyze command
+        self.baseline = None
 
     def _log_error(self, message: str) -> None:
         """Log an error message.
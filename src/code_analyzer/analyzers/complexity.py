@@ -4,114 +4,333 @@ Combines cyclomatic complexity, cognitive complexity, and maintainability metric
 """
 
 import ast
-import math
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..metrics.complexity import OPERATOR_IDS, HalsteadCounts, OperandTable, maintainability_index
 from .base_analyzer import BaseAnalyzer
+from .file_loader import FileLoader
 
 
-class ComplexityVisitor(ast.NodeVisitor):
-    """AST visitor for calculating code complexity metrics."""
+# Stack entry contexts: an ``if`` that is the ``elif`` of its parent, a
+# ``_ClassBody`` for statements directly in a class body, or, for boolean
+# operations, the operator type of the enclosing boolean operation
+_ELIF = "elif"
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_LOOP_TYPES = (ast.For, ast.AsyncFor, ast.While)
+_TRY_TYPES = tuple(getattr(ast, name) for name in ("Try", "TryStar") if hasattr(ast, name))
+_MATCH_TYPES = (ast.Match,) if hasattr(ast, "Match") else ()
+
+
+class _ClassBody:
+    """Context of the statements directly in a class body."""
+
+    __slots__ = ("qualname",)
+
+    def __init__(self, qualname: str):
+        self.qualname = qualname
+
+
+class _FunctionScope:
+    """Metrics of one function while its body is traversed."""
+
+    __slots__ = ("name", "qualname", "parent", "offset", "is_method", "record",
+                 "cyclomatic", "cognitive", "halstead", "recursive")
+
+    def __init__(self, name: str, qualname: str, parent: Optional['_FunctionScope'], offset: int,
+                 is_method: bool, record: Dict[str, Any]):
+        self.name = name
+        self.qualname = qualname
+        self.parent = parent
+        # Nesting the function's own level adds in its enclosing function
+        self.offset = offset
+        self.is_method = is_method
+        self.record = record
+        self.cyclomatic = 1  # Base complexity
+        self.cognitive = 0
+        self.halstead = HalsteadCounts()
+        self.recursive = False
+
+
+class ComplexityVisitor:
+    """Computes complexity metrics of a module in one iterative traversal.
+
+    Cognitive complexity follows the SonarSource specification: ``if``,
+    conditional expressions, loops, ``except`` and ``match`` add one plus
+    their nesting level; ``elif``, ``else``, each sequence of like boolean
+    operators and recursion add one. Nested functions and lambdas raise the
+    nesting level, and increments inside a nested function also count for
+    the functions enclosing it.
+
+    Nodes are taken from an explicit stack of ``(node, nesting, function,
+    context)`` entries instead of recursive ``generic_visit`` calls, in no
+    particular order since every metric is a sum.
+    Halstead operators and operands are counted in the same traversal, for
+    the whole file and for the innermost function they appear in.
+    """
 
     def __init__(self):
         self.cyclomatic_complexity = 0
         self.cognitive_complexity = 0
-        self.functions = []
-        self.current_function = None
-        self.nesting_level = 0
+        self.functions: List[Dict[str, Any]] = []
         self.loc = 0
+        self.operands = OperandTable()
+        self.halstead = HalsteadCounts()
+        self._scopes: List[_FunctionScope] = []
+        self._handlers = {ast.If: self._visit_if, ast.ExceptHandler: self._visit_except_handler,
+                          ast.IfExp: self._visit_if_exp, ast.BoolOp: self._visit_bool_op,
+                          ast.Lambda: self._visit_lambda, ast.ClassDef: self._visit_class,
+                          ast.Call: self._visit_call, ast.BinOp: self._visit_operator,
+                          ast.UnaryOp: self._visit_operator, ast.AugAssign: self._visit_operator,
+                          ast.Compare: self._visit_compare}
+        for node_type in _FUNCTION_TYPES:
+            self._handlers[node_type] = self._visit_function
+        for node_type in _LOOP_TYPES:
+            self._handlers[node_type] = self._visit_loop
+        for node_type in _TRY_TYPES:
+            self._handlers[node_type] = self._visit_try
+        for node_type in _MATCH_TYPES:
+            self._handlers[node_type] = self._visit_match
 
-    def visit_FunctionDef(self, node):
-        """Visit function definition."""
-        old_function = self.current_function
-        old_complexity = self.cyclomatic_complexity
-        old_cognitive = self.cognitive_complexity
-        old_nesting = self.nesting_level
-        
-        # Create function metrics
-        self.current_function = {
+    def visit(self, tree: ast.AST) -> None:
+        """Traverse a module and fill in ``functions`` and the file totals."""
+        stack = [(tree, 0, None, None)]
+        pop = stack.pop
+        push = stack.append
+        handlers = self._handlers
+        operands = self.operands.ids
+        file_halstead = self.halstead
+        AST, Name, Constant = ast.AST, ast.Name, ast.Constant
+        while stack:
+            node, nesting, scope, context = pop()
+            kind = type(node)
+            # Names and constants are most of the nodes, so count them inline
+            if kind is Name:
+                operand_id = operands.setdefault(node.id, len(operands))
+            elif kind is Constant:
+                operand_id = self.operands.constant(node.value)
+            else:
+                handler = handlers.get(kind)
+                if handler is not None:
+                    handler(stack, node, nesting, scope, context)
+                    continue
+                for field in node._fields:
+                    value = getattr(node, field, None)
+                    if type(value) is list:
+                        for item in value:
+                            if isinstance(item, AST):
+                                push((item, nesting, scope, None))
+                    elif isinstance(value, AST) and field != "ctx":
+                        push((value, nesting, scope, None))
+                continue
+            file_halstead.add_operand(operand_id)
+            if scope is not None:
+                scope.halstead.add_operand(operand_id)
+
+        # Functions are reached in stack order; report them in source order
+        self._scopes.sort(key=lambda function: function.record['line'])
+        for scope in self._scopes:
+            halstead = scope.halstead.metrics()
+            record = scope.record
+            record['cyclomatic_complexity'] = scope.cyclomatic
+            record['cognitive_complexity'] = scope.cognitive
+            record['halstead'] = halstead
+            record['maintainability_index'] = maintainability_index(
+                halstead['volume'], scope.cyclomatic, record['loc']
+            )
+            self.functions.append(record)
+            if scope.parent is None:
+                self.cognitive_complexity += scope.cognitive
+
+    @staticmethod
+    def _push_fields(stack: list, node: ast.AST, nesting: int, scope: Optional[_FunctionScope],
+                     skip: Tuple[str, ...] = ()) -> None:
+        """Push the child nodes of a node, except those in the ``skip`` fields."""
+        push = stack.append
+        for field in node._fields:
+            if field in skip:
+                continue
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        push((item, nesting, scope, None))
+            elif isinstance(value, ast.AST) and field != "ctx":
+                push((value, nesting, scope, None))
+
+    @staticmethod
+    def _push_body(stack: list, body: List[ast.AST], nesting: int,
+                   scope: Optional[_FunctionScope], context: Any = None) -> None:
+        """Push a statement list."""
+        stack.extend([(statement, nesting, scope, context) for statement in body])
+
+    def _add_cyclomatic(self, scope: Optional[_FunctionScope], amount: int = 1) -> None:
+        """Add decision points to the current function, or to the module."""
+        if scope is None:
+            self.cyclomatic_complexity += amount
+        else:
+            scope.cyclomatic += amount
+
+    @staticmethod
+    def _add_structural(scope: Optional[_FunctionScope], nesting: int) -> None:
+        """Add one plus the nesting level to the function and the functions enclosing it."""
+        while scope is not None:
+            scope.cognitive += 1 + nesting
+            nesting += scope.offset
+            scope = scope.parent
+
+    @staticmethod
+    def _add_hybrid(scope: Optional[_FunctionScope]) -> None:
+        """Add one, regardless of nesting, to the function and the functions enclosing it."""
+        while scope is not None:
+            scope.cognitive += 1
+            scope = scope.parent
+
+    def _visit_function(self, stack, node, nesting, scope, context):
+        """Start a function scope; its body starts again at nesting level zero."""
+        qualname = self._qualname(node.name, scope, context)
+        record = {
             'name': node.name,
-            'cyclomatic_complexity': 1,  # Base complexity
+            'qualname': qualname,
+            'cyclomatic_complexity': 1,
             'cognitive_complexity': 0,
             'loc': len(node.body),
             'line': node.lineno,
             'end_line': node.end_lineno or node.lineno
         }
-        self.cyclomatic_complexity = 1
-        self.cognitive_complexity = 0
-        self.nesting_level = 0
-        
-        # Visit function body
-        self.generic_visit(node)
-        
-        # Update function metrics
-        self.current_function['cyclomatic_complexity'] = self.cyclomatic_complexity
-        self.current_function['cognitive_complexity'] = self.cognitive_complexity
-        self.functions.append(self.current_function)
-        
-        # Update total LOC
+        function = _FunctionScope(node.name, qualname, scope, nesting + 1,
+                                  type(context) is _ClassBody, record)
+        self._scopes.append(function)
         self.loc += len(node.body)
-        
-        # Restore state
-        self.current_function = old_function
-        self.cyclomatic_complexity = old_complexity
-        self.cognitive_complexity = old_cognitive
-        self.nesting_level = old_nesting
-
-    def visit_If(self, node):
-        """Visit if statement."""
-        self.cyclomatic_complexity += 1
-        self.cognitive_complexity += (1 + self.nesting_level)
-        self.nesting_level += 1
-        self.generic_visit(node)
-        self.nesting_level -= 1
-
-    def visit_While(self, node):
-        """Visit while loop."""
-        self.cyclomatic_complexity += 1
-        self.cognitive_complexity += (2 + self.nesting_level)  # Loops are more complex
-        self.nesting_level += 1
-        self.generic_visit(node)
-        self.nesting_level -= 1
-
-    def visit_For(self, node):
-        """Visit for loop."""
-        self.cyclomatic_complexity += 1
-        self.cognitive_complexity += (2 + self.nesting_level)  # Loops are more complex
-        self.nesting_level += 1
-        self.generic_visit(node)
-        self.nesting_level -= 1
-
-    def visit_Try(self, node):
-        """Visit try block."""
-        self.cyclomatic_complexity += len(node.handlers) + len(node.finalbody)
-        self.cognitive_complexity += 1  # Error handling complexity
-        self.generic_visit(node)
-
-    def visit_ExceptHandler(self, node):
+        self._push_fields(stack, node, 0, function)
+
+    def _visit_class(self, stack, node, nesting, scope, context):
+        """Visit class definition, marking its methods."""
+        body = _ClassBody(self._qualname(node.name, scope, context))
+        self._push_body(stack, node.body, nesting, scope, body)
+        self._push_fields(stack, node, nesting, scope, skip=("body",))
+
+    @staticmethod
+    def _qualname(name: str, scope: Optional[_FunctionScope], context: Any) -> str:
+        """Qualified name of a definition, as in ``__qualname__``."""
+        if type(context) is _ClassBody:
+            return f"{context.qualname}.{name}"
+        if scope is not None:
+            return f"{scope.qualname}.<locals>.{name}"
+        return name
+
+    def _visit_if(self, stack, node, nesting, scope, context):
+        """Visit if statement, following its elif chain at the same level."""
+        self._add_cyclomatic(scope)
+        if context == _ELIF:
+            self._add_hybrid(scope)
+        else:
+            self._add_structural(scope, nesting)
+        orelse = node.orelse
+        if (len(orelse) == 1 and type(orelse[0]) is ast.If
+                and orelse[0].col_offset == node.col_offset and orelse[0].lineno != node.lineno):
+            stack.append((orelse[0], nesting, scope, _ELIF))
+        elif orelse:
+            self._add_hybrid(scope)
+            self._push_body(stack, orelse, nesting + 1, scope)
+        self._push_body(stack, node.body, nesting + 1, scope)
+        stack.append((node.test, nesting, scope, None))
+
+    def _visit_loop(self, stack, node, nesting, scope, context):
+        """Visit for, async for or while loop and its else clause."""
+        self._add_cyclomatic(scope)
+        self._add_structural(scope, nesting)
+        if node.orelse:
+            self._add_hybrid(scope)
+            self._push_body(stack, node.orelse, nesting + 1, scope)
+        self._push_body(stack, node.body, nesting + 1, scope)
+        self._push_fields(stack, node, nesting, scope, skip=("body", "orelse"))
+
+    def _visit_try(self, stack, node, nesting, scope, context):
+        """Visit try block; its handlers add the complexity."""
+        self._add_cyclomatic(scope, len(node.handlers) + len(node.finalbody))
+        if node.orelse:
+            self._add_hybrid(scope)
+        self._push_fields(stack, node, nesting, scope)
+
+    def _visit_except_handler(self, stack, node, nesting, scope, context):
         """Visit except handler."""
-        self.cyclomatic_complexity += 1
-        self.cognitive_complexity += 1
-        self.generic_visit(node)
+        self._add_cyclomatic(scope)
+        self._add_structural(scope, nesting)
+        self._push_body(stack, node.body, nesting + 1, scope)
+        self._push_fields(stack, node, nesting, scope, skip=("body",))
+
+    def _visit_match(self, stack, node, nesting, scope, context):
+        """Visit match statement; its cases are nested."""
+        self._add_structural(scope, nesting)
+        self._push_body(stack, node.cases, nesting + 1, scope)
+        stack.append((node.subject, nesting, scope, None))
+
+    def _visit_if_exp(self, stack, node, nesting, scope, context):
+        """Visit conditional expression."""
+        self._add_structural(scope, nesting)
+        self._push_fields(stack, node, nesting + 1, scope)
 
-    def visit_BoolOp(self, node):
-        """Visit boolean operation."""
-        self.cyclomatic_complexity += len(node.values) - 1
-        self.cognitive_complexity += (len(node.values) - 1)  # Each boolean operation adds complexity
-        self.generic_visit(node)
+    def _visit_bool_op(self, stack, node, nesting, scope, context):
+        """Visit boolean operation; a run of the same operator counts once."""
+        self._add_cyclomatic(scope, len(node.values) - 1)
+        operator = type(node.op)
+        if context is not operator:
+            self._add_hybrid(scope)
+        self._add_operator(node.op, scope)
+        stack.extend([(value, nesting, scope, operator) for value in node.values])
+
+    def _visit_lambda(self, stack, node, nesting, scope, context):
+        """Visit lambda; its body is nested."""
+        self._push_fields(stack, node, nesting + 1, scope)
+
+    def _visit_call(self, stack, node, nesting, scope, context):
+        """Visit call, counting a function that calls itself once."""
+        if scope is not None and not scope.recursive:
+            func = node.func
+            if type(func) is ast.Name:
+                recursive = func.id == scope.name
+            elif type(func) is ast.Attribute and type(func.value) is ast.Name:
+                recursive = (scope.is_method and func.attr == scope.name
+                             and func.value.id in ("self", "cls"))
+            else:
+                recursive = False
+            if recursive:
+                scope.recursive = True
+                self._add_hybrid(scope)
+        self._push_fields(stack, node, nesting, scope)
+
+    def _visit_operator(self, stack, node, nesting, scope, context):
+        """Visit binary, unary or augmented assignment operation."""
+        self._add_operator(node.op, scope)
+        self._push_fields(stack, node, nesting, scope)
+
+    def _visit_compare(self, stack, node, nesting, scope, context):
+        """Visit comparison."""
+        for op in node.ops:
+            self._add_operator(op, scope)
+        self._push_fields(stack, node, nesting, scope)
+
+    def _add_operator(self, op: ast.AST, scope: Optional[_FunctionScope]):
+        """Count an operator in the file and the current function."""
+        operator_id = OPERATOR_IDS[type(op)]
+        self.halstead.add_operator(operator_id)
+        if scope is not None:
+            scope.halstead.add_operator(operator_id)
 
 
 class ComplexityAnalyzer(BaseAnalyzer):
     """Analyzer for code complexity metrics."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], file_loader: Optional[FileLoader] = None):
         """Initialize the analyzer.
         
         Args:
             config: Configuration dictionary
+            file_loader: Optional file loader shared with other analyzers
         """
-        super().__init__(config)
+        super().__init__(config, file_loader)
         self.metrics = self._create_empty_metrics()
 
     def analyze(self, file_path: Path) -> Dict[str, Any]:
@@ -127,8 +346,7 @@ class ComplexityAnalyzer(BaseAnalyzer):
             return self._create_empty_metrics()
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.file_loader.load(file_path).text
         except Exception as e:
             return {
                 'file_path': str(file_path),
@@ -147,19 +365,23 @@ class ComplexityAnalyzer(BaseAnalyzer):
 
             # Calculate metrics
             total_cyclomatic = sum(f['cyclomatic_complexity'] for f in visitor.functions)
-            total_cognitive = sum(f['cognitive_complexity'] for f in visitor.functions)
+            # Nested functions are part of the cognitive complexity of their parents
+            total_cognitive = visitor.cognitive_complexity
             total_functions = len(visitor.functions)
             
             avg_cyclomatic = total_cyclomatic / total_functions if total_functions > 0 else 0
             avg_cognitive = total_cognitive / total_functions if total_functions > 0 else 0
             
-            mi = self._calculate_maintainability_index(content, total_cyclomatic, visitor.loc)
+            halstead = visitor.halstead.metrics()
+            self._mark_baselined(file_path, visitor.functions)
+            mi = maintainability_index(halstead['volume'], total_cyclomatic, visitor.loc)
 
             return {
                 'file_path': str(file_path),
                 'cyclomatic_complexity': total_cyclomatic,
                 'cognitive_complexity': total_cognitive,
                 'maintainability_index': mi,
+                'halstead': halstead,
                 'functions': visitor.functions,
                 'total_functions': total_functions,
                 'average_cyclomatic': avg_cyclomatic,
@@ -178,6 +400,21 @@ class ComplexityAnalyzer(BaseAnalyzer):
                 'total_functions': 0
             }
 
+    def _mark_baselined(self, file_path: Path, functions: List[Dict[str, Any]]) -> None:
+        """Mark the functions at or above ``min_complexity`` that are baselined.
+
+        Only those functions are findings, so only they are fingerprinted.
+        Marked functions keep their metrics; formatters leave them out only
+        where complexity findings are reported.
+        """
+        if self.baseline is None:
+            return
+        threshold = self.config.get("analysis", {}).get("min_complexity", 10)
+        for function in functions:
+            complexity = max(function['cyclomatic_complexity'], function['cognitive_complexity'])
+            if complexity >= threshold and not self.baseline.is_new_function(file_path, function):
+                function['baselined'] = True
+
     def _create_empty_metrics(self) -> Dict[str, Any]:
         """Create empty metrics dictionary."""
         return {
@@ -191,35 +428,3 @@ class ComplexityAnalyzer(BaseAnalyzer):
             'average_cognitive': 0,
             'loc': 0
         }
-
-    def _calculate_maintainability_index(self, content: str, complexity: int, loc: int) -> float:
-        """Calculate maintainability index using the Microsoft formula.
-        
-        MI = max(0, (171 - 5.2 * ln(HV) - 0.23 * CC - 16.2 * ln(LOC)) * 100 / 171)
-        
-        Args:
-            content: File content
-            complexity: Cyclomatic complexity
-            loc: Lines of code
-            
-        Returns:
-            float: Maintainability index between 0 and 100
-        """
-        if loc == 0:
-            return 100.0
-            
-        # Calculate Halstead Volume (simplified)
-        h_length = len(content.split())
-        h_volume = h_length * (len(set(content.split())))
-        
-        # Avoid log(0)
-        if h_volume == 0:
-            h_volume = 1
-        if loc == 0:
-            loc = 1
-            
-        # Calculate maintainability index
-        mi = 171 - 5.2 * math.log(h_volume) - 0.23 * complexity - 16.2 * math.log(loc)
-        mi = max(0, mi) * 100 / 171
-        
-        return round(mi, 2) 
\ No newline at end of file
@@ -1,15 +1,32 @@
 """
 Dead code analyzer for detecting unused code elements.
-Tracks symbols and their usage across Python files.
+Builds a reference graph over symbols in all analyzed files and reports
+symbols that cannot be reached from any entry point.
 """
 
 import ast
+import configparser
+import fnmatch
+import multiprocessing
+import os
+import pickle
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any, Union
 
+from .architecture import ImportResolver
 from .base_analyzer import BaseAnalyzer
+from .file_loader import FileLoader
+from .usage_index import IndexedSymbol, ReferenceSite, UsageIndex
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 
 class SymbolType(Enum):
@@ -37,8 +54,10 @@ class Symbol:
     is_override: bool = False
     docstring: Optional[str] = None
     decorators: List[str] = field(default_factory=list)
-    used_by: Set['Symbol'] = field(default_factory=set)
-    uses: Set['Symbol'] = field(default_factory=set)
+    bases: List[str] = field(default_factory=list)
+    imported_name: Optional[str] = None
+    import_module: Optional[str] = None
+    import_level: int = 0
     
     def __hash__(self):
         return hash((self.name, self.type, self.file_path, self.line))
@@ -52,8 +71,176 @@ class Symbol:
                 self.line == other.line)
 
 
+@dataclass
+class FileEntry:
+    """Everything the symbol table holds on behalf of one file.
+
+    Each file owns its module vertex, its symbols, the edges leaving them and
+    the edges from shared name vertices to them, so the whole entry can be
+    removed without touching other files.
+    """
+    module_vertex: int
+    symbol_ids: List[int] = field(default_factory=list)
+    edges: List[Tuple[int, int]] = field(default_factory=list)
+    roots: List[int] = field(default_factory=list)
+    has_star_import: bool = False
+    members_linked: bool = False
+    attribute_accesses: Dict[str, List[int]] = field(default_factory=dict)
+
+
+# A class is identified by the file it is bound in and its qualified name
+ClassKey = Tuple[str, str]
+
+
+@dataclass
+class ClassInfo:
+    """A class definition in the class hierarchy index."""
+    symbol_id: int
+    bases: List[Optional[ClassKey]]
+    methods: Dict[str, int]
+
+
+class ClassHierarchy:
+    """Index of class definitions and their bases across modules.
+
+    Bases are recorded as ``(file, name)`` keys as seen from the subclass's
+    file. A key may name an import rather than a class; aliases recorded for
+    resolved ``from ... import`` statements lead from there to the module
+    that defines the class. Resolved MROs are cached until a file changes.
+    """
+
+    def __init__(self):
+        self.classes: Dict[ClassKey, ClassInfo] = {}
+        self.aliases: Dict[str, Dict[str, ClassKey]] = {}
+        self.file_classes: Dict[str, List[ClassKey]] = {}
+        self._mro_cache: Dict[ClassKey, List[ClassKey]] = {}
+        self._subclass_cache: Optional[Dict[ClassKey, List[ClassKey]]] = None
+
+    def add_class(self, key: ClassKey, info: ClassInfo):
+        """Add a class defined in file ``key[0]``."""
+        self.classes[key] = info
+        self.file_classes.setdefault(key[0], []).append(key)
+        self._invalidate()
+
+    def add_alias(self, file_path: str, name: str, target: ClassKey):
+        """Record that ``name`` in a file is imported from ``target``."""
+        self.aliases.setdefault(file_path, {})[name] = target
+        self._invalidate()
+
+    def remove_file(self, file_path: str):
+        """Drop every class and alias recorded for a file."""
+        for key in self.file_classes.pop(file_path, []):
+            del self.classes[key]
+        self.aliases.pop(file_path, None)
+        self._invalidate()
+
+    def resolve(self, key: Optional[ClassKey]) -> Optional[ClassKey]:
+        """Follow import aliases from a key to the class definition, if any."""
+        seen = set()
+        while key is not None and key not in self.classes:
+            if key in seen:
+                return None
+            seen.add(key)
+            key = self.aliases.get(key[0], {}).get(key[1])
+        return key
+
+    def mro(self, key: ClassKey) -> List[ClassKey]:
+        """C3 linearization of a class over the bases that could be resolved."""
+        key = self.resolve(key)
+        if key is None:
+            return []
+        cached = self._mro_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Linearize bases before their subclasses without recursion
+        pending = [key]
+        in_progress = set()
+        while pending:
+            current = pending[-1]
+            if current in self._mro_cache:
+                pending.pop()
+                continue
+            bases = self._resolved_bases(current)
+            missing = [base for base in bases if base not in self._mro_cache]
+            if missing and current not in in_progress:
+                in_progress.add(current)
+                pending.extend(base for base in missing if base not in in_progress)
+                continue
+            pending.pop()
+            self._mro_cache[current] = [current] + self._merge(
+                [self._mro_cache.get(base, [base]) for base in bases] + [bases]
+            )
+        return self._mro_cache[key]
+
+    def find_method(self, key: ClassKey, name: str) -> Optional[int]:
+        """Look a method up along the MRO, returning the symbol ID that defines it."""
+        for class_key in self.mro(key):
+            method = self.classes[class_key].methods.get(name)
+            if method is not None:
+                return method
+        return None
+
+    def subclasses(self, key: ClassKey) -> List[ClassKey]:
+        """Direct subclasses of a class among the analyzed files."""
+        if self._subclass_cache is None:
+            index: Dict[ClassKey, List[ClassKey]] = {}
+            for class_key in self.classes:
+                for base in self._resolved_bases(class_key):
+                    index.setdefault(base, []).append(class_key)
+            self._subclass_cache = index
+        return self._subclass_cache.get(self.resolve(key), [])
+
+    def _resolved_bases(self, key: ClassKey) -> List[ClassKey]:
+        """Bases of a class that resolve to analyzed classes."""
+        resolved = []
+        for base in self.classes[key].bases:
+            base = self.resolve(base)
+            if base is not None and base != key and base not in resolved:
+                resolved.append(base)
+        return resolved
+
+    @staticmethod
+    def _merge(sequences: List[List[ClassKey]]) -> List[ClassKey]:
+        """C3 merge; inconsistent hierarchies fall back to first-come order."""
+        sequences = [list(sequence) for sequence in sequences if sequence]
+        result = []
+        while sequences:
+            for sequence in sequences:
+                head = sequence[0]
+                if not any(head in other[1:] for other in sequences):
+                    break
+            else:
+                head = sequences[0][0]
+            if head not in result:
+                result.append(head)
+            sequences = [
+                [item for item in sequence if item != head] for sequence in sequences
+            ]
+            sequences = [sequence for sequence in sequences if sequence]
+        return result
+
+    def _invalidate(self):
+        """Forget cached MROs and subclass lists."""
+        self._mro_cache.clear()
+        self._subclass_cache = None
+
+
 class SymbolTable:
-    """Tracks symbols and their relationships."""
+    """Tracks symbols and their relationships, keyed by file.
+
+    Symbols, module vertices and name vertices share one integer ID space,
+    which is also the vertex space of the reference graph. References never
+    point at another file's symbols directly: they point at name vertices
+    (``global``, ``attr`` and ``export``), and the file defining a symbol owns
+    the edges from those name vertices to it. Replacing a file is therefore
+    local to that file's symbols and references.
+
+    Members of classes get ``member`` vertices keyed by the class's file and
+    name. A member vertex leads to the method the class defines, or else to
+    the same member of each base; the member of a base leads on to every
+    override in a subclass, so using a base method keeps its overrides alive.
+    """
     
     def __init__(self):
         self.symbols: Dict[str, Symbol] = {}
@@ -61,35 +248,596 @@ class SymbolTable:
         self.current_class: Optional[Symbol] = None
         self.current_function: Optional[Symbol] = None
         self.scope_stack: List[Symbol] = []
+        self.graph = ReferenceGraph()
+        self.by_id: List[Optional[Symbol]] = []
+        self.ids: Dict[str, int] = {}
+        self.files: Dict[str, FileEntry] = {}
+        self.file_names: Dict[str, Dict[str, List[int]]] = {}
+        self.name_vertices: Dict[Tuple[str, str], int] = {}
+        self.export_vertices: Dict[str, Dict[str, int]] = {}
+        self.member_vertices: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.hierarchy = ClassHierarchy()
+        self.attribute_files: Dict[str, Set[str]] = {}
+
+    def begin_file(self, file_path: str) -> FileEntry:
+        """Start (re)indexing a file, dropping whatever it contributed before."""
+        self.remove_file(file_path)
+        entry = FileEntry(module_vertex=self._new_vertex(None))
+        self.files[file_path] = entry
+        self.file_symbols[file_path] = []
+        self.file_names[file_path] = {}
+        # Module-level code runs on import, so the module is always live
+        self.add_root(file_path, entry.module_vertex)
+        return entry
+
+    def remove_file(self, file_path: str):
+        """Remove a file's symbols, references and roots from the table."""
+        entry = self.files.pop(file_path, None)
+        if entry is None:
+            return
+        self.graph.detach(entry.edges, entry.roots)
+        self.hierarchy.remove_file(file_path)
+        for name in entry.attribute_accesses:
+            files = self.attribute_files[name]
+            files.discard(file_path)
+            if not files:
+                del self.attribute_files[name]
+        for symbol_id in entry.symbol_ids:
+            symbol = self.by_id[symbol_id]
+            key = f"{symbol.file_path}:{symbol.line}:{symbol.name}"
+            del self.symbols[key]
+            del self.ids[key]
+            self._free_vertex(symbol_id)
+        self._free_vertex(entry.module_vertex)
+        del self.file_symbols[file_path]
+        del self.file_names[file_path]
     
-    def add_symbol(self, symbol: Symbol):
-        """Add a symbol to the table."""
+    def add_symbol(self, symbol: Symbol) -> int:
+        """Add a symbol to the table and return its ID."""
         key = f"{symbol.file_path}:{symbol.line}:{symbol.name}"
+        if key in self.ids:
+            return self.ids[key]
+        entry = self.files.get(symbol.file_path) or self.begin_file(symbol.file_path)
         self.symbols[key] = symbol
-        
-        if symbol.file_path not in self.file_symbols:
-            self.file_symbols[symbol.file_path] = []
         self.file_symbols[symbol.file_path].append(symbol)
+
+        symbol_id = self._new_vertex(symbol)
+        self.ids[key] = symbol_id
+        entry.symbol_ids.append(symbol_id)
+
+        if symbol.type == SymbolType.IMPORT:
+            # "import os.path" binds the name "os"
+            bound_name = symbol.name.split('.')[0]
+        else:
+            bound_name = symbol.name
+        if symbol.type == SymbolType.METHOD or symbol.parent is not None:
+            # Only class members can be read as an attribute of an unknown
+            # object; module attributes are resolved through the import
+            self.add_edge(symbol.file_path, self.attribute_vertex(symbol.name), symbol_id)
+        if symbol.type not in (SymbolType.IMPORT, SymbolType.METHOD):
+            self.add_edge(symbol.file_path, self.global_vertex(symbol.name), symbol_id)
+        if symbol.type != SymbolType.METHOD:
+            self.file_names[symbol.file_path].setdefault(bound_name, []).append(symbol_id)
+            self.add_edge(
+                symbol.file_path, self.export_vertex(symbol.file_path, bound_name), symbol_id
+            )
+        return symbol_id
+
+    def mark_star_import(self, file_path: str):
+        """Record that a file re-exports names it does not define itself.
+
+        Names imported from such a module may come from the star import, so
+        they also resolve to any definition of that name.
+        """
+        entry = self.files.get(file_path) or self.begin_file(file_path)
+        if entry.has_star_import:
+            return
+        entry.has_star_import = True
+        for name, vertex in self.export_vertices.get(file_path, {}).items():
+            self.add_edge(file_path, vertex, self.global_vertex(name))
+
+    def add_class(self, file_path: str, name: str, symbol_id: int,
+                  bases: List[Optional[ClassKey]], methods: Dict[str, int]):
+        """Add a class to the hierarchy and link its members.
+
+        Args:
+            file_path: File the class is defined in
+            name: Qualified name of the class within the file
+            symbol_id: ID of the class symbol
+            bases: Keys of the bases, ``None`` for bases outside the tree
+            methods: IDs of the methods the class defines, by name
+        """
+        self.hierarchy.add_class((file_path, name), ClassInfo(symbol_id, bases, methods))
+        for method, method_id in methods.items():
+            member = self.member_vertex(file_path, name, method)
+            self.add_edge(file_path, member, method_id)
+            for base in bases:
+                if base is not None:
+                    self.add_edge(file_path, self.member_vertex(*base, method), member)
+
+    def add_alias(self, file_path: str, name: str, target: ClassKey):
+        """Record that ``name`` in a file is imported from ``target``."""
+        self.hierarchy.add_alias(file_path, name, target)
+
+    def link_members(self, file_path: str):
+        """Link a file's member vertices once its classes and aliases are known.
+
+        Member vertices created after this are linked as they are created.
+        """
+        pending = [
+            (class_name, member, vertex)
+            for class_name, members in self.member_vertices.get(file_path, {}).items()
+            for member, vertex in members.items()
+        ]
+        # Vertices created while linking are linked as they are created
+        self.files[file_path].members_linked = True
+        for class_name, member, vertex in pending:
+            self._link_member(file_path, class_name, member, vertex)
+
+    def member_vertex(self, file_path: str, class_name: str, member: str) -> int:
+        """Vertex standing for attribute ``member`` looked up on a class."""
+        members = self.member_vertices.setdefault(file_path, {}).setdefault(class_name, {})
+        vertex = members.get(member)
+        if vertex is None:
+            vertex = self._new_vertex(None)
+            members[member] = vertex
+            entry = self.files.get(file_path)
+            if entry is not None and entry.members_linked:
+                self._link_member(file_path, class_name, member, vertex)
+        return vertex
+
+    def add_attribute_access(self, file_path: str, name: str, line: int):
+        """Record an attribute access site in the attribute index."""
+        self.files[file_path].attribute_accesses.setdefault(name, []).append(line)
+        self.attribute_files.setdefault(name, set()).add(file_path)
+
+    def attribute_accesses(self, name: str) -> List[Tuple[str, int]]:
+        """All recorded ``(file, line)`` sites where attribute ``name`` is read."""
+        return [
+            (file_path, line)
+            for file_path in sorted(self.attribute_files.get(name, ()))
+            for line in self.files[file_path].attribute_accesses[name]
+        ]
+
+    def _link_member(self, file_path: str, class_name: str, member: str, vertex: int):
+        """Add the edges a class's file owns for an inherited or aliased member."""
+        alias = self.hierarchy.aliases.get(file_path, {}).get(class_name)
+        if alias is not None:
+            # Both ways: lookups follow the import, and uses of the imported
+            # class's member reach overrides in subclasses keyed by the alias
+            target = self.member_vertex(*alias, member)
+            self.add_edge(file_path, vertex, target)
+            self.add_edge(file_path, target, vertex)
+            return
+        info = self.hierarchy.classes.get((file_path, class_name))
+        if info is None or member in info.methods:
+            return
+        for base in info.bases:
+            if base is not None:
+                self.add_edge(file_path, vertex, self.member_vertex(*base, member))
+
+    def add_edge(self, file_path: str, source: int, target: int):
+        """Add a reference edge owned by a file."""
+        self.files[file_path].edges.append((source, target))
+        self.graph.add_edge(source, target)
+
+    def add_root(self, file_path: str, vertex: int):
+        """Make a vertex an entry point on behalf of a file."""
+        self.files[file_path].roots.append(vertex)
+        self.graph.add_root(vertex)
     
     def get_symbol(self, name: str, file_path: str, line: int) -> Optional[Symbol]:
         """Get a symbol by its identifiers."""
         key = f"{file_path}:{line}:{name}"
         return self.symbols.get(key)
+
+    def get_id(self, name: str, file_path: str, line: int) -> Optional[int]:
+        """Get the ID of a symbol by its identifiers."""
+        return self.ids.get(f"{file_path}:{line}:{name}")
     
     def get_file_symbols(self, file_path: str) -> List[Symbol]:
         """Get all symbols defined in a file."""
         return self.file_symbols.get(file_path, [])
 
+    def is_live(self, symbol_id: int) -> bool:
+        """Check if a symbol is reachable from an entry point."""
+        return self.graph.is_live(symbol_id)
+
+    def global_vertex(self, name: str) -> int:
+        """Vertex standing for any module-level definition of ``name``."""
+        return self._name_vertex('global', name)
+
+    def attribute_vertex(self, name: str) -> int:
+        """Vertex standing for any class member named ``name``."""
+        return self._name_vertex('attr', name)
+
+    def export_vertex(self, file_path: str, name: str) -> int:
+        """Vertex standing for ``name`` as bound at the top of one file."""
+        vertices = self.export_vertices.setdefault(file_path, {})
+        vertex = vertices.get(name)
+        if vertex is None:
+            vertex = self._new_vertex(None)
+            vertices[name] = vertex
+            entry = self.files.get(file_path)
+            if entry is not None and entry.has_star_import:
+                self.add_edge(file_path, vertex, self.global_vertex(name))
+        return vertex
+
+    def resolve_name(self, name: str, file_path: str) -> List[int]:
+        """Resolve a bare name used in a file to the vertices it may refer to.
+
+        Definitions and imports in the same file shadow everything else; a
+        name the file does not bind (e.g. from a star import) may refer to a
+        definition with that name in any other file.
+        """
+        local = self.file_names.get(file_path, {}).get(name)
+        if local:
+            return local
+        return [self.global_vertex(name)]
+
+    def resolve_attribute(self, name: str) -> List[int]:
+        """Resolve an attribute of an unknown object to every class member it may refer to."""
+        return [self.attribute_vertex(name)]
+
+    def resolve_import(self, symbol: Symbol, module_file: Optional[str] = None) -> List[int]:
+        """Resolve an imported name to the vertex of its definitions.
+
+        Args:
+            symbol: The import symbol
+            module_file: File of the module the name is imported from, when
+                the import could be resolved to the analyzed tree
+        """
+        name = symbol.imported_name or symbol.name
+        if module_file is not None:
+            # Names bound by imports in the target module are re-exports
+            return [self.export_vertex(module_file, name)]
+        return [self.global_vertex(name)]
+
+    def _name_vertex(self, kind: str, name: str) -> int:
+        """Get or create a shared name vertex."""
+        vertex = self.name_vertices.get((kind, name))
+        if vertex is None:
+            vertex = self._new_vertex(None)
+            self.name_vertices[(kind, name)] = vertex
+        return vertex
+
+    def _new_vertex(self, symbol: Optional[Symbol]) -> int:
+        """Allocate a graph vertex, recording the symbol it stands for."""
+        vertex = self.graph.add_vertex()
+        if vertex == len(self.by_id):
+            self.by_id.append(symbol)
+        else:
+            self.by_id[vertex] = symbol
+        return vertex
+
+    def _free_vertex(self, vertex: int):
+        """Release a vertex that no longer has edges."""
+        self.by_id[vertex] = None
+        self.graph.free_vertex(vertex)
+
+
+# Support markers of vertices in the reference graph
+_DEAD = -1
+_ROOT = -2
+
+
+class ReferenceGraph:
+    """Directed multigraph of references with incrementally maintained liveness.
+
+    Vertices are dense integers and edges are counted, so the same reference
+    may be added more than once. Each live vertex keeps a support link to the
+    vertex it was reached from, or is marked as a root; the links form a
+    spanning forest of the live part of the graph. Adding edges or roots only
+    explores newly reached vertices, and removing them only revisits the
+    vertices whose support depended on what was removed.
+    """
+
+    def __init__(self, num_vertices: int = 0):
+        self.adjacency: List[Dict[int, int]] = []
+        self.reverse: List[Dict[int, int]] = []
+        self.ref_counts: List[int] = []
+        self.root_counts: List[int] = []
+        self.support: List[int] = []
+        self.children: List[Optional[Set[int]]] = []
+        self._free: List[int] = []
+        for _ in range(num_vertices):
+            self.add_vertex()
+
+    def add_vertex(self) -> int:
+        """Add a vertex and return its index, reusing freed indexes."""
+        if self._free:
+            return self._free.pop()
+        self.adjacency.append({})
+        self.reverse.append({})
+        self.ref_counts.append(0)
+        self.root_counts.append(0)
+        self.support.append(_DEAD)
+        self.children.append(None)
+        return len(self.adjacency) - 1
+
+    def free_vertex(self, vertex: int):
+        """Release a vertex whose edges and roots have all been removed."""
+        self._free.append(vertex)
+
+    def is_live(self, vertex: int) -> bool:
+        """Check if a vertex is reachable from a root."""
+        return self.support[vertex] != _DEAD
+
+    def add_edge(self, source: int, target: int):
+        """Add an edge from ``source`` to ``target``."""
+        targets = self.adjacency[source]
+        targets[target] = targets.get(target, 0) + 1
+        sources = self.reverse[target]
+        sources[source] = sources.get(source, 0) + 1
+        self.ref_counts[target] += 1
+        if self.support[source] != _DEAD and self.support[target] == _DEAD:
+            self._attach(target, source)
+            self._propagate([target])
+
+    def remove_edge(self, source: int, target: int):
+        """Remove one copy of an edge."""
+        self.detach([(source, target)], [])
+
+    def add_root(self, vertex: int):
+        """Make a vertex an entry point."""
+        self.root_counts[vertex] += 1
+        support = self.support[vertex]
+        if support == _DEAD:
+            self.support[vertex] = _ROOT
+            self._propagate([vertex])
+        elif support != _ROOT:
+            self.children[support].discard(vertex)
+            self.support[vertex] = _ROOT
+
+    def remove_root(self, vertex: int):
+        """Remove one entry point mark from a vertex."""
+        self.detach([], [vertex])
+
+    def detach(self, edges: Iterable[Tuple[int, int]], roots: Iterable[int]):
+        """Remove several edges and roots, then repair liveness once."""
+        lost = []
+        for source, target in edges:
+            count = self.adjacency[source][target] - 1
+            self.ref_counts[target] -= 1
+            if count:
+                self.adjacency[source][target] = count
+                self.reverse[target][source] = count
+                continue
+            del self.adjacency[source][target]
+            del self.reverse[target][source]
+            if self.support[target] == source:
+                lost.append(target)
+        for vertex in roots:
+            self.root_counts[vertex] -= 1
+            if not self.root_counts[vertex] and self.support[vertex] == _ROOT:
+                lost.append(vertex)
+        if lost:
+            self._revalidate(lost)
+
+    def reachable(self, roots: Iterable[int]) -> bytearray:
+        """Mark every vertex reachable from the roots with a breadth-first search.
+
+        Returns:
+            bytearray: ``1`` at the index of each reachable vertex
+        """
+        adjacency = self.adjacency
+        seen = bytearray(len(adjacency))
+        queue = deque()
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                queue.append(root)
+        while queue:
+            for target in adjacency[queue.popleft()]:
+                if not seen[target]:
+                    seen[target] = 1
+                    queue.append(target)
+        return seen
+
+    def _attach(self, vertex: int, source: int):
+        """Support a vertex by the live vertex it is reached from."""
+        self.support[vertex] = source
+        children = self.children[source]
+        if children is None:
+            children = self.children[source] = set()
+        children.add(vertex)
+
+    def _propagate(self, queue: List[int]):
+        """Mark everything newly reachable from live vertices in the queue."""
+        adjacency = self.adjacency
+        support = self.support
+        while queue:
+            vertex = queue.pop()
+            for target in adjacency[vertex]:
+                if support[target] == _DEAD:
+                    self._attach(target, vertex)
+                    queue.append(target)
+
+    def _revalidate(self, lost: List[int]):
+        """Repair liveness after vertices lost their support links.
+
+        Everything supported through a lost vertex is marked dead; each of
+        those vertices that is a root or has another live predecessor is then
+        supported again and liveness is propagated from it.
+        """
+        support = self.support
+        stack = []
+        for vertex in lost:
+            parent = support[vertex]
+            if parent == _DEAD:
+                continue
+            if parent != _ROOT and self.children[parent] is not None:
+                self.children[parent].discard(vertex)
+            support[vertex] = _DEAD
+            stack.append(vertex)
+
+        affected = []
+        while stack:
+            vertex = stack.pop()
+            affected.append(vertex)
+            children = self.children[vertex]
+            if children:
+                for child in children:
+                    support[child] = _DEAD
+                    stack.append(child)
+            self.children[vertex] = None
+
+        queue = []
+        for vertex in affected:
+            if support[vertex] != _DEAD:
+                continue
+            if self.root_counts[vertex]:
+                support[vertex] = _ROOT
+                queue.append(vertex)
+                continue
+            for source in self.reverse[vertex]:
+                if support[source] != _DEAD:
+                    self._attach(vertex, source)
+                    queue.append(vertex)
+                    break
+        self._propagate(queue)
+
+
+class NamePatternMatcher:
+    """Matches names against a set of glob patterns in one step.
+
+    Patterns are compiled once: exact names go into a set, ``prefix*`` and
+    ``*suffix`` patterns into tuples for ``str.startswith``/``str.endswith``,
+    and anything else into a single alternation regex.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the patterns.
+
+        Args:
+            patterns: Glob patterns as understood by ``fnmatch``
+        """
+        self.exact: Set[str] = set()
+        prefixes = []
+        suffixes = []
+        others = []
+        for pattern in patterns:
+            if not pattern:
+                continue
+            body = pattern.strip('*')
+            if any(c in body for c in '*?['):
+                others.append(pattern)
+            elif pattern == body:
+                self.exact.add(pattern)
+            elif pattern == body + '*' and body:
+                prefixes.append(body)
+            elif pattern == '*' + body and body:
+                suffixes.append(body)
+            else:
+                others.append(pattern)
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self.regex = (
+            re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in others))
+            if others else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.exact or self.prefixes or self.suffixes or self.regex)
+
+    def matches(self, name: str) -> bool:
+        """Check if a name matches any of the patterns."""
+        return (name in self.exact
+                or (bool(self.prefixes) and name.startswith(self.prefixes))
+                or (bool(self.suffixes) and name.endswith(self.suffixes))
+                or (self.regex is not None and self.regex.match(name) is not None))
+
+
+# A reference from a scope: ('name', name), ('attr', name),
+# ('member'|'super', class qualname, attribute) or ('qualified', dotted
+# name rooted at an import, attribute)
+Reference = Tuple[str, ...]
+
+# Kinds of references that read an attribute
+_ATTRIBUTE_REFERENCES = frozenset({'attr', 'member', 'super', 'qualified'})
+
+
+@dataclass
+class FileSummary:
+    """Definitions and unresolved references of one file.
+
+    Summaries are computed per file without access to the symbol table, so
+    they can be built in worker processes and cached on disk. Symbols and
+    scopes are referred to by their position in ``symbols``; scope ``-1`` is
+    the module itself. ``references`` holds every reference site as
+    ``(scope, reference, line)``.
+    """
+    file_path: str
+    symbols: List[Symbol] = field(default_factory=list)
+    has_star_import: bool = False
+    exports: List[str] = field(default_factory=list)
+    classes: List[Tuple[str, int, Dict[str, int]]] = field(default_factory=list)
+    references: List[Tuple[int, Reference, int]] = field(default_factory=list)
+
+
+def summarize_source(file_path: str, text: str) -> FileSummary:
+    """Parse a file's source and reduce it to a ``FileSummary``.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = ast.parse(text)
+    definitions = DefinitionVisitor(file_path)
+    definitions.visit(tree)
+    usage = UsageVisitor(definitions.indexes, {name for name, _, _ in definitions.classes},
+                         {name.split('.')[0] for name in definitions.imported_names})
+    usage.visit(tree)
+    return FileSummary(
+        file_path=file_path,
+        symbols=definitions.symbols,
+        has_star_import=definitions.has_star_import,
+        exports=sorted(definitions.exports),
+        classes=definitions.classes,
+        references=usage.references
+    )
+
+
+# File loader of a worker process, created on first use
+_WORKER_LOADER: Optional[FileLoader] = None
+
+
+def _summarize_file(file_path: str) -> Tuple[Optional[FileSummary], Optional[str]]:
+    """Summarize a file in a worker process.
+
+    Returns:
+        ``(summary, None)``, or ``(None, error)`` if the file could not be
+        read or parsed
+    """
+    global _WORKER_LOADER
+    if _WORKER_LOADER is None:
+        _WORKER_LOADER = FileLoader(max_bytes=0)
+    try:
+        return summarize_source(file_path, _WORKER_LOADER.load(file_path).text), None
+    except Exception as e:
+        return None, str(e)
+
 
 class DefinitionVisitor(ast.NodeVisitor):
     """AST visitor for finding symbol definitions."""
     
-    def __init__(self, file_path: str, symbol_table: SymbolTable):
+    def __init__(self, file_path: str):
         self.file_path = file_path
-        self.symbol_table = symbol_table
         self.current_class = None
         self.current_function = None
         self.imported_names = set()
+        self.symbols: List[Symbol] = []
+        self.indexes: Dict[Tuple[str, int], int] = {}
+        self.has_star_import = False
+        self.class_names: List[str] = []
+        self.classes: List[Tuple[str, int, Dict[str, int]]] = []
+        self.exports: Set[str] = set()
+
+    def add_symbol(self, symbol: Symbol):
+        """Record a symbol, skipping repeated bindings of a name on one line."""
+        key = (symbol.name, symbol.line)
+        if key not in self.indexes:
+            self.indexes[key] = len(self.symbols)
+            self.symbols.append(symbol)
     
     def visit_ClassDef(self, node):
         """Visit class definition."""
@@ -108,20 +856,31 @@ class DefinitionVisitor(ast.NodeVisitor):
                 for d in node.decorator_list
             ],
             is_private=node.name.startswith('_'),
-            is_test=node.name.startswith('Test') or node.name.endswith('Test')
+            is_test=node.name.startswith('Test') or node.name.endswith('Test'),
+            bases=[ast.unparse(b).strip() for b in node.bases]
         )
         
         if old_class:
             symbol.parent = old_class
             
-        self.symbol_table.add_symbol(symbol)
+        self.add_symbol(symbol)
         self.current_class = symbol
+        self.class_names.append(node.name)
         
         # Visit class body
         self.generic_visit(node)
+
+        methods = {}
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods[child.name] = self.indexes[(child.name, child.lineno)]
+        self.classes.append(
+            ('.'.join(self.class_names), self.indexes[(node.name, node.lineno)], methods)
+        )
         
+        self.class_names.pop()
         self.current_class = old_class
-    
+
     def visit_FunctionDef(self, node):
         """Visit function definition."""
         old_function = self.current_function
@@ -157,7 +916,7 @@ class DefinitionVisitor(ast.NodeVisitor):
             )
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self.add_symbol(symbol)
         self.current_function = symbol
         
         # Visit function body
@@ -169,6 +928,81 @@ class DefinitionVisitor(ast.NodeVisitor):
         """Visit async function definition."""
         self.visit_FunctionDef(node)  # Handle same as sync functions
     
+    def visit_Assign(self, node):
+        """Visit assignment, tracking module-level variables and ``__all__``."""
+        if self._at_module_level():
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == '__all__':
+                    self.exports = self._literal_names(node.value)
+                else:
+                    self._add_variables(target, node.lineno)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        """Visit annotated assignment."""
+        if self._at_module_level() and node.value is not None:
+            if isinstance(node.target, ast.Name) and node.target.id == '__all__':
+                self.exports = self._literal_names(node.value)
+            else:
+                self._add_variables(node.target, node.lineno)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node):
+        """Visit augmented assignment, e.g. ``__all__ += [...]``."""
+        if (self._at_module_level() and isinstance(node.target, ast.Name)
+                and node.target.id == '__all__'):
+            self.exports |= self._literal_names(node.value)
+        self.generic_visit(node)
+
+    def visit_Expr(self, node):
+        """Visit expression statement, e.g. ``__all__.extend([...])``."""
+        call = node.value
+        if (self._at_module_level() and isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and isinstance(call.func.value, ast.Name)
+                and call.func.value.id == '__all__' and call.args):
+            if call.func.attr == 'extend':
+                self.exports |= self._literal_names(call.args[0])
+            elif call.func.attr == 'append':
+                self.exports |= self._literal_names(ast.List(elts=[call.args[0]]))
+        self.generic_visit(node)
+
+    def _at_module_level(self) -> bool:
+        """Check if the visitor is outside any class or function body."""
+        return self.current_class is None and self.current_function is None
+
+    def _add_variables(self, target: ast.AST, line: int):
+        """Add a variable symbol for every name bound by an assignment target."""
+        if isinstance(target, ast.Name):
+            symbol = Symbol(
+                name=target.id,
+                type=SymbolType.VARIABLE,
+                file_path=self.file_path,
+                line=line,
+                end_line=line,
+                is_private=target.id.startswith('_'),
+                is_special=target.id.startswith('__') and target.id.endswith('__')
+            )
+            self.add_symbol(symbol)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._add_variables(element, line)
+        elif isinstance(target, ast.Starred):
+            self._add_variables(target.value, line)
+
+    @staticmethod
+    def _literal_names(node: ast.AST) -> Set[str]:
+        """Collect the string literals of a list or tuple, including concatenations."""
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left = DefinitionVisitor._literal_names(node.left)
+            return left | DefinitionVisitor._literal_names(node.right)
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return {
+                element.value for element in node.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            }
+        return set()
+
     def visit_Import(self, node):
         """Visit import statement."""
         for alias in node.names:
@@ -178,9 +1012,10 @@ class DefinitionVisitor(ast.NodeVisitor):
                 type=SymbolType.IMPORT,
                 file_path=self.file_path,
                 line=node.lineno,
-                is_private=name.startswith('_')
+                is_private=name.startswith('_'),
+                imported_name=alias.name
             )
-            self.symbol_table.add_symbol(symbol)
+            self.add_symbol(symbol)
             self.imported_names.add(name)
     
     def visit_ImportFrom(self, node):
@@ -188,91 +1023,152 @@ class DefinitionVisitor(ast.NodeVisitor):
         for alias in node.names:
             name = alias.asname or alias.name
             if name == '*':
-                continue  # Skip wildcard imports
+                self.has_star_import = True
+                continue
             symbol = Symbol(
                 name=name,
                 type=SymbolType.IMPORT,
                 file_path=self.file_path,
                 line=node.lineno,
-                is_private=name.startswith('_')
+                is_private=name.startswith('_'),
+                imported_name=alias.name,
+                import_module=node.module,
+                import_level=node.level
             )
-            self.symbol_table.add_symbol(symbol)
+            self.add_symbol(symbol)
             self.imported_names.add(name)
 
 
 class UsageVisitor(ast.NodeVisitor):
-    """AST visitor for finding symbol usage."""
+    """AST visitor that collects a file's references, unresolved.
+
+    References are attributed to the innermost enclosing class or function,
+    or to the module for code that runs at import time. Attributes read
+    from ``self``, ``cls``, ``super()`` or a class defined in the file are
+    recorded as member references so they can be resolved through the
+    class hierarchy, and attributes of a dotted name starting with an
+    imported name as qualified references resolved through the import;
+    other attributes may refer to any class member with that name.
+    """
     
-    def __init__(self, file_path: str, symbol_table: SymbolTable):
-        self.file_path = file_path
-        self.symbol_table = symbol_table
-        self.current_scope = None
+    def __init__(self, scopes: Dict[Tuple[str, int], int], class_names: Set[str],
+                 imported_names: Set[str]):
+        self.scopes = scopes
+        self.current_scope = -1
         self.used_names = set()
+        self.classes = class_names
+        self.imported_names = imported_names
+        self.references: List[Tuple[int, Reference, int]] = []
+        self.class_names: List[str] = []
+        self.current_class: Optional[str] = None
+        self.self_name: Optional[str] = None
+        self.in_class_body = False
     
     def visit_Name(self, node):
         """Visit name node."""
         if isinstance(node.ctx, ast.Load):
             self.used_names.add(node.id)
-            
-            # Try to find the symbol in the current file
-            symbol = self.symbol_table.get_symbol(node.id, self.file_path, node.lineno)
-            if symbol and self.current_scope:
-                symbol.used_by.add(self.current_scope)
-                self.current_scope.uses.add(symbol)
+            self._add_reference(('name', node.id), node.lineno)
+
+    def visit_AugAssign(self, node):
+        """Visit augmented assignment, which reads its target before rebinding it."""
+        if isinstance(node.target, ast.Name):
+            self._add_reference(('name', node.target.id), node.lineno)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        """Visit attribute node."""
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load):
+            self._add_reference(self._attribute_reference(node), node.lineno)
     
     def visit_ClassDef(self, node):
         """Visit class definition."""
-        old_scope = self.current_scope
-        self.current_scope = self.symbol_table.get_symbol(
-            node.name,
-            self.file_path,
-            node.lineno
-        )
-        
-        # Visit bases and decorators
-        for base in node.bases:
-            self.visit(base)
-        for decorator in node.decorator_list:
-            self.visit(decorator)
-            
-        # Visit class body
-        self.generic_visit(node)
-        
-        self.current_scope = old_scope
+        saved = (self.current_class, self.self_name, self.in_class_body)
+        self.class_names.append(node.name)
+        self.current_class = '.'.join(self.class_names)
+        self.self_name = None
+        self.in_class_body = True
+        self._visit_scope(node)
+        self.class_names.pop()
+        self.current_class, self.self_name, self.in_class_body = saved
     
     def visit_FunctionDef(self, node):
         """Visit function definition."""
-        old_scope = self.current_scope
-        self.current_scope = self.symbol_table.get_symbol(
-            node.name,
-            self.file_path,
-            node.lineno
-        )
-        
-        # Visit decorators
-        for decorator in node.decorator_list:
-            self.visit(decorator)
-            
-        # Visit function body
-        self.generic_visit(node)
-        
-        self.current_scope = old_scope
+        saved = (self.self_name, self.in_class_body)
+        if self.in_class_body:
+            arguments = node.args.posonlyargs + node.args.args
+            is_static = any(
+                isinstance(d, ast.Name) and d.id == 'staticmethod'
+                for d in node.decorator_list
+            )
+            self.self_name = arguments[0].arg if arguments and not is_static else None
+        self.in_class_body = False
+        self._visit_scope(node)
+        self.self_name, self.in_class_body = saved
     
     def visit_AsyncFunctionDef(self, node):
         """Visit async function definition."""
         self.visit_FunctionDef(node)  # Handle same as sync functions
 
+    def _visit_scope(self, node):
+        """Visit a class or function body with its symbol as the current scope."""
+        scope = self.scopes.get((node.name, node.lineno))
+        if scope is None:
+            self.generic_visit(node)
+            return
+        old_scope = self.current_scope
+        self.current_scope = scope
+        self.generic_visit(node)
+        self.current_scope = old_scope
+
+    def _attribute_reference(self, node: ast.Attribute) -> Reference:
+        """Describe an attribute read, as a member reference where the class is known."""
+        value = node.value
+        if self.current_class is not None:
+            if isinstance(value, ast.Name) and value.id == self.self_name:
+                return ('member', self.current_class, node.attr)
+            if (isinstance(value, ast.Call) and isinstance(value.func, ast.Name)
+                    and value.func.id == 'super'):
+                return ('super', self.current_class, node.attr)
+        if isinstance(value, ast.Name) and value.id in self.classes:
+            return ('member', value.id, node.attr)
+        dotted = self._dotted_name(value)
+        if dotted is not None and dotted.split('.')[0] in self.imported_names:
+            return ('qualified', dotted, node.attr)
+        return ('attr', node.attr)
+
+    @staticmethod
+    def _dotted_name(node: ast.AST) -> Optional[str]:
+        """Get ``a.b.c`` for a chain of attribute reads on a name, else ``None``."""
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(node.id)
+        return '.'.join(reversed(parts))
+
+    def _add_reference(self, reference: Reference, line: int):
+        """Record a reference site in the current scope."""
+        self.references.append((self.current_scope, reference, line))
+
 
 class DeadCodeAnalyzer(BaseAnalyzer):
     """Analyzer for finding unused code."""
 
-    def __init__(self, config: Dict[str, Any]):
+    CACHE_FILE = 'dead_code_summaries.pickle'
+    CACHE_VERSION = 3
+
+    def __init__(self, config: Dict[str, Any], file_loader: Optional[FileLoader] = None):
         """Initialize the analyzer.
         
         Args:
             config: Configuration dictionary
+            file_loader: Optional file loader shared with other analyzers
         """
-        super().__init__(config)
+        super().__init__(config, file_loader)
         self.symbol_table = SymbolTable()
         dead_code_config = config.get("analysis", {}).get("dead_code", {})
         self.ignore_private = dead_code_config.get("ignore_private", True)
@@ -280,6 +1176,18 @@ class DeadCodeAnalyzer(BaseAnalyzer):
         self.ignore_overrides = dead_code_config.get("ignore_overrides", True)
         self.ignore_properties = dead_code_config.get("ignore_properties", True)
         self.ignore_test_files = dead_code_config.get("ignore_test_files", True)
+        self.ignore_names = dead_code_config.get("ignore_names", []) or []
+        self.ignore_decorators = dead_code_config.get("ignore_decorators", []) or []
+        self._name_matcher = NamePatternMatcher(self.ignore_names)
+        self._decorator_matcher = NamePatternMatcher(self.ignore_decorators)
+        self.entry_points = dead_code_config.get("entry_points", []) or []
+        self.console_scripts = dead_code_config.get("console_scripts", True)
+        self.workers = dead_code_config.get("workers") or 1
+        self.cache_dir = dead_code_config.get("cache_dir")
+        self.usage_index = dead_code_config.get("usage_index")
+        self.summaries: Dict[str, FileSummary] = {}
+        self.resolver = ImportResolver([])
+        self._entry_roots: List[int] = []
 
     def analyze(self, file_paths: List[Path]) -> Dict[str, Any]:
         """Analyze files for unused code.
@@ -290,38 +1198,83 @@ class DeadCodeAnalyzer(BaseAnalyzer):
         Returns:
             Dict containing dead code analysis results
         """
-        # First pass: collect all symbols
-        for file_path in file_paths:
-            if self.should_ignore_file(file_path):
+        self.symbol_table = SymbolTable()
+        self.summaries = {}
+        self.resolver = ImportResolver(file_paths)
+
+        paths = [str(path) for path in file_paths if not self.should_ignore_file(path)]
+        for path, summary in zip(paths, self._summarize_files(paths)):
+            if summary is None:
                 continue
-                
             try:
-                self._collect_symbols(file_path)
+                self._apply_summary(summary)
             except Exception as e:
-                self._log_error(f"Error collecting symbols from {file_path}: {str(e)}")
-        
-        # Second pass: analyze usage
-        for file_path in file_paths:
-            if self.should_ignore_file(file_path):
-                continue
-                
+                self._log_error(f"Error analyzing {path}: {str(e)}")
+
+        targets = list(self.entry_points)
+        if self.console_scripts:
+            targets.extend(self._load_console_scripts(file_paths))
+        self._entry_roots = self._resolve_entry_points(targets)
+        for vertex in self._entry_roots:
+            self.symbol_table.graph.add_root(vertex)
+
+        if self.usage_index:
             try:
-                self._analyze_usage(file_path)
+                self.write_usage_index(self.usage_index)
             except Exception as e:
-                self._log_error(f"Error analyzing usage in {file_path}: {str(e)}")
-        
-        # Find unused symbols
+                self._log_error(f"Error writing usage index to {self.usage_index}: {str(e)}")
+
+        return self.get_results()
+
+    def update_file(self, file_path: Path) -> Dict[str, Any]:
+        """Re-analyze one file after it was added or changed.
+
+        Only the file's own symbols and references are replaced, and liveness
+        is repaired from there, so the cost follows the size of the file and
+        of the code whose liveness actually changes.
+
+        Args:
+            file_path: Path of the changed file
+
+        Returns:
+            Dict containing the updated dead code analysis results
+        """
+        self.file_loader.invalidate(file_path)
+        self.resolver.add_file(file_path)
+        try:
+            self._index_file(file_path)
+        except Exception as e:
+            self._log_error(f"Error analyzing {file_path}: {str(e)}")
+        return self.get_results()
+
+    def remove_file(self, file_path: Path) -> Dict[str, Any]:
+        """Forget a deleted file and return the updated results."""
+        self.file_loader.invalidate(file_path)
+        self.symbol_table.remove_file(str(file_path))
+        self.summaries.pop(str(file_path), None)
+        return self.get_results()
+
+    def get_results(self) -> Dict[str, Any]:
+        """Report every symbol that is not reachable from an entry point.
+
+        Anything unreachable is dead, including symbols that are only
+        referenced by other dead code.
+
+        Returns:
+            Dict containing dead code analysis results
+        """
         unused_classes = []
         unused_functions = []
         unused_methods = []
         unused_variables = []
         unused_imports = []
         
-        for symbol in self.symbol_table.symbols.values():
-            if self._should_ignore_symbol(symbol):
-                continue
-                
-            if not symbol.used_by:
+        for entry in self.symbol_table.files.values():
+            for symbol_id in entry.symbol_ids:
+                symbol = self.symbol_table.by_id[symbol_id]
+                if self._should_ignore_symbol(symbol) or self.symbol_table.is_live(symbol_id):
+                    continue
+                    
                 result = {
                     'name': symbol.name,
                     'file': symbol.file_path,
@@ -329,6 +1282,8 @@ class DeadCodeAnalyzer(BaseAnalyzer):
                     'end_line': symbol.end_line,
                     'type': symbol.type.value
                 }
+                if self.baseline is not None and not self.baseline.is_new_symbol(result):
+                    continue
                 
                 if symbol.type == SymbolType.CLASS:
                     unused_classes.append(result)
@@ -356,31 +1311,515 @@ class DeadCodeAnalyzer(BaseAnalyzer):
             )
         }
 
-    def _collect_symbols(self, file_path: Path):
-        """Collect symbols from a file."""
+    def usage_sites(self) -> Iterable[Tuple[int, str, int, int]]:
+        """Resolve every reference site to the definitions it may refer to.
+
+        Sites are resolved through the same vertices as liveness: name and
+        member vertices and imports are followed until they reach classes,
+        functions, methods or variables. Imports count as sites of what they
+        import.
+
+        Yields:
+            ``(symbol_id, file, line, scope)`` tuples, where ``scope`` is the
+            ID of the enclosing symbol or ``-1`` for module-level code
+        """
+        table = self.symbol_table
+        resolved: Dict[int, Tuple[int, ...]] = {}
+        for path, summary in self.summaries.items():
+            entry = table.files.get(path)
+            if entry is None:
+                continue
+            ids = [table.get_id(symbol.name, path, symbol.line) for symbol in summary.symbols]
+            class_bases = {
+                class_name: [
+                    self._resolve_base(path, base) for base in summary.symbols[index].bases
+                ]
+                for class_name, index, _ in summary.classes
+            }
+            sites = [
+                (-1, table.graph.adjacency[symbol_id], symbol.line)
+                for symbol, symbol_id in zip(summary.symbols, ids)
+                if symbol.type == SymbolType.IMPORT
+            ] + [
+                (scope, self._resolve_reference(path, reference, class_bases), line)
+                for scope, reference, line in summary.references
+            ]
+            for scope, targets, line in sites:
+                scope_id = -1 if scope < 0 else ids[scope]
+                definitions = set()
+                for target in targets:
+                    if target not in resolved:
+                        resolved[target] = self._definitions_of(target)
+                    definitions.update(resolved[target])
+                for symbol_id in sorted(definitions):
+                    yield symbol_id, path, line, scope_id
+
+    def write_usage_index(self, path: Union[str, Path]):
+        """Persist the usage index of the last analysis to an SQLite database."""
+        table = self.symbol_table
+        positions: Dict[int, int] = {}
+        symbols = []
+        for entry in table.files.values():
+            for symbol_id in entry.symbol_ids:
+                symbol = table.by_id[symbol_id]
+                if symbol.type == SymbolType.IMPORT:
+                    continue
+                positions[symbol_id] = len(symbols)
+                symbols.append(IndexedSymbol(
+                    qualname=self.qualified_name(symbol),
+                    name=symbol.name,
+                    type=symbol.type.value,
+                    file=symbol.file_path,
+                    line=symbol.line,
+                    live=table.is_live(symbol_id)
+                ))
+        scope_names: Dict[Tuple[str, int], str] = {}
+        references = []
+        for symbol_id, file_path, line, scope in self.usage_sites():
+            key = (file_path, scope)
+            if key not in scope_names:
+                scope_names[key] = (
+                    self.qualified_name(table.by_id[scope]) if scope >= 0
+                    else self.resolver.module_for(file_path) or Path(file_path).stem
+                )
+            references.append(
+                (positions[symbol_id], ReferenceSite(file_path, line, scope_names[key]))
+            )
+        with UsageIndex(path) as index:
+            index.replace(symbols, references)
+
+    def qualified_name(self, symbol: Symbol) -> str:
+        """Dotted name of a symbol, prefixed with its module's name."""
+        parts = []
+        current: Optional[Symbol] = symbol
+        while current is not None:
+            parts.append(current.name)
+            current = current.parent
+        module = self.resolver.module_for(symbol.file_path) or Path(symbol.file_path).stem
+        return '.'.join([module] + parts[::-1])
+
+    def _definitions_of(self, vertex: int) -> Tuple[int, ...]:
+        """Definitions reached from a vertex through name vertices and imports."""
+        table = self.symbol_table
+        definitions = []
+        seen = {vertex}
+        stack = [vertex]
+        while stack:
+            current = stack.pop()
+            symbol = table.by_id[current]
+            if symbol is not None and symbol.type != SymbolType.IMPORT:
+                definitions.append(current)
+                continue
+            for target in table.graph.adjacency[current]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return tuple(definitions)
+
+    def _index_file(self, file_path: Path):
+        """Replace everything a file contributes to the symbol table."""
+        path = str(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            visitor = DefinitionVisitor(str(file_path), self.symbol_table)
-            visitor.visit(tree)
-            
+            summary = summarize_source(path, self.file_loader.load(file_path).text)
         except Exception as e:
             self._log_error(f"Error parsing {file_path}: {str(e)}")
+            self.symbol_table.remove_file(path)
+            self.summaries.pop(path, None)
+            return
+        self._apply_summary(summary)
+
+    def _summarize_files(self, paths: List[str]) -> List[Optional[FileSummary]]:
+        """Summarize files, reusing cached summaries of unchanged files.
+
+        Files that are not cached are summarized in a process pool when
+        more than one worker is configured, otherwise in this process
+        through the shared file loader. The cache is keyed by each file's
+        modification time and size and rewritten after summarizing.
 
-    def _analyze_usage(self, file_path: Path):
-        """Analyze symbol usage in a file."""
+        Returns:
+            The summary of each path, ``None`` for files that failed
+        """
+        cache = self._load_cache()
+        stats = {}
+        summaries: List[Optional[FileSummary]] = [None] * len(paths)
+        missing = []
+        for position, path in enumerate(paths):
+            try:
+                stat = os.stat(path)
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+            cached = cache.get(path)
+            if cached is not None and path in stats and cached[0] == stats[path]:
+                summaries[position] = cached[1]
+            else:
+                missing.append(position)
+
+        results: Iterable[Tuple[Optional[FileSummary], Optional[str]]] = ()
+        if self.workers > 1 and len(missing) > 1:
+            try:
+                results = self._summarize_in_pool([paths[position] for position in missing])
+            except Exception as e:
+                self._log_error(f"Parallel dead code analysis failed, analyzing serially: {str(e)}")
+        if not results:
+            results = (self._summarize_here(paths[position]) for position in missing)
+
+        for position, (summary, error) in zip(missing, results):
+            if error is not None:
+                self._log_error(f"Error parsing {paths[position]}: {error}")
+            summaries[position] = summary
+
+        if self.cache_dir:
+            self._save_cache({
+                path: (stats[path], summary)
+                for path, summary in zip(paths, summaries)
+                if summary is not None and path in stats
+            })
+        return summaries
+
+    def _summarize_here(self, path: str) -> Tuple[Optional[FileSummary], Optional[str]]:
+        """Summarize a file in this process through the shared file loader."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            visitor = UsageVisitor(str(file_path), self.symbol_table)
-            visitor.visit(tree)
-            
+            return summarize_source(path, self.file_loader.load(path).text), None
         except Exception as e:
-            self._log_error(f"Error analyzing {file_path}: {str(e)}")
+            return None, str(e)
+
+    def _summarize_in_pool(
+        self, paths: List[str]
+    ) -> List[Tuple[Optional[FileSummary], Optional[str]]]:
+        """Summarize files in a process pool, preserving their order."""
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        chunk_size = max(1, len(paths) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+            return list(executor.map(_summarize_file, paths, chunksize=chunk_size))
+
+    def _cache_path(self) -> Path:
+        """Path of the summary cache file inside ``cache_dir``."""
+        return Path(self.cache_dir) / self.CACHE_FILE
+
+    def _load_cache(self) -> Dict[str, Tuple[Tuple[int, int], FileSummary]]:
+        """Load cached summaries, or nothing if there is no usable cache."""
+        if not self.cache_dir:
+            return {}
+        path = self._cache_path()
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            self._log_error(f"Error loading dead code cache from {path}: {str(e)}")
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != self.CACHE_VERSION:
+            return {}
+        return cache['files']
+
+    def _save_cache(self, files: Dict[str, Tuple[Tuple[int, int], FileSummary]]):
+        """Write summaries to the cache, replacing it atomically."""
+        path = self._cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix('.tmp')
+            with open(temporary, 'wb') as f:
+                pickle.dump({'version': self.CACHE_VERSION, 'files': files}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except Exception as e:
+            self._log_error(f"Error saving dead code cache to {path}: {str(e)}")
+
+    def _apply_summary(self, summary: FileSummary):
+        """Resolve a file summary against the symbol table, replacing the file."""
+        path = summary.file_path
+        table = self.symbol_table
+        self.summaries[path] = summary
+        entry = table.begin_file(path)
+        ids = [table.add_symbol(symbol) for symbol in summary.symbols]
+        if summary.has_star_import:
+            table.mark_star_import(path)
+        # Names listed in __all__ are the module's public interface
+        for name in summary.exports:
+            table.add_root(path, table.export_vertex(path, name))
+        for symbol_id in list(entry.symbol_ids):
+            symbol = table.by_id[symbol_id]
+            if self._is_entry_symbol(symbol):
+                table.add_root(path, symbol_id)
+            if symbol.type == SymbolType.IMPORT:
+                for target in self._import_targets(symbol):
+                    table.add_edge(path, symbol_id, target)
+
+        class_bases = {}
+        for class_name, index, methods in summary.classes:
+            bases = [self._resolve_base(path, base) for base in summary.symbols[index].bases]
+            class_bases[class_name] = bases
+            table.add_class(path, class_name, ids[index], bases,
+                            {method: ids[position] for method, position in methods.items()})
+        table.link_members(path)
+
+        seen = set()
+        for scope_index, reference, line in summary.references:
+            if reference[0] in _ATTRIBUTE_REFERENCES:
+                table.add_attribute_access(path, reference[-1], line)
+            if (scope_index, reference) in seen:
+                continue
+            seen.add((scope_index, reference))
+            scope = entry.module_vertex if scope_index < 0 else ids[scope_index]
+            for target in self._resolve_reference(path, reference, class_bases):
+                if target != scope:
+                    table.add_edge(path, scope, target)
+
+    def _resolve_reference(self, path: str, reference: Reference,
+                           class_bases: Dict[str, List[Optional[ClassKey]]]) -> List[int]:
+        """Resolve a summarized reference to the vertices it may refer to."""
+        table = self.symbol_table
+        kind = reference[0]
+        if kind == 'name':
+            return table.resolve_name(reference[1], path)
+        if kind == 'member':
+            return [table.member_vertex(path, reference[1], reference[2])]
+        if kind == 'super':
+            _, class_name, attribute = reference
+            bases = class_bases.get(class_name, [])
+            targets = [table.member_vertex(*base, attribute) for base in bases if base]
+            if not targets or None in bases:
+                targets.extend(table.resolve_attribute(attribute))
+            return targets
+        if kind == 'qualified':
+            return self._resolve_qualified(path, reference[1], reference[2])
+        return table.resolve_attribute(reference[1])
+
+    def _resolve_qualified(self, path: str, dotted: str, attribute: str) -> List[int]:
+        """Resolve ``attribute`` read on a dotted name that starts with an import.
+
+        The dotted name is resolved through the imports binding its first
+        part, to a module of the analyzed tree and possibly a class in it;
+        the attribute then refers to what that module exports or to a
+        member of that class. Attributes of modules outside the tree refer
+        to nothing in it. Names the file also binds otherwise may refer to
+        any class member.
+        """
+        table = self.symbol_table
+        parts = dotted.split('.')
+        bindings = [
+            table.by_id[symbol_id] for symbol_id in table.file_names.get(path, {}).get(parts[0], [])
+        ]
+        if not bindings or any(symbol.type != SymbolType.IMPORT for symbol in bindings):
+            return table.resolve_attribute(attribute)
+
+        targets = []
+        for symbol in bindings:
+            if symbol.import_module is None and not symbol.import_level:
+                # "import a.b" binds "a", "import a.b as c" binds "c" to "a.b"
+                if symbol.name == symbol.imported_name:
+                    name = dotted
+                else:
+                    name = '.'.join([symbol.imported_name] + parts[1:])
+            else:
+                module, imported = self.resolver.resolve_from(
+                    path, symbol.import_module, symbol.import_level, symbol.imported_name
+                )
+                if module is None:
+                    continue
+                name = '.'.join([module] + ([imported] if imported else []) + parts[1:])
+            module = self.resolver.find_module(name)
+            if module is None:
+                continue
+            module_file = self.resolver.modules[module]
+            if name == module:
+                targets.append(table.export_vertex(module_file, attribute))
+            else:
+                targets.append(table.member_vertex(module_file, name[len(module) + 1:], attribute))
+        return targets
+
+    def _import_targets(self, symbol: Symbol) -> List[int]:
+        """Resolve the symbols an import statement binds.
+
+        ``from module import name`` is resolved to the definition in that
+        module when the module is part of the analyzed tree, and recorded as
+        an alias in case the name is a class. Plain ``import module``
+        statements and submodule imports bind modules, whose module-level
+        code is always a root, so they add no edges. Imports the resolver
+        cannot place fall back to matching definitions by name.
+        """
+        if symbol.import_module is None and not symbol.import_level:
+            return []
+        module, attribute = self.resolver.resolve_from(
+            symbol.file_path, symbol.import_module, symbol.import_level,
+            symbol.imported_name or symbol.name
+        )
+        if module is None:
+            return self.symbol_table.resolve_import(symbol)
+        if attribute is None:
+            return []
+        module_file = self.resolver.modules[module]
+        self.symbol_table.add_alias(symbol.file_path, symbol.name, (module_file, attribute))
+        return self.symbol_table.resolve_import(symbol, module_file)
+
+    def _resolve_base(self, file_path: str, base: str) -> Optional[ClassKey]:
+        """Resolve a base class expression to a class key.
+
+        Bare names are keyed in the subclass's own file, where an import
+        alias may lead on to another module. Dotted names are resolved
+        through the module import that binds their first part. Returns
+        ``None`` for bases outside the analyzed tree.
+        """
+        expression = base.split('[')[0]
+        if '(' in expression:
+            return None
+        parts = expression.split('.')
+        if len(parts) == 1:
+            return (file_path, expression)
+
+        for symbol_id in self.symbol_table.file_names.get(file_path, {}).get(parts[0], []):
+            symbol = self.symbol_table.by_id[symbol_id]
+            if symbol.type != SymbolType.IMPORT:
+                continue
+            if symbol.import_module is None and not symbol.import_level:
+                if symbol.name == symbol.imported_name:
+                    module = '.'.join(parts[:-1])
+                else:
+                    module = '.'.join([symbol.imported_name] + parts[1:-1])
+            else:
+                module, attribute = self.resolver.resolve_from(
+                    file_path, symbol.import_module, symbol.import_level, symbol.imported_name
+                )
+                if module is None or attribute is not None:
+                    continue
+                module = '.'.join([module] + parts[1:-1])
+            module_file = self.resolver.modules.get(module)
+            if module_file is not None:
+                return (module_file, parts[-1])
+        return None
+
+    def _is_entry_symbol(self, symbol: Symbol) -> bool:
+        """Check if a symbol is an entry point liveness is propagated from.
+
+        Besides module-level code, which is always a root, the entry points
+        are test functions and classes, symbols matching ``ignore_names`` or
+        decorated with a decorator matching ``ignore_decorators``, functions
+        registered through a decorator call such as ``@app.route(...)``, and
+        symbols that are called implicitly (special
+        methods, properties and overrides) when the analyzer is configured to
+        treat them as used. Console scripts and configured ``entry_points``
+        are resolved separately by ``_resolve_entry_points``.
+        """
+        return (symbol.is_test
+                or (symbol.is_special and self.ignore_special)
+                or (symbol.is_override and self.ignore_overrides)
+                or (symbol.is_property and self.ignore_properties)
+                or self._name_matcher.matches(symbol.name)
+                or any(
+                    self._is_registration(d) or self._decorator_matcher.matches(d.partition('(')[0])
+                    for d in symbol.decorators
+                ))
+
+    @staticmethod
+    def _is_registration(decorator: str) -> bool:
+        """Check if a decorator looks like a framework registration, e.g. ``@cli.command()``."""
+        callee, paren, _ = decorator.partition('(')
+        return bool(paren) and '.' in callee
+
+    def _resolve_entry_points(self, targets: List[str]) -> List[int]:
+        """Map ``package.module:function`` targets to vertices to use as roots.
+
+        A target whose module is among the analyzed files is rooted at the
+        name exported by that module; other targets match every top-level
+        definition of that name, or every attribute of that name for
+        ``module:Class.method`` targets.
+        """
+        vertices = []
+        for target in targets:
+            module, _, attribute = target.partition(':')
+            if not attribute:
+                module, attribute = '', module
+            path = attribute.strip().split('.')
+            module_file = self.resolver.modules.get(module.strip())
+            if len(path) > 1:
+                vertices.append(self.symbol_table.attribute_vertex(path[-1]))
+            elif module_file is not None:
+                vertices.append(self.symbol_table.export_vertex(module_file, path[0]))
+            else:
+                vertices.append(self.symbol_table.global_vertex(path[0]))
+        return vertices
+
+    def _load_console_scripts(self, file_paths: List[Path]) -> List[str]:
+        """Read console script targets from the project's packaging metadata.
+
+        The project root is the nearest directory, starting from the common
+        parent of the analyzed files, that contains ``setup.py``,
+        ``setup.cfg`` or ``pyproject.toml``.
+        """
+        if not file_paths:
+            return []
+        try:
+            directory = Path(
+                os.path.commonpath([str(Path(p).resolve().parent) for p in file_paths])
+            )
+        except ValueError:
+            return []
+
+        for candidate in (directory, *directory.parents):
+            names = ('setup.py', 'setup.cfg', 'pyproject.toml')
+            if not any((candidate / name).is_file() for name in names):
+                continue
+            targets = []
+            for name, reader in zip(names, (self._setup_py_scripts,
+                                            self._setup_cfg_scripts,
+                                            self._pyproject_scripts)):
+                path = candidate / name
+                if path.is_file():
+                    try:
+                        targets.extend(reader(path))
+                    except Exception as e:
+                        self._log_error(f"Error reading entry points from {path}: {str(e)}")
+            return targets
+        return []
+
+    def _setup_py_scripts(self, path: Path) -> List[str]:
+        """Extract literal ``console_scripts`` entries from a ``setup.py``."""
+        targets = []
+        tree = ast.parse(self.file_loader.load(path).text)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Dict):
+                continue
+            for key, value in zip(node.keys, node.values):
+                if (
+                    isinstance(key, ast.Constant)
+                    and key.value in ('console_scripts', 'gui_scripts')
+                    and isinstance(value, (ast.List, ast.Tuple))
+                ):
+                    targets.extend(
+                        element.value.split('=', 1)[-1].strip()
+                        for element in value.elts
+                        if isinstance(element, ast.Constant) and isinstance(element.value, str)
+                    )
+        return targets
+
+    @staticmethod
+    def _setup_cfg_scripts(path: Path) -> List[str]:
+        """Extract ``console_scripts`` entries from a ``setup.cfg``."""
+        parser = configparser.ConfigParser()
+        parser.read(path)
+        targets = []
+        for option in ('console_scripts', 'gui_scripts'):
+            value = parser.get('options.entry_points', option, fallback='')
+            targets.extend(
+                line.split('=', 1)[-1].strip()
+                for line in value.splitlines() if '=' in line
+            )
+        return targets
+
+    @staticmethod
+    def _pyproject_scripts(path: Path) -> List[str]:
+        """Extract ``[project.scripts]`` entries from a ``pyproject.toml``."""
+        if tomllib is None:
+            return []
+        with open(path, 'rb') as f:
+            project = tomllib.load(f).get('project', {})
+        scripts = {**project.get('scripts', {}), **project.get('gui-scripts', {})}
+        return [str(target) for target in scripts.values()]
 
     def _should_ignore_symbol(self, symbol: Symbol) -> bool:
         """Check if a symbol should be ignored in dead code analysis."""
@@ -0,0 +1,185 @@
+"""
+Shared source file loader for analyzers.
+Reads each file once, decodes it according to PEP 263 and keeps the decoded
+text in a bounded LRU cache so several analyzers can reuse it.
+"""
+
+import ast
+import hashlib
+import io
+import mmap
+import os
+import re
+import tokenize
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Union
+
+# Files at least this large are mapped instead of read into a bytes object
+MMAP_THRESHOLD = 1024 * 1024
+
+_NEWLINE = re.compile(r"\r\n?")
+
+
+class SourceFile:
+    """Decoded source of a Python file with a line-offset index."""
+
+    def __init__(self, path: str, text: str, encoding: str, content_hash: str):
+        """Initialize the source file.
+
+        Args:
+            path: Path the source was read from
+            text: Decoded source with newlines normalized to ``\\n``
+            encoding: Encoding the source was decoded with
+            content_hash: SHA-256 hex digest of the raw file bytes
+        """
+        self.path = path
+        self.text = text
+        self.encoding = encoding
+        self.content_hash = content_hash
+        self._line_offsets: Optional[List[int]] = None
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """Character offset of the start of each line, plus the end of the text.
+
+        ``line_offsets[n - 1]`` is where line ``n`` starts, so the index can be
+        addressed directly with the 1-based line numbers used by ``ast``.
+        """
+        if self._line_offsets is None:
+            offsets = [0]
+            find = self.text.find
+            position = find("\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = find("\n", position + 1)
+            if offsets[-1] != len(self.text):
+                offsets.append(len(self.text))
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the source."""
+        return len(self.line_offsets) - 1
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        """Convert an ``ast`` position to a character offset into the text.
+
+        Args:
+            lineno: 1-based line number
+            col_offset: UTF-8 byte offset within the line, as reported by ``ast``
+
+        Returns:
+            int: Character offset into ``text``
+        """
+        offsets = self.line_offsets
+        start = offsets[lineno - 1]
+        if col_offset == 0:
+            return start
+        line = self.text[start:offsets[lineno]]
+        if line.isascii():
+            return start + col_offset
+        return start + len(line.encode("utf-8")[:col_offset].decode("utf-8", "replace"))
+
+    def lines(self, start_line: int, end_line: int) -> str:
+        """Return whole lines ``start_line`` to ``end_line`` inclusive."""
+        offsets = self.line_offsets
+        end_line = min(end_line, self.line_count)
+        return self.text[offsets[start_line - 1]:offsets[end_line]]
+
+    def segment(self, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> str:
+        """Return the source between two ``ast`` positions."""
+        return self.text[self.offset(lineno, col_offset):self.offset(end_lineno, end_col_offset)]
+
+    def node_segment(self, node: ast.AST) -> Optional[str]:
+        """Return the source of an AST node, like ``ast.get_source_segment``."""
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col_offset = getattr(node, "end_col_offset", None)
+        if end_lineno is None or end_col_offset is None:
+            return None
+        return self.segment(node.lineno, node.col_offset, end_lineno, end_col_offset)
+
+
+class FileLoader:
+    """Reads and decodes source files, caching results in a bounded LRU."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, mmap_threshold: int = MMAP_THRESHOLD):
+        """Initialize the loader.
+
+        Args:
+            max_bytes: Approximate budget for cached decoded text
+            mmap_threshold: Size from which files are memory-mapped
+        """
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        self._cache: "OrderedDict[str, SourceFile]" = OrderedDict()
+        self._cached_bytes = 0
+
+    def load(self, file_path: Union[str, Path]) -> SourceFile:
+        """Load a source file, from the cache when possible.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            SourceFile: The decoded source
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the encoding declaration is invalid
+            UnicodeDecodeError: If the file does not match its encoding
+        """
+        key = str(file_path)
+        source = self._cache.get(key)
+        if source is not None:
+            self._cache.move_to_end(key)
+            return source
+
+        source = self._read(key)
+        self._store(key, source)
+        return source
+
+    def invalidate(self, file_path: Union[str, Path]) -> None:
+        """Drop a file from the cache so the next load re-reads it."""
+        source = self._cache.pop(str(file_path), None)
+        if source is not None:
+            self._cached_bytes -= len(source.text)
+
+    def clear(self) -> None:
+        """Drop every cached file."""
+        self._cache.clear()
+        self._cached_bytes = 0
+
+    def _read(self, path: str) -> SourceFile:
+        """Read and decode a file from disk."""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._decode(path, data)
+            return self._decode(path, f.read())
+
+    def _decode(self, path: str, data) -> SourceFile:
+        """Decode raw bytes using the PEP 263 cookie or BOM, defaulting to UTF-8."""
+        # The encoding cookie can only appear on the first two lines
+        head_end = data.find(b"\n")
+        if head_end != -1:
+            head_end = data.find(b"\n", head_end + 1)
+        head = data[:head_end + 1] if head_end != -1 else data[:]
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(head).readline)
+        text = str(data, encoding)
+        if "\r" in text:
+            text = _NEWLINE.sub("\n", text)
+        return SourceFile(path, text, encoding, hashlib.sha256(data).hexdigest())
+
+    def _store(self, key: str, source: SourceFile) -> None:
+        """Insert a file into the cache, evicting least recently used entries."""
+        size = len(source.text)
+        if size > self.max_bytes:
+            return
+        self._cache[key] = source
+        self._cached_bytes += size
+        while self._cached_bytes > self.max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted.text)
@@ -4,15 +4,76 @@ Uses Locality Sensitive Hashing (LSH) for efficient similarity detection.
 """
 
 import ast
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+import functools
+import heapq
+import itertools
+import json
+import mmap
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import tempfile
 import tokenize
-from typing import List, Set, Dict, Optional, Tuple, Any
-import hashlib
+from typing import List, Set, Dict, Iterator, Optional, Sequence, Tuple, Any
 from pathlib import Path
 import io
+import zlib
 
 from .base_analyzer import BaseAnalyzer
+from .file_loader import FileLoader, SourceFile
+from .structural import StructuralCloneDetector
+
+# Shingles and MinHash permutations are computed modulo a Mersenne prime
+_MERSENNE_PRIME = (1 << 61) - 1
+_SHINGLE_BASE = 1_000_003
+_OCCURRENCE_MIX = 0x9E3779B97F4A7C15
+_MINHASH_SEED = 0x5EED
+
+# Token ID sets of the fragments being verified. Set by the parent right
+# before verification so forked workers share it copy-on-write.
+_VERIFY_FEATURES: Sequence[Optional[frozenset]] = ()
+
+
+def _init_verify_worker(features: Sequence[Optional[frozenset]]):
+    """Install the token ID sets in a worker that could not inherit them."""
+    global _VERIFY_FEATURES
+    _VERIFY_FEATURES = features
+
+
+def _verify_pairs(pairs: List[Tuple[int, int]], threshold: float) -> List[Tuple[int, int, float]]:
+    """Compute Jaccard similarity for candidate pairs and keep those above threshold.
+
+    Args:
+        pairs: Pairs of positions into ``_VERIFY_FEATURES``
+        threshold: Minimum similarity to keep a pair
+
+    Returns:
+        List of ``(first, second, similarity)`` tuples in input order
+    """
+    features = _VERIFY_FEATURES
+    matches = []
+    for first, second in pairs:
+        tokens1 = features[first]
+        tokens2 = features[second]
+        if not tokens1 or not tokens2:
+            continue
+        shared = len(tokens1 & tokens2)
+        similarity = shared / (len(tokens1) + len(tokens2) - shared)
+        if similarity >= threshold:
+            matches.append((first, second, similarity))
+    return matches
+
+
+def _location_key(fragment: 'CodeFragment') -> Tuple[str, int, int]:
+    """Sort key giving fragments a stable order across runs."""
+    location = fragment.location
+    return (location.file_path, location.start_line, location.end_line)
 
 
 class FragmentType(Enum):
@@ -43,10 +104,14 @@ class Token:
 
 @dataclass(frozen=True)
 class CodeFragment:
-    """A fragment of code to analyze for similarity."""
+    """A fragment of code to analyze for similarity.
+
+    Fragments produced by the analyzer leave ``source`` empty; their
+    location is enough to read it back through the file loader.
+    """
     type: FragmentType
     location: Location
-    source: str
+    source: str = ""
     tokens: Optional[Tuple[Token, ...]] = None
     hash: Optional[str] = None
     
@@ -72,6 +137,11 @@ class TokenProcessor:
         self.name_counter = 0
         self.name_map: Dict[str, str] = {}
         
+    def reset(self):
+        """Forget normalized names so the next fragment starts again at NAME_0."""
+        self.name_counter = 0
+        self.name_map = {}
+
     def normalize_name(self, name: str) -> str:
         """Normalize variable/function names to generic placeholders."""
         if name not in self.name_map:
@@ -120,33 +190,92 @@ class TokenProcessor:
 
 
 class LSHIndex:
-    """Locality Sensitive Hashing index for fast similarity search."""
-    
-    def __init__(self, num_bands: int = 10, band_size: int = 2):
+    """Locality Sensitive Hashing index for fast similarity search.
+
+    Fragments are hashed into k-gram shingles over their token stream. With
+    ``weighted`` set, repeated shingles are kept apart by occurrence number,
+    so the MinHash estimates the weighted (multiset) Jaccard similarity.
+
+    The index can be saved to and loaded from a directory holding a raw
+    signature matrix (``signatures.bin``, memory-mapped on load) and a JSON
+    table of indexed files keyed by path with their content hashes. A loaded
+    index can be updated file by file and queried without re-indexing the
+    files that did not change.
+    """
+
+    FORMAT_VERSION = 2
+    SIGNATURES_FILE = "signatures.bin"
+    TABLE_FILE = "index.json"
+
+    def __init__(self, num_bands: int = 10, band_size: int = 2,
+                 shingle_size: int = 3, weighted: bool = True):
         self.num_bands = num_bands
         self.band_size = band_size
         self.signature_size = num_bands * band_size
+        self.shingle_size = max(shingle_size, 1)
+        self.weighted = weighted
+        rng = random.Random(_MINHASH_SEED)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(self.signature_size)
+        ]
+        self._token_hashes: Dict[Token, int] = {}
         self.band_buckets: List[Dict[str, Set[CodeFragment]]] = [
             {} for _ in range(num_bands)
         ]
+        self.signatures: Dict[CodeFragment, Sequence[int]] = {}
+        self.file_hashes: Dict[str, str] = {}
+        self.file_fragments: Dict[str, List[CodeFragment]] = {}
+        self._mmap: Optional[mmap.mmap] = None
     
+    def shingle(self, tokens: Tuple[Token, ...]) -> Set[int]:
+        """Hash a token stream into a set of k-gram shingles.
+
+        Token IDs are stable across runs, so shingles and signatures can be
+        persisted. Streams shorter than ``shingle_size`` form a single shingle.
+
+        Args:
+            tokens: Normalized tokens of a fragment
+
+        Returns:
+            Set of shingle hashes, expanded by occurrence when weighted
+        """
+        token_hashes = self._token_hashes
+        ids = []
+        for token in tokens:
+            token_id = token_hashes.get(token)
+            if token_id is None:
+                token_id = zlib.crc32(f"{token.type}:{token.value}".encode())
+                token_hashes[token] = token_id
+            ids.append(token_id)
+
+        k = min(self.shingle_size, len(ids))
+        shingles = []
+        for start in range(len(ids) - k + 1):
+            value = 0
+            for token_id in ids[start:start + k]:
+                value = (value * _SHINGLE_BASE + token_id) % _MERSENNE_PRIME
+            shingles.append(value)
+
+        if not self.weighted:
+            return set(shingles)
+        occurrences: Dict[int, int] = {}
+        expanded = set()
+        for value in shingles:
+            seen = occurrences.get(value, 0)
+            occurrences[value] = seen + 1
+            expanded.add((value ^ (seen * _OCCURRENCE_MIX)) % _MERSENNE_PRIME)
+        return expanded
+
     def compute_minhash_signature(self, tokens: Tuple[Token, ...]) -> List[int]:
-        """Compute MinHash signature for a set of tokens."""
-        signature = []
-        token_strs = [f"{t.type}:{t.value}" for t in tokens]
-        
-        # Use multiple hash functions (simulated with different seeds)
-        for i in range(self.signature_size):
-            min_hash = float('inf')
-            for token_str in token_strs:
-                # Combine token with signature index for different hash functions
-                hash_val = int(hashlib.sha256(
-                    f"{token_str}:{i}".encode()
-                ).hexdigest(), 16) % (2**32)  # Limit hash size
-                min_hash = min(min_hash, hash_val)
-            signature.append(min_hash)
-            
-        return signature
+        """Compute MinHash signature for the shingles of a token stream."""
+        elements = self.shingle(tokens)
+        if not elements:
+            return [0] * self.signature_size
+        return [
+            min((a * x + b) % _MERSENNE_PRIME for x in elements) & 0xFFFFFFFF
+            for a, b in self._permutations
+        ]
     
     def add_fragment(self, fragment: CodeFragment):
         """Add a code fragment to the LSH index."""
@@ -154,55 +283,286 @@ class LSHIndex:
             return
             
         signature = self.compute_minhash_signature(fragment.tokens)
-        
-        # Split signature into bands and hash each band
-        for i in range(self.num_bands):
-            start = i * self.band_size
-            end = start + self.band_size
-            band = tuple(signature[start:end])
-            band_str = ":".join(str(x) for x in band)
-            
-            if band_str not in self.band_buckets[i]:
-                self.band_buckets[i][band_str] = set()
-            self.band_buckets[i][band_str].add(fragment)
+        self._add_signature(fragment, signature)
     
     def find_candidates(self, fragment: CodeFragment) -> Set[CodeFragment]:
         """Find candidate similar fragments using LSH."""
-        if not fragment.tokens:
-            return set()
-            
-        signature = self.compute_minhash_signature(fragment.tokens)
+        signature = self.signatures.get(fragment)
+        if signature is None:
+            if not fragment.tokens:
+                return set()
+            signature = self.compute_minhash_signature(fragment.tokens)
         candidates = set()
         
-        for i in range(self.num_bands):
-            start = i * self.band_size
-            end = start + self.band_size
-            band = tuple(signature[start:end])
-            band_str = ":".join(str(x) for x in band)
-            
+        for i, band_str in enumerate(self._band_keys(signature)):
             if band_str in self.band_buckets[i]:
                 candidates.update(self.band_buckets[i][band_str])
         
         return candidates - {fragment}  # Exclude self
 
+    def add_file(self, file_path: str, content_hash: str, fragments: List[CodeFragment]):
+        """Index the fragments of a file, replacing any previous version of it.
+
+        Args:
+            file_path: Path of the file the fragments come from
+            content_hash: Hash of the file content the fragments were extracted from
+            fragments: Fragments extracted from the file
+        """
+        self.remove_file(file_path)
+        self.file_hashes[file_path] = content_hash
+        self.file_fragments[file_path] = []
+        for fragment in fragments:
+            self.add_fragment(fragment)
+
+    def remove_file(self, file_path: str):
+        """Remove every fragment of a file from the index."""
+        self.file_hashes.pop(file_path, None)
+        for fragment in self.file_fragments.pop(file_path, []):
+            signature = self.signatures.pop(fragment, None)
+            if signature is None:
+                continue
+            for i, band_str in enumerate(self._band_keys(signature)):
+                bucket = self.band_buckets[i].get(band_str)
+                if bucket is None:
+                    continue
+                bucket.discard(fragment)
+                if not bucket:
+                    del self.band_buckets[i][band_str]
+
+    def save(self, path: Path):
+        """Save the index to a directory.
+
+        Args:
+            path: Directory to write the index to; created if missing
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        matrix = array('I')
+        files = {}
+        for file_path in sorted(self.file_fragments):
+            rows = []
+            for fragment in self.file_fragments[file_path]:
+                matrix.extend(self.signatures[fragment])
+                rows.append([
+                    fragment.type.value,
+                    fragment.location.start_line,
+                    fragment.location.end_line
+                ])
+            files[file_path] = {
+                'hash': self.file_hashes.get(file_path, ''),
+                'fragments': rows
+            }
+
+        with open(path / self.SIGNATURES_FILE, 'wb') as f:
+            matrix.tofile(f)
+        with open(path / self.TABLE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.FORMAT_VERSION,
+                'byteorder': sys.byteorder,
+                'num_bands': self.num_bands,
+                'band_size': self.band_size,
+                'shingle_size': self.shingle_size,
+                'weighted': self.weighted,
+                'files': files
+            }, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: Path) -> 'LSHIndex':
+        """Load an index previously written with ``save``.
+
+        The signature matrix is memory-mapped rather than read, so only the
+        pages touched while rebuilding the band buckets are paged in.
+
+        Args:
+            path: Directory the index was saved to
+
+        Returns:
+            LSHIndex: The loaded index
+
+        Raises:
+            ValueError: If the index was written in an incompatible format
+        """
+        path = Path(path)
+        with open(path / cls.TABLE_FILE, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+        if table.get('version') != cls.FORMAT_VERSION or table.get('byteorder') != sys.byteorder:
+            raise ValueError(f"Incompatible LSH index format in {path}")
+
+        index = cls(
+            num_bands=table['num_bands'],
+            band_size=table['band_size'],
+            shingle_size=table['shingle_size'],
+            weighted=table['weighted']
+        )
+        matrix: Sequence[int] = ()
+        with open(path / cls.SIGNATURES_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                index._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                matrix = memoryview(index._mmap).cast('I')
+
+        row = 0
+        size = index.signature_size
+        for file_path, entry in table['files'].items():
+            index.file_hashes[file_path] = entry['hash']
+            index.file_fragments[file_path] = []
+            for fragment_type, start_line, end_line in entry['fragments']:
+                fragment = CodeFragment(
+                    type=FragmentType(fragment_type),
+                    location=Location(file_path, start_line, end_line),
+                    source=""
+                )
+                index._add_signature(fragment, matrix[row * size:(row + 1) * size])
+                row += 1
+        return index
+
+    def _add_signature(self, fragment: CodeFragment, signature: Sequence[int]):
+        """Record a fragment's signature and put it in its band buckets."""
+        self.signatures[fragment] = signature
+        self.file_fragments.setdefault(fragment.location.file_path, []).append(fragment)
+        
+        # Split signature into bands and hash each band
+        for i, band_str in enumerate(self._band_keys(signature)):
+            if band_str not in self.band_buckets[i]:
+                self.band_buckets[i][band_str] = set()
+            self.band_buckets[i][band_str].add(fragment)
+
+    def _band_keys(self, signature: Sequence[int]) -> Iterator[str]:
+        """Yield the bucket key of each band of a signature."""
+        for i in range(self.num_bands):
+            start = i * self.band_size
+            end = start + self.band_size
+            yield ":".join(str(x) for x in signature[start:end])
+
+    @staticmethod
+    def estimate_similarity(signature1: List[int], signature2: List[int]) -> float:
+        """Estimate Jaccard similarity from two MinHash signatures."""
+        if not signature1:
+            return 0.0
+        matches = sum(1 for a, b in zip(signature1, signature2) if a == b)
+        return matches / len(signature1)
+
+
+class SpillingBandIndex:
+    """LSH band buckets that spill to disk-backed sorted runs.
+
+    Each fragment contributes one ``(band, band values..., fragment_id)`` record
+    per band. Records are buffered in memory until ``max_entries`` is reached,
+    then sorted and written out as a run of fixed-size binary records. Buckets
+    are recovered by merge-joining all runs, so memory stays bounded by the
+    buffer size no matter how many fragments are indexed.
+    """
+
+    READ_CHUNK_RECORDS = 4096
+
+    def __init__(self, num_bands: int = 10, band_size: int = 2,
+                 max_entries: int = 1_000_000, spill_dir: Optional[str] = None):
+        self.num_bands = num_bands
+        self.band_size = band_size
+        self.max_entries = max(max_entries, num_bands)
+        self.spill_dir = spill_dir
+        self._record = struct.Struct(f"<I{band_size}II")
+        self._buffer: List[Tuple[int, ...]] = []
+        self._runs: List[str] = []
+
+    @property
+    def num_runs(self) -> int:
+        """Number of sorted runs spilled to disk so far."""
+        return len(self._runs)
+
+    def add(self, fragment_id: int, signature: List[int]):
+        """Add a fragment's signature to the band buckets."""
+        for band in range(self.num_bands):
+            start = band * self.band_size
+            self._buffer.append(
+                (band, *signature[start:start + self.band_size], fragment_id)
+            )
+        if len(self._buffer) >= self.max_entries:
+            self._spill()
+
+    def buckets(self) -> Iterator[Tuple[int, List[int]]]:
+        """Yield ``(band, fragment_ids)`` for every bucket shared by several fragments.
+
+        Fragment IDs within a bucket are yielded in ascending order.
+        """
+        self._buffer.sort()
+        runs = [self._read_run(path) for path in self._runs]
+        merged = heapq.merge(*runs, iter(self._buffer))
+        for key, records in itertools.groupby(merged, key=lambda r: r[:-1]):
+            fragment_ids = [record[-1] for record in records]
+            if len(fragment_ids) > 1:
+                yield key[0], fragment_ids
+
+    def close(self):
+        """Drop buffered records and remove spilled runs from disk."""
+        for path in self._runs:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._runs = []
+        self._buffer = []
+
+    def _spill(self):
+        """Sort the in-memory buffer and write it out as a new run."""
+        self._buffer.sort()
+        fd, path = tempfile.mkstemp(prefix="lsh-run-", suffix=".bin", dir=self.spill_dir)
+        pack = self._record.pack
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(pack(*record) for record in self._buffer)
+        self._runs.append(path)
+        self._buffer = []
+
+    def _read_run(self, path: str) -> Iterator[Tuple[int, ...]]:
+        """Stream records back from a spilled run in fixed-size chunks."""
+        chunk_size = self._record.size * self.READ_CHUNK_RECORDS
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield from self._record.iter_unpack(chunk)
+
 
 class SimilarityAnalyzer(BaseAnalyzer):
     """Analyzer for detecting similar code patterns."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], file_loader: Optional[FileLoader] = None):
         """Initialize the analyzer.
         
         Args:
             config: Configuration dictionary
+            file_loader: Optional file loader shared with other analyzers
         """
-        super().__init__(config)
+        super().__init__(config, file_loader)
         similarity_config = config.get("analysis", {}).get("similarity", {})
         self.min_lines = similarity_config.get("min_lines", 6)
         self.min_tokens = similarity_config.get("min_tokens", 20)
         self.similarity_threshold = similarity_config.get("similarity_threshold", 0.8)
+        self.streaming = similarity_config.get("streaming", False)
+        self.max_index_entries = similarity_config.get("max_index_entries", 1_000_000)
+        self.spill_dir = similarity_config.get("spill_dir")
+        self.workers = similarity_config.get("workers") or 1
+        self.verify_chunk_size = similarity_config.get("verify_chunk_size", 10000)
+        self.structural = similarity_config.get("structural", False)
+        self.structural_threshold = similarity_config.get("structural_threshold", 0.95)
+        self.baseline_index = similarity_config.get("baseline_index")
+        self.save_index = similarity_config.get("save_index")
+        self.verify_cache_size = similarity_config.get("verify_cache_size", 1024)
+        if self.streaming and (self.baseline_index or self.save_index):
+            # A saved index holds every fragment, which streaming avoids
+            self._log_error("Similarity options baseline_index and save_index are not "
+                            "supported in streaming mode; ignoring them")
+            self.baseline_index = self.save_index = None
+        lsh_config = similarity_config.get("lsh_config") or {}
         self.processor = TokenProcessor()
-        self.lsh_index = LSHIndex()
+        self.lsh_index = LSHIndex(
+            num_bands=lsh_config.get("num_bands", 10),
+            band_size=lsh_config.get("band_size", 2),
+            shingle_size=similarity_config.get("shingle_size", 3),
+            weighted=similarity_config.get("weighted_minhash", True)
+        )
         self.fragments: List[CodeFragment] = []
+        self._structure: Optional[StructuralCloneDetector] = None
 
     def analyze(self, file_paths: List[Path]) -> Dict[str, Any]:
         """Analyze files for similar code patterns.
@@ -213,39 +573,95 @@ class SimilarityAnalyzer(BaseAnalyzer):
         Returns:
             Dict containing similarity metrics
         """
+        if self.streaming:
+            return self._analyze_streaming(file_paths)
+
         similar_groups = []
         fragments = []
+        if self.structural:
+            self._structure = StructuralCloneDetector(
+                min_lines=self.min_lines,
+                threshold=self.structural_threshold
+            )
+        track_files = bool(self.baseline_index or self.save_index)
+        if self.baseline_index and Path(self.baseline_index).exists():
+            try:
+                baseline = LSHIndex.load(self.baseline_index)
+                if self._same_hashing(baseline):
+                    self.lsh_index = baseline
+                else:
+                    self._log_error(
+                        f"LSH index at {self.baseline_index} uses different hashing "
+                        "settings, re-indexing all files"
+                    )
+            except Exception as e:
+                self._log_error(f"Error loading LSH index from {self.baseline_index}: {str(e)}")
         
         # First pass: extract fragments from all files
+        seen_files = set()
         for file_path in file_paths:
             if self.should_ignore_file(file_path):
                 continue
                 
             try:
+                if track_files:
+                    seen_files.add(str(file_path))
+                    content_hash = self.file_loader.load(file_path).content_hash
+                    if self.lsh_index.file_hashes.get(str(file_path)) == content_hash:
+                        # Unchanged since the baseline, already indexed
+                        if self._structure is not None:
+                            tree = ast.parse(self.file_loader.load(file_path).text)
+                            self._structure.add_tree(str(file_path), tree)
+                        continue
+
                 file_fragments = self._extract_fragments(file_path)
                 fragments.extend(file_fragments)
                 
                 # Add fragments to LSH index
-                for fragment in file_fragments:
-                    self.lsh_index.add_fragment(fragment)
+                if track_files:
+                    self.lsh_index.add_file(str(file_path), content_hash, file_fragments)
+                else:
+                    for fragment in file_fragments:
+                        self.lsh_index.add_fragment(fragment)
                     
             except Exception as e:
                 self._log_error(f"Error extracting fragments from {file_path}: {str(e)}")
+
+        if track_files:
+            # Files deleted since the baseline must not be reported as clones
+            for file_path in set(self.lsh_index.file_hashes) - seen_files:
+                self.lsh_index.remove_file(file_path)
                 
-        # Second pass: find similar fragments
+        # Second pass: collect candidate pairs, each unordered pair once
+        positions: Dict[CodeFragment, int] = {}
+        indexed: List[CodeFragment] = []
+        pairs = set()
         for fragment in fragments:
-            candidates = self.lsh_index.find_candidates(fragment)
-            similar = []
-            
-            for candidate in candidates:
-                similarity = self._calculate_similarity(fragment, candidate)
-                if similarity >= self.similarity_threshold:
-                    similar.append({
-                        'file': candidate.location.file_path,
-                        'start_line': candidate.location.start_line,
-                        'end_line': candidate.location.end_line,
-                        'similarity': similarity
-                    })
+            first = positions.setdefault(fragment, len(positions))
+            if first == len(indexed):
+                indexed.append(fragment)
+            for candidate in sorted(self.lsh_index.find_candidates(fragment), key=_location_key):
+                second = positions.setdefault(candidate, len(positions))
+                if second == len(indexed):
+                    indexed.append(candidate)
+                pairs.add((min(first, second), max(first, second)))
+
+        # Third pass: verify candidates and merge matches in a deterministic order
+        matches: Dict[int, List[Tuple[int, float]]] = {}
+        for first, second, similarity in self._verify_candidates(indexed, sorted(pairs)):
+            matches.setdefault(first, []).append((second, similarity))
+            matches.setdefault(second, []).append((first, similarity))
+
+        for fragment in fragments:
+            similar = [{
+                'file': indexed[other].location.file_path,
+                'start_line': indexed[other].location.start_line,
+                'end_line': indexed[other].location.end_line,
+                'similarity': similarity
+            } for other, similarity in sorted(
+                matches.get(positions[fragment], []),
+                key=lambda match: _location_key(indexed[match[0]])
+            )]
             
             if similar:
                 group = {
@@ -256,11 +672,235 @@ class SimilarityAnalyzer(BaseAnalyzer):
                     }] + similar,
                     'similarity': max(s['similarity'] for s in similar)
                 }
+                if self._is_new_group('similar_fragments', group):
+                    similar_groups.append(group)
+
+        if self.save_index:
+            try:
+                self.lsh_index.save(self.save_index)
+            except Exception as e:
+                self._log_error(f"Error saving LSH index to {self.save_index}: {str(e)}")
+
+        results = {
+            'similar_fragments': similar_groups
+        }
+        if self._structure is not None:
+            results['structural_clones'] = [
+                group for group in self._structure.find_clones()
+                if self._is_new_group('structural_clones', group)
+            ]
+            self._structure = None
+        return results
+
+    def _is_new_group(self, kind: str, group: Dict[str, Any]) -> bool:
+        """Tell whether a clone group is missing from the baseline, if there is one."""
+        return self.baseline is None or self.baseline.is_new_group(kind, group)
+
+    def _verify_candidates(self, fragments: List[CodeFragment],
+                           pairs: List[Tuple[int, int]]) -> List[Tuple[int, int, float]]:
+        """Verify candidate pairs, fanning token comparisons out to a worker pool.
+
+        Pairs are compared on their shingle sets. When more than one
+        worker is configured and there is more than one chunk of pairs, chunks
+        are verified in a process pool; forked workers inherit the ID sets
+        copy-on-write instead of receiving a pickled copy. Fragments loaded
+        from a saved index have no tokens and are compared by signature.
+
+        Args:
+            fragments: Fragments referenced by position in ``pairs``
+            pairs: Sorted candidate pairs of fragment positions
+
+        Returns:
+            List of ``(first, second, similarity)`` matches sorted by pair
+        """
+        global _VERIFY_FEATURES
+        features = [self._shingle_set(fragment) for fragment in fragments]
+        token_pairs = []
+        matches = []
+        for first, second in pairs:
+            if features[first] is not None and features[second] is not None:
+                token_pairs.append((first, second))
+                continue
+            similarity = self._calculate_similarity(fragments[first], fragments[second])
+            if similarity >= self.similarity_threshold:
+                matches.append((first, second, similarity))
+
+        chunk_size = max(self.verify_chunk_size, 1)
+        chunks = [token_pairs[i:i + chunk_size] for i in range(0, len(token_pairs), chunk_size)]
+        _VERIFY_FEATURES = features
+        try:
+            if self.workers > 1 and len(chunks) > 1:
+                try:
+                    matches.extend(self._verify_in_pool(features, chunks))
+                    return sorted(matches)
+                except Exception as e:
+                    self._log_error(f"Parallel verification failed, verifying serially: {str(e)}")
+            matches.extend(_verify_pairs(token_pairs, self.similarity_threshold))
+        finally:
+            _VERIFY_FEATURES = ()
+        return sorted(matches)
+
+    def _verify_in_pool(self, features: List[Optional[frozenset]],
+                        chunks: List[List[Tuple[int, int]]]) -> List[Tuple[int, int, float]]:
+        """Verify chunks of pairs in a process pool, preserving chunk order."""
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            initializer, initargs = None, ()
+        else:
+            context = multiprocessing.get_context()
+            initializer, initargs = _init_verify_worker, (features,)
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                 initializer=initializer, initargs=initargs) as executor:
+            results = executor.map(
+                _verify_pairs, chunks, itertools.repeat(self.similarity_threshold)
+            )
+            return [match for chunk in results for match in chunk]
+
+    def _shingle_set(self, fragment: CodeFragment) -> Optional[frozenset]:
+        """Hash a fragment's tokens into the shingle set used for verification."""
+        if not fragment.tokens:
+            return None
+        return frozenset(self.lsh_index.shingle(fragment.tokens))
+
+    def _same_hashing(self, index: LSHIndex) -> bool:
+        """Check whether a loaded index was built with the configured hashing."""
+        return (
+            index.num_bands == self.lsh_index.num_bands and
+            index.band_size == self.lsh_index.band_size and
+            index.shingle_size == self.lsh_index.shingle_size and
+            index.weighted == self.lsh_index.weighted
+        )
+
+    def _analyze_streaming(self, file_paths: List[Path]) -> Dict[str, Any]:
+        """Analyze files for similar code while keeping memory bounded.
+
+        Fragments are extracted file by file and reduced to an ID, a location
+        and a MinHash signature; their source and tokens are dropped right away.
+        Band buckets go through a ``SpillingBandIndex``. Candidate pairs are
+        verified like in ``analyze``, on shingle sets rebuilt by reloading
+        just the two fragments through the file loader, so both modes report
+        the same clone groups.
+
+        Args:
+            file_paths: List of paths to analyze
+
+        Returns:
+            Dict containing similarity metrics
+        """
+        size = self.lsh_index.signature_size
+        band_size = self.lsh_index.band_size
+        locations: List[Location] = []
+        # Column offsets of each fragment, to slice its exact source on reload
+        columns = array('I')
+        signatures = array('I')
+        index = SpillingBandIndex(
+            num_bands=self.lsh_index.num_bands,
+            band_size=band_size,
+            max_entries=self.max_index_entries,
+            spill_dir=self.spill_dir
+        )
+        if self.structural:
+            self._structure = StructuralCloneDetector(
+                min_lines=self.min_lines,
+                threshold=self.structural_threshold
+            )
+
+        @functools.lru_cache(maxsize=self.verify_cache_size)
+        def shingles(fragment_id: int) -> Optional[frozenset]:
+            location = locations[fragment_id]
+            source = self.file_loader.load(location.file_path).segment(
+                location.start_line, columns[2 * fragment_id],
+                location.end_line, columns[2 * fragment_id + 1]
+            )
+            return frozenset(self.lsh_index.shingle(self._tokenize(source)))
+
+        try:
+            for file_path in file_paths:
+                if self.should_ignore_file(file_path):
+                    continue
+
+                try:
+                    source_file = self.file_loader.load(file_path)
+                    tree = ast.parse(source_file.text)
+                    if self._structure is not None:
+                        self._structure.add_tree(str(file_path), tree)
+                except Exception as e:
+                    self._log_error(f"Error extracting fragments from {file_path}: {str(e)}")
+                    continue
+                for node, content in self._fragment_nodes(source_file, tree):
+                    tokens = self._tokenize(content)
+                    if not tokens:
+                        continue
+                    signature = self.lsh_index.compute_minhash_signature(tokens)
+                    index.add(len(locations), signature)
+                    locations.append(Location(
+                        file_path=str(file_path),
+                        start_line=node.lineno,
+                        end_line=node.end_lineno or node.lineno
+                    ))
+                    columns.extend((node.col_offset, node.end_col_offset))
+                    signatures.extend(signature)
+
+            matches: Dict[int, List[Tuple[int, float]]] = {}
+            for band, fragment_ids in index.buckets():
+                for first, second in itertools.combinations(fragment_ids, 2):
+                    signature1 = signatures[first * size:(first + 1) * size]
+                    signature2 = signatures[second * size:(second + 1) * size]
+                    # Only the first band the pair collides in reports it
+                    if any(
+                        signature1[b * band_size:(b + 1) * band_size] ==
+                        signature2[b * band_size:(b + 1) * band_size]
+                        for b in range(band)
+                    ):
+                        continue
+                    tokens1 = shingles(first)
+                    tokens2 = shingles(second)
+                    if not tokens1 or not tokens2:
+                        continue
+                    shared = len(tokens1 & tokens2)
+                    similarity = shared / (len(tokens1) + len(tokens2) - shared)
+                    if similarity >= self.similarity_threshold:
+                        matches.setdefault(first, []).append((second, similarity))
+                        matches.setdefault(second, []).append((first, similarity))
+        finally:
+            index.close()
+            shingles.cache_clear()
+
+        def location_key(match: Tuple[int, float]) -> Tuple[str, int, int]:
+            location = locations[match[0]]
+            return (location.file_path, location.start_line, location.end_line)
+
+        similar_groups = []
+        for fragment_id in sorted(matches):
+            location = locations[fragment_id]
+            similar = [{
+                'file': locations[other].file_path,
+                'start_line': locations[other].start_line,
+                'end_line': locations[other].end_line,
+                'similarity': similarity
+            } for other, similarity in sorted(matches[fragment_id], key=location_key)]
+            group = {
+                'fragments': [{
+                    'file': location.file_path,
+                    'start_line': location.start_line,
+                    'end_line': location.end_line
+                }] + similar,
+                'similarity': max(s['similarity'] for s in similar)
+            }
+            if self._is_new_group('similar_fragments', group):
                 similar_groups.append(group)
 
-        return {
+        results = {
             'similar_fragments': similar_groups
         }
+        if self._structure is not None:
+            results['structural_clones'] = [
+                group for group in self._structure.find_clones()
+                if self._is_new_group('structural_clones', group)
+            ]
+            self._structure = None
+        return results
 
     def _extract_fragments(self, file_path: Path) -> List[CodeFragment]:
         """Extract code fragments from a file.
@@ -273,38 +913,49 @@ class SimilarityAnalyzer(BaseAnalyzer):
         """
         fragments = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
+            source_file = self.file_loader.load(file_path)
+            tree = ast.parse(source_file.text)
+            if self._structure is not None:
+                self._structure.add_tree(str(file_path), tree)
             
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-                    fragment_content = ast.get_source_segment(content, node)
-                    if not fragment_content:
-                        continue
-                        
-                    if len(fragment_content.splitlines()) < self.min_lines:
-                        continue
-                        
-                    fragment = CodeFragment(
-                        type=FragmentType.FUNCTION if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-                        else FragmentType.CLASS,
-                        location=Location(
-                            file_path=str(file_path),
-                            start_line=node.lineno,
-                            end_line=node.end_lineno or node.lineno
-                        ),
-                        source=fragment_content,
-                        tokens=tuple(self.processor.process(fragment_content))
-                    )
-                    fragments.append(fragment)
+            for node, fragment_content in self._fragment_nodes(source_file, tree):
+                is_function = isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                fragment = CodeFragment(
+                    type=FragmentType.FUNCTION if is_function else FragmentType.CLASS,
+                    location=Location(
+                        file_path=str(file_path),
+                        start_line=node.lineno,
+                        end_line=node.end_lineno or node.lineno
+                    ),
+                    tokens=self._tokenize(fragment_content)
+                )
+                fragments.append(fragment)
                     
         except Exception as e:
             self._log_error(f"Error extracting fragments from {file_path}: {str(e)}")
             
         return fragments
 
+    def _fragment_nodes(
+        self, source_file: SourceFile, tree: ast.AST
+    ) -> Iterator[Tuple[ast.AST, str]]:
+        """Yield the functions and classes long enough to compare, with their source."""
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
+                end_line = node.end_lineno or node.lineno
+                if end_line - node.lineno + 1 < self.min_lines:
+                    continue
+
+                # Sliced from the line-offset index and only kept for tokenizing
+                fragment_content = source_file.node_segment(node)
+                if fragment_content:
+                    yield node, fragment_content
+
+    def _tokenize(self, source: str) -> Tuple[Token, ...]:
+        """Tokenize a fragment with names normalized relative to the fragment."""
+        self.processor.reset()
+        return tuple(self.processor.process(source))
+
     def _calculate_similarity(self, fragment1: CodeFragment, fragment2: CodeFragment) -> float:
         """Calculate similarity between two code fragments.
         
@@ -316,13 +967,18 @@ class SimilarityAnalyzer(BaseAnalyzer):
             float: Similarity score between 0 and 1
         """
         if not fragment1.tokens or not fragment2.tokens:
-            return 0.0
+            # Fragments loaded from a saved index only carry their signature
+            signature1 = self.lsh_index.signatures.get(fragment1)
+            signature2 = self.lsh_index.signatures.get(fragment2)
+            if signature1 is None or signature2 is None:
+                return 0.0
+            return LSHIndex.estimate_similarity(signature1, signature2)
             
-        # Use token-based similarity
-        tokens1 = set(f"{t.type}:{t.value}" for t in fragment1.tokens)
-        tokens2 = set(f"{t.type}:{t.value}" for t in fragment2.tokens)
+        # Use shingle-based (weighted) Jaccard similarity
+        shingles1 = self.lsh_index.shingle(fragment1.tokens)
+        shingles2 = self.lsh_index.shingle(fragment2.tokens)
         
-        intersection = tokens1.intersection(tokens2)
-        union = tokens1.union(tokens2)
+        intersection = shingles1.intersection(shingles2)
+        union = shingles1.union(shingles2)
         
         return len(intersection) / len(union) if union else 0.0 
\ No newline at end of file
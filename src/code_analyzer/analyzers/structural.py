@@ -0,0 +1,290 @@
+"""
+Structural clone detection based on AST fingerprints.
+Computes Merkle-style subtree hashes and Deckard-style characteristic
+vectors of node types, and indexes the vectors with random-hyperplane LSH
+so near-miss (Type-3) clones are found without comparing every pair of trees.
+"""
+
+import ast
+import math
+import random
+import zlib
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+FRAGMENT_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Load/Store/Del contexts say nothing about structure and are shared singletons
+_IGNORED_NODES = (ast.expr_context,)
+
+
+@dataclass(frozen=True)
+class StructuralFragment:
+    """Structural fingerprint of a function or class."""
+    file_path: str
+    start_line: int
+    end_line: int
+    subtree_hash: int
+    vector: Tuple[Tuple[int, int], ...]
+    size: int
+    norm: float
+
+
+class StructuralCloneDetector:
+    """Finds exact and near-miss structural clones across files."""
+
+    def __init__(self, min_lines: int = 6, min_nodes: int = 20, threshold: float = 0.95,
+                 num_bands: int = 16, band_size: int = 8, centring: float = 0.5,
+                 max_neighbours: int = 64):
+        """Initialize the detector.
+
+        Args:
+            min_lines: Minimum number of lines of a fragment
+            min_nodes: Minimum number of AST nodes of a fragment
+            threshold: Minimum structural similarity of a near-miss clone
+            num_bands: Number of LSH bands over the hyperplane signature
+            band_size: Number of hyperplane bits per band
+            centring: Fraction of the mean vector subtracted before hashing
+            max_neighbours: Maximum number of fragments each fragment is
+                compared with per bucket
+        """
+        self.min_lines = min_lines
+        self.min_nodes = min_nodes
+        self.threshold = threshold
+        self.num_bands = num_bands
+        self.band_size = band_size
+        self.centring = centring
+        self.max_neighbours = max_neighbours
+        self.fragments: List[StructuralFragment] = []
+        self._type_ids: Dict[type, int] = {}
+        self._hyperplanes: Dict[int, List[float]] = {}
+
+    def add_tree(self, file_path: str, tree: ast.AST):
+        """Fingerprint every function and class of a parsed module.
+
+        Subtree hashes are computed bottom-up in a single iterative post-order
+        traversal. Node types are also recorded in pre-order, so the
+        characteristic vector of any subtree is a count over a contiguous
+        slice of that sequence.
+
+        Args:
+            file_path: Path of the module
+            tree: Parsed module
+        """
+        preorder: List[int] = []
+        # Hashes of finished subtrees, in the order their roots were visited.
+        # A stack rather than a map by node ID, since CPython shares operator
+        # and context nodes between parents and siblings.
+        hashes: List[int] = []
+        spans: List[Tuple[ast.AST, int, int, int]] = []
+        stack: List[Tuple[ast.AST, bool, int, int]] = [(tree, False, 0, 0)]
+
+        while stack:
+            node, expanded, start, child_count = stack.pop()
+            if expanded:
+                children = hashes[len(hashes) - child_count:]
+                del hashes[len(hashes) - child_count:]
+                subtree_hash = hash((self._type_id(node), *children))
+                hashes.append(subtree_hash)
+                if isinstance(node, FRAGMENT_NODES):
+                    spans.append((node, start, len(preorder), subtree_hash))
+                continue
+
+            start = len(preorder)
+            preorder.append(self._type_id(node))
+            children = [
+                child for child in ast.iter_child_nodes(node)
+                if not isinstance(child, _IGNORED_NODES)
+            ]
+            stack.append((node, True, start, len(children)))
+            stack.extend((child, False, 0, 0) for child in reversed(children))
+
+        for node, start, end, subtree_hash in spans:
+            end_line = node.end_lineno or node.lineno
+            size = end - start
+            if end_line - node.lineno + 1 < self.min_lines or size < self.min_nodes:
+                continue
+            counts: Dict[int, int] = {}
+            for type_id in preorder[start:end]:
+                counts[type_id] = counts.get(type_id, 0) + 1
+            self.fragments.append(StructuralFragment(
+                file_path=file_path,
+                start_line=node.lineno,
+                end_line=end_line,
+                subtree_hash=subtree_hash,
+                vector=tuple(sorted(counts.items())),
+                size=size,
+                norm=math.sqrt(sum(count * count for count in counts.values()))
+            ))
+
+    def find_clones(self) -> List[Dict[str, Any]]:
+        """Group fingerprinted fragments into structural clone classes.
+
+        Fragments with equal subtree hashes are exact structural clones.
+        Fragments whose characteristic vectors collide in a hyperplane LSH band
+        are verified by ``similarity`` and linked; linked fragments form one
+        near-miss clone group.
+
+        Node type counts are all positive and much alike, so vectors are
+        moved away from their mean before hashing; otherwise most fragments
+        share the same few buckets. Within a bucket, fragments are only
+        compared with the next ``max_neighbours`` in size order whose size is
+        close enough to reach the threshold, and a pair is only compared in
+        the first band it shares, so the number of comparisons grows
+        linearly with the number of fragments.
+
+        Returns:
+            List of clone groups in the same shape as ``similar_fragments``
+        """
+        groups: List[Dict[str, Any]] = []
+        by_hash: Dict[int, List[int]] = {}
+        for position, fragment in enumerate(self.fragments):
+            by_hash.setdefault(fragment.subtree_hash, []).append(position)
+
+        exact: Dict[int, int] = {}
+        for members in by_hash.values():
+            if len(members) > 1:
+                groups.append(self._make_group(members, 1.0, "exact"))
+                for position in members:
+                    exact[position] = members[0]
+
+        # Only one representative of each exact clone class takes part in LSH
+        representatives = [
+            position for position in range(len(self.fragments))
+            if exact.get(position, position) == position
+        ]
+        band_keys = self._band_keys(representatives)
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for position in representatives:
+            for band, key in enumerate(band_keys[position]):
+                buckets.setdefault((band, key), []).append(position)
+
+        parent = {position: position for position in representatives}
+        lowest: Dict[int, float] = {}
+        for (band, _), members in buckets.items():
+            members.sort(key=lambda position: self.fragments[position].size)
+            sizes = [self.fragments[position].size for position in members]
+            for i, first in enumerate(members):
+                # Similarity is at most the size ratio of the two fragments
+                reach = sizes[i] / self.threshold if self.threshold > 0 else math.inf
+                end = min(bisect_right(sizes, reach, i + 1), i + 1 + self.max_neighbours)
+                first_keys = band_keys[first]
+                for second in members[i + 1:end]:
+                    second_keys = band_keys[second]
+                    if any(first_keys[earlier] == second_keys[earlier] for earlier in range(band)):
+                        continue
+                    score = self.similarity(self.fragments[first], self.fragments[second])
+                    if score < self.threshold:
+                        continue
+                    root1, root2 = self._find(parent, first), self._find(parent, second)
+                    merged = min(lowest.get(root1, 1.0), lowest.get(root2, 1.0), score)
+                    parent[max(root1, root2)] = min(root1, root2)
+                    lowest[min(root1, root2)] = merged
+
+        clusters: Dict[int, List[int]] = {}
+        for position in representatives:
+            root = self._find(parent, position)
+            if root in lowest:
+                clusters.setdefault(root, []).append(position)
+        for root in sorted(clusters):
+            groups.append(self._make_group(clusters[root], round(lowest[root], 4), "near-miss"))
+        return groups
+
+    @staticmethod
+    def similarity(first: StructuralFragment, second: StructuralFragment) -> float:
+        """Cosine similarity of two characteristic vectors, scaled by their size ratio.
+
+        The size ratio keeps a small function from matching a much larger one
+        that merely has the same mix of node types.
+        """
+        if not first.norm or not second.norm:
+            return 0.0
+        counts = dict(first.vector)
+        dot = sum(count * counts.get(type_id, 0) for type_id, count in second.vector)
+        ratio = min(first.size, second.size) / max(first.size, second.size)
+        return dot / (first.norm * second.norm) * ratio
+
+    def _band_keys(self, positions: List[int]) -> Dict[int, List[int]]:
+        """LSH band keys of fragments, from their centred hyperplane signatures."""
+        bits = self.num_bands * self.band_size
+        mean: Dict[int, float] = {}
+        for position in positions:
+            fragment = self.fragments[position]
+            for type_id, count in fragment.vector:
+                mean[type_id] = mean.get(type_id, 0.0) + count / fragment.norm
+        offset = [0.0] * bits
+        if positions:
+            scale = self.centring / len(positions)
+            for type_id, total in mean.items():
+                weight = total * scale
+                offset = [o + weight * w for o, w in zip(offset, self._hyperplane(type_id, bits))]
+
+        mask = (1 << self.band_size) - 1
+        band_keys: Dict[int, List[int]] = {}
+        for position in positions:
+            signature = self._signature(self.fragments[position], offset)
+            band_keys[position] = [
+                signature >> (band * self.band_size) & mask for band in range(self.num_bands)
+            ]
+        return band_keys
+
+    def _signature(self, fragment: StructuralFragment, offset: List[float]) -> int:
+        """Random-hyperplane (SimHash) signature of a normalized characteristic vector.
+
+        Args:
+            fragment: Fingerprinted fragment
+            offset: Projection of the scaled mean vector, subtracted from the fragment's
+        """
+        bits = self.num_bands * self.band_size
+        totals = [-o for o in offset]
+        for type_id, count in fragment.vector:
+            weight = count / fragment.norm
+            totals = [t + weight * w for t, w in zip(totals, self._hyperplane(type_id, bits))]
+        signature = 0
+        for bit, total in enumerate(totals):
+            if total >= 0:
+                signature |= 1 << bit
+        return signature
+
+    def _hyperplane(self, type_id: int, bits: int) -> List[float]:
+        """Gaussian hyperplane components for one node type, fixed per type."""
+        weights = self._hyperplanes.get(type_id)
+        if weights is None:
+            rng = random.Random(type_id)
+            weights = [rng.gauss(0.0, 1.0) for _ in range(bits)]
+            self._hyperplanes[type_id] = weights
+        return weights
+
+    def _type_id(self, node: ast.AST) -> int:
+        """Stable ID of a node's type, independent of hash randomization."""
+        node_type = type(node)
+        type_id = self._type_ids.get(node_type)
+        if type_id is None:
+            type_id = zlib.crc32(node_type.__name__.encode())
+            self._type_ids[node_type] = type_id
+        return type_id
+
+    def _make_group(self, members: List[int], similarity: float, kind: str) -> Dict[str, Any]:
+        """Build a clone group from fragment positions."""
+        fragments = sorted(
+            (self.fragments[position] for position in members),
+            key=lambda f: (f.file_path, f.start_line)
+        )
+        return {
+            'fragments': [{
+                'file': fragment.file_path,
+                'start_line': fragment.start_line,
+                'end_line': fragment.end_line
+            } for fragment in fragments],
+            'similarity': similarity,
+            'kind': kind
+        }
+
+    @staticmethod
+    def _find(parent: Dict[int, int], position: int) -> int:
+        """Find the root of a union-find set, halving paths along the way."""
+        while parent[position] != position:
+            parent[position] = parent[parent[position]]
+            position = parent[position]
+        return position
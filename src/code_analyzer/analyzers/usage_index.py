@@ -0,0 +1,201 @@
+"""
+Persistent usage index for answering "who uses X" queries.
+Stores every analyzed definition and the sites referring to it in a local
+SQLite database, so lookups need no re-analysis.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Where ``code-analyzer refs`` looks for the index by default
+DEFAULT_USAGE_INDEX = ".code-analyzer/usage.sqlite"
+
+
+@dataclass
+class IndexedSymbol:
+    """A definition stored in the usage index."""
+    qualname: str
+    name: str
+    type: str
+    file: str
+    line: int
+    live: bool
+
+
+@dataclass
+class ReferenceSite:
+    """A place in the code that refers to an indexed definition."""
+    file: str
+    line: int
+    scope: str
+
+
+class UsageIndex:
+    """Inverted index from definitions to their reference sites.
+
+    Definitions are keyed by qualified name (``package.module.Class.method``)
+    and also indexed by their bare name. Sites are stored per definition with
+    file paths interned in a separate table to keep the database compact.
+    """
+
+    SCHEMA_VERSION = 1
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS symbols (
+            id INTEGER PRIMARY KEY,
+            qualname TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            file_id INTEGER NOT NULL REFERENCES files(id),
+            line INTEGER NOT NULL,
+            live INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS symbols_qualname ON symbols(qualname);
+        CREATE INDEX IF NOT EXISTS symbols_name ON symbols(name);
+        CREATE TABLE IF NOT EXISTS refs (
+            symbol_id INTEGER NOT NULL REFERENCES symbols(id),
+            file_id INTEGER NOT NULL REFERENCES files(id),
+            line INTEGER NOT NULL,
+            scope TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS refs_symbol ON refs(symbol_id);
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open the index, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file
+
+        Raises:
+            ValueError: If the database was written with another schema version
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(self._SCHEMA)
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(self.SCHEMA_VERSION),)
+                )
+        elif row[0] != str(self.SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"Incompatible usage index format in {self.path}")
+
+    def __enter__(self) -> 'UsageIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def replace(self, symbols: Iterable[IndexedSymbol],
+                references: Iterable[Tuple[int, ReferenceSite]]):
+        """Replace the whole index in a single transaction.
+
+        Args:
+            symbols: Definitions to store
+            references: ``(position, site)`` pairs, where ``position`` is the
+                index of the referenced definition in ``symbols``
+        """
+        file_ids: Dict[str, int] = {}
+
+        def file_id(path: str) -> int:
+            identifier = file_ids.get(path)
+            if identifier is None:
+                identifier = len(file_ids) + 1
+                file_ids[path] = identifier
+            return identifier
+
+        symbol_rows = [
+            (position + 1, symbol.qualname, symbol.name, symbol.type,
+             file_id(symbol.file), symbol.line, int(symbol.live))
+            for position, symbol in enumerate(symbols)
+        ]
+        reference_rows = [
+            (position + 1, file_id(site.file), site.line, site.scope)
+            for position, site in references
+        ]
+        with self.connection:
+            self.connection.execute("DELETE FROM refs")
+            self.connection.execute("DELETE FROM symbols")
+            self.connection.execute("DELETE FROM files")
+            self.connection.executemany(
+                "INSERT INTO files (id, path) VALUES (?, ?)",
+                [(identifier, path) for path, identifier in file_ids.items()]
+            )
+            self.connection.executemany(
+                "INSERT INTO symbols (id, qualname, name, type, file_id, line, live) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                symbol_rows
+            )
+            self.connection.executemany(
+                "INSERT INTO refs (symbol_id, file_id, line, scope) VALUES (?, ?, ?, ?)",
+                reference_rows
+            )
+
+    def find_symbols(self, name: str) -> List[IndexedSymbol]:
+        """Find definitions by qualified name or by a dotted suffix of it.
+
+        ``Class.method`` and ``method`` match ``package.module.Class.method``.
+        """
+        return [IndexedSymbol(*row[1:]) for row in self._symbol_rows_matching(name)]
+
+    def references(self, name: str) -> List[Tuple[IndexedSymbol, List[ReferenceSite]]]:
+        """Get every definition matching ``name`` with its reference sites."""
+        results = []
+        for row in self._symbol_rows_matching(name):
+            sites = self.connection.execute(
+                "SELECT f.path, r.line, r.scope FROM refs r JOIN files f ON f.id = r.file_id "
+                "WHERE r.symbol_id = ? ORDER BY f.path, r.line",
+                (row[0],)
+            ).fetchall()
+            results.append((IndexedSymbol(*row[1:]), [ReferenceSite(*site) for site in sites]))
+        return results
+
+    def _symbol_rows_matching(self, name: str) -> List[tuple]:
+        """Symbol rows, with their IDs, for a qualified name or dotted suffix."""
+        rows = self._symbol_rows("s.qualname = ?", (name,))
+        if rows:
+            return rows
+        suffix = '.' + name
+        return [
+            row for row in self._symbol_rows("s.name = ?", (name.rpartition('.')[2],))
+            if row[1].endswith(suffix)
+        ]
+
+    def _symbol_rows(self, condition: str, parameters: tuple) -> List[tuple]:
+        """Select symbol rows as ``(id, qualname, name, type, file, line, live)``."""
+        rows = self.connection.execute(
+            "SELECT s.id, s.qualname, s.name, s.type, f.path, s.line, s.live "
+            "FROM symbols s JOIN files f ON f.id = s.file_id "
+            f"WHERE {condition} ORDER BY s.qualname, f.path, s.line",
+            parameters
+        ).fetchall()
+        return [row[:6] + (bool(row[6]),) for row in rows]
+
+
+def open_usage_index(path: Optional[Union[str, Path]] = None) -> UsageIndex:
+    """Open an existing usage index.
+
+    Raises:
+        FileNotFoundError: If no index has been written at ``path``
+    """
+    path = Path(path or DEFAULT_USAGE_INDEX)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No usage index at {path}; run 'code-analyzer analyze --usage-index {path}' first"
+        )
+    return UsageIndex(path)
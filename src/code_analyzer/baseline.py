@@ -0,0 +1,158 @@
+"""
+Baseline of known findings.
+Findings are identified by fingerprints of their normalized source rather
+than line numbers, so a baseline keeps matching while code moves around.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from .analyzers.file_loader import FileLoader
+
+
+class Baseline:
+    """Set of finding fingerprints to suppress.
+
+    Analyzers ask ``is_new_*`` as they produce each finding and leave out
+    the baselined ones, so those are never added to results or handed to a
+    formatter. Every fingerprint computed, suppressed or not, is remembered
+    in ``seen`` so the baseline can be rewritten from a run.
+    """
+
+    VERSION = 1
+
+    def __init__(self, fingerprints: Iterable[str] = (), root: Optional[Union[str, Path]] = None,
+                 file_loader: Optional[FileLoader] = None):
+        """Initialize the baseline.
+
+        Args:
+            fingerprints: Fingerprints of findings to suppress
+            root: Analyzed root; file paths are fingerprinted relative to it
+            file_loader: Loader to read finding source with
+        """
+        self.fingerprints: Set[str] = set(fingerprints)
+        self.root = Path(root).resolve() if root else None
+        if self.root is not None and self.root.is_file():
+            self.root = self.root.parent
+        self.file_loader = file_loader or FileLoader()
+        self.seen: Set[str] = set()
+        self.suppressed = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path], root: Optional[Union[str, Path]] = None,
+             file_loader: Optional[FileLoader] = None) -> 'Baseline':
+        """Load a baseline file written by ``save``.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a baseline of this version
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported baseline format in {path}")
+        return cls(data.get("fingerprints", []), root=root, file_loader=file_loader)
+
+    def save(self, path: Union[str, Path]) -> int:
+        """Write the fingerprints of every finding seen so far.
+
+        Returns:
+            int: Number of fingerprints written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "fingerprints": sorted(self.seen)}, f, indent=0)
+        os.replace(temporary, path)
+        return len(self.seen)
+
+    def is_new_function(self, file_path: Union[str, Path], function: Dict[str, Any]) -> bool:
+        """Tell whether a function over the complexity threshold should be reported."""
+        return self._is_new(self.function_fingerprint(file_path, function))
+
+    def is_new_symbol(self, item: Dict[str, Any]) -> bool:
+        """Tell whether an unused symbol should be reported."""
+        return self._is_new(self.symbol_fingerprint(item))
+
+    def is_new_group(self, kind: str, group: Dict[str, Any]) -> bool:
+        """Tell whether a clone group should be reported.
+
+        Args:
+            kind: Result key of the group, ``similar_fragments`` or ``structural_clones``
+            group: Clone group with its fragments
+        """
+        return self._is_new(self.group_fingerprint(kind, group))
+
+    def is_new_cycle(self, modules: Iterable[str]) -> bool:
+        """Tell whether an import cycle between modules should be reported."""
+        return self._is_new(_digest("cycle", *sorted(modules)))
+
+    def function_fingerprint(self, file_path: Union[str, Path], function: Dict[str, Any]) -> str:
+        """Fingerprint a function by file, qualified name and body."""
+        path = str(file_path)
+        return _digest(
+            "complexity",
+            self._relative(path),
+            function.get("qualname") or function.get("name", ""),
+            self._content(path, function.get("line"), function.get("end_line"))
+        )
+
+    def symbol_fingerprint(self, item: Dict[str, Any]) -> str:
+        """Fingerprint an unused symbol by type, file, name and source."""
+        return _digest(
+            item.get("type", ""),
+            self._relative(item.get("file", "")),
+            item.get("name", ""),
+            self._content(item.get("file", ""), item.get("line"), item.get("end_line"))
+        )
+
+    def group_fingerprint(self, kind: str, group: Dict[str, Any]) -> str:
+        """Fingerprint a clone group by its first fragment and the set of the others."""
+        fragments = [
+            _digest(self._relative(f.get("file", "")),
+                    self._content(f.get("file", ""), f.get("start_line"), f.get("end_line")))
+            for f in group.get("fragments", [])
+        ]
+        return _digest(kind, group.get("kind", ""), *fragments[:1], *sorted(fragments[1:]))
+
+    def _is_new(self, fingerprint: str) -> bool:
+        """Record a fingerprint and tell whether its finding should be reported."""
+        self.seen.add(fingerprint)
+        if fingerprint in self.fingerprints:
+            self.suppressed += 1
+            return False
+        return True
+
+    def _relative(self, file_path: str) -> str:
+        """Path of a file relative to the root, when it is inside it."""
+        path = Path(file_path).resolve()
+        if self.root is not None:
+            try:
+                return path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return path.as_posix()
+
+    def _content(self, file_path: str, start_line: Optional[int], end_line: Optional[int]) -> str:
+        """Source of a line range without indentation, blank lines or comment lines."""
+        if not file_path or not start_line:
+            return ""
+        try:
+            text = self.file_loader.load(file_path).lines(start_line, end_line or start_line)
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            return ""
+        lines: List[str] = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                lines.append(line)
+        return "\n".join(lines)
+
+
+def _digest(*parts: str) -> str:
+    """Hash parts that cannot run into each other."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
@@ -4,5 +4,7 @@ Commands package for code analyzer.
 
 from .analyze import AnalyzeCommand
 from .command_registry import registry
+from .refs import RefsCommand
+from .trends import TrendsCommand
 
-__all__ = ["registry", "AnalyzeCommand"]
+__all__ = ["registry", "AnalyzeCommand", "RefsCommand", "TrendsCommand"]
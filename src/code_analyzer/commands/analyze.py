@@ -2,11 +2,11 @@
 Analyze command for code analysis
 """
 
-import csv
 import json
 import os
 import sys
 import traceback
+from contextlib import nullcontext
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional
@@ -14,9 +14,23 @@ from typing import Any, Dict, Iterator, List, Optional
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.console import Console
 
-from ..analyzers import ComplexityAnalyzer, DeadCodeAnalyzer, SimilarityAnalyzer
+from ..analyzers import (
+    ArchitectureAnalyzer,
+    ComplexityAnalyzer,
+    DeadCodeAnalyzer,
+    FileLoader,
+    SimilarityAnalyzer,
+)
+from ..baseline import Baseline
 from ..config import ConfigLoader
+from ..formatters.columnar import ColumnarFormatter
 from ..formatters.console import ConsoleFormatter
+from ..formatters.base_formatter import StreamingFormatter
+from ..formatters.csv_formatter import CsvFormatter
+from ..formatters.html import HtmlFormatter
+from ..formatters.sarif import SarifFormatter
+from ..metrics.aggregate import MetricsAggregator
+from ..results_store import ResultsStore
 from .base_command import BaseCommand
 
 
@@ -33,7 +47,6 @@ class AnalyzeCommand(BaseCommand):
         super().__init__()
         self.error_console = Console(file=sys.stderr)
         self.console = Console()
-        self.formatter = ConsoleFormatter()
         
         # Initialize default config
         self.config = {
@@ -41,7 +54,8 @@ class AnalyzeCommand(BaseCommand):
                 "exclude_patterns": [],
                 "min_complexity": 10,
                 "dead_code": {"enabled": True},
-                "similarity": {"enabled": True}
+                "similarity": {"enabled": True},
+                "architecture": {"enabled": True}
             },
             "output": {
                 "verbose": False,
@@ -63,14 +77,34 @@ class AnalyzeCommand(BaseCommand):
             self.config["output"]["verbose"] = True
         if options.get("output"):
             self.config["output"]["format"] = options["output"]
+        if options.get("output_file"):
+            self.config["output"]["file"] = options["output_file"]
         if options.get("min_complexity"):
             self.config["analysis"]["min_complexity"] = options["min_complexity"]
         if options.get("exclude"):
             self.config["analysis"]["exclude_patterns"].extend(options["exclude"])
+        if options.get("baseline"):
+            self.config["output"]["baseline"] = options["baseline"]
+        if options.get("update_baseline"):
+            self.config["output"]["update_baseline"] = True
+        if options.get("max_rows") is not None:
+            self.config["output"]["max_rows"] = options["max_rows"]
+        if options.get("export_console"):
+            self.config["output"]["export"] = options["export_console"]
+        if options.get("usage_index"):
+            self.config["analysis"].setdefault("dead_code", {"enabled": True})
+            self.config["analysis"]["dead_code"]["usage_index"] = options["usage_index"]
         
-        self.complexity_analyzer = ComplexityAnalyzer(self.config)
-        self.dead_code_analyzer = DeadCodeAnalyzer(self.config)
-        self.similarity_analyzer = SimilarityAnalyzer(self.config)
+        self.formatter = ConsoleFormatter(self.config)
+
+        # One loader for all analyzers so each file is read and decoded once
+        self.file_loader = FileLoader(
+            max_bytes=self.config["analysis"].get("file_cache_mb", 64) * 1024 * 1024
+        )
+        self.complexity_analyzer = ComplexityAnalyzer(self.config, self.file_loader)
+        self.dead_code_analyzer = DeadCodeAnalyzer(self.config, self.file_loader)
+        self.similarity_analyzer = SimilarityAnalyzer(self.config, self.file_loader)
+        self.architecture_analyzer = ArchitectureAnalyzer(self.config, self.file_loader)
         self.target_path: Optional[Path] = None
         self.had_errors = False
 
@@ -103,17 +137,36 @@ class AnalyzeCommand(BaseCommand):
             self._validate_setup()
             
             results = {}
+            output_format = self.config["output"]["format"]
+            track_trends = self.config.get("reports", {}).get("track_trends")
+            generate_html = (
+                self.config.get("reports", {}).get("generate_html") and output_format != "html"
+            )
+            # CSV, SARIF and HTML are written as results come in instead of at the end
+            stream_formatter = self._streaming_formatter(output_format)
+            keep_files = stream_formatter is None or track_trends or generate_html
+            baseline = self._load_baseline()
+            # Analyzers leave out baselined findings as they produce them
+            for analyzer in (self.complexity_analyzer, self.dead_code_analyzer,
+                             self.similarity_analyzer, self.architecture_analyzer):
+                analyzer.baseline = baseline
             
-            with Progress() as progress:
+            with Progress(console=self.error_console if stream_formatter else None) as progress, \
+                    (stream_formatter or nullcontext()):
                 task = progress.add_task("Analyzing...", total=len(self.python_files))
                 
-                # Run complexity analysis
+                # Run complexity analysis, aggregating metrics as files come in
                 complexity_results = {}
+                aggregator = MetricsAggregator()
                 for file_path in self.python_files:
                     try:
                         file_results = self.complexity_analyzer.analyze(file_path)
                         if file_results:
-                            complexity_results["files"] = complexity_results.get("files", []) + [file_results]
+                            aggregator.add_file(file_results)
+                            if stream_formatter:
+                                stream_formatter.write_file(file_results)
+                            if keep_files:
+                                complexity_results.setdefault("files", []).append(file_results)
                     except Exception as e:
                         self._log_error(f"Error analyzing {file_path}: {str(e)}")
                         if self.config["output"]["verbose"]:
@@ -123,6 +176,11 @@ class AnalyzeCommand(BaseCommand):
                 
                 if complexity_results:
                     results.update(complexity_results)
+                if len(aggregator):
+                    # One summary shared by every formatter and exporter
+                    results["summary"] = aggregator.summary()
+                    if stream_formatter:
+                        stream_formatter.write_summary(results["summary"])
                 
                 # Run dead code analysis if enabled
                 if self.config["analysis"]["dead_code"]["enabled"]:
@@ -130,6 +188,8 @@ class AnalyzeCommand(BaseCommand):
                         dead_code_results = self.dead_code_analyzer.analyze(self.python_files)
                         if dead_code_results:
                             results.update(dead_code_results)
+                            if stream_formatter:
+                                stream_formatter.write_dead_code(dead_code_results)
                     except Exception as e:
                         self._log_error(f"Error in dead code analysis: {str(e)}")
                         if self.config["output"]["verbose"]:
@@ -141,17 +201,44 @@ class AnalyzeCommand(BaseCommand):
                         similarity_results = self.similarity_analyzer.analyze(self.python_files)
                         if similarity_results:
                             results.update(similarity_results)
+                            if stream_formatter:
+                                stream_formatter.write_similarity(similarity_results)
                     except Exception as e:
                         self._log_error(f"Error in similarity analysis: {str(e)}")
                         if self.config["output"]["verbose"]:
                             self._log_error(traceback.format_exc())
+
+                # Run architecture analysis if enabled
+                if self.config["analysis"].get("architecture", {}).get("enabled", True):
+                    try:
+                        architecture_results = self.architecture_analyzer.analyze(self.python_files)
+                        if architecture_results:
+                            results.update(architecture_results)
+                            if stream_formatter:
+                                stream_formatter.write_architecture(architecture_results)
+                    except Exception as e:
+                        self._log_error(f"Error in architecture analysis: {str(e)}")
+                        if self.config["output"]["verbose"]:
+                            self._log_error(traceback.format_exc())
                             
-            # Format and output results
-            if results:
-                if self.config["output"]["format"] == "json":
+            if output_format == "html":
+                self.error_console.print(f"Wrote HTML report to {self._html_report_path()}")
+
+            if baseline:
+                self._finish_baseline(baseline)
+
+            if results and track_trends:
+                self._record_history(results)
+
+            if results and generate_html:
+                self._write_html_report(results)
+
+            # Format and output results; streamed formats have been written already
+            if results and stream_formatter is None:
+                if output_format == "json":
                     print(json.dumps(results, indent=2))
-                elif self.config["output"]["format"] == "csv":
-                    self._write_csv(results)
+                elif output_format == "columnar":
+                    self._write_columnar(results)
                 else:
                     self.formatter.format(results)
                     
@@ -163,6 +250,83 @@ class AnalyzeCommand(BaseCommand):
                 self._log_error(traceback.format_exc())
             return 1
 
+    def _streaming_formatter(self, output_format: str) -> Optional[StreamingFormatter]:
+        """Create the formatter for formats written while analysis runs, if any."""
+        output_file = self.config["output"].get("file")
+        if output_format == "csv":
+            return CsvFormatter(output_file)
+        if output_format == "sarif":
+            return SarifFormatter(
+                output_file,
+                root=self.target_path,
+                min_complexity=self.config["analysis"]["min_complexity"]
+            )
+        if output_format == "html":
+            return HtmlFormatter(self._html_report_path())
+        return None
+
+    def _html_report_path(self) -> str:
+        """Path of the HTML report: the output file, or report.html in the reports directory."""
+        if self.config["output"]["format"] == "html" and self.config["output"].get("file"):
+            return self.config["output"]["file"]
+        reports = self.config.get("reports", {})
+        return os.path.join(reports.get("output_dir") or "reports", "report.html")
+
+    def _write_html_report(self, results: Dict[str, Any]) -> None:
+        """Write the HTML report of collected results next to the main output.
+
+        Args:
+            results: Analysis results to write
+        """
+        path = self._html_report_path()
+        try:
+            with HtmlFormatter(path) as formatter:
+                formatter.format(results)
+            self.error_console.print(f"Wrote HTML report to {path}")
+        except OSError as e:
+            self._log_error(f"Error writing HTML report to {path}: {str(e)}")
+            self.had_errors = True
+
+    def _load_baseline(self) -> Optional[Baseline]:
+        """Load the baseline of known findings, or start an empty one to update."""
+        path = self.config["output"].get("baseline")
+        if not path:
+            return None
+        if self.config["output"].get("update_baseline") or not os.path.exists(path):
+            return Baseline(root=self.target_path, file_loader=self.file_loader)
+        return Baseline.load(path, root=self.target_path, file_loader=self.file_loader)
+
+    def _finish_baseline(self, baseline: Baseline) -> None:
+        """Write the baseline when updating it, and report suppressed findings."""
+        path = self.config["output"]["baseline"]
+        if self.config["output"].get("update_baseline"):
+            try:
+                count = baseline.save(path)
+                self.error_console.print(f"Wrote {count} finding fingerprints to {path}")
+            except OSError as e:
+                self._log_error(f"Error writing baseline to {path}: {str(e)}")
+                self.had_errors = True
+        elif baseline.suppressed:
+            self.error_console.print(f"Suppressed {baseline.suppressed} findings listed in {path}")
+
+    def _record_history(self, results: Dict[str, Any]) -> None:
+        """Store the results of this run for trend queries.
+
+        Args:
+            results: Analysis results to store
+        """
+        reports = self.config["reports"]
+        path = reports.get("history_db") or os.path.join(
+            reports.get("output_dir") or "reports", "history.sqlite"
+        )
+        try:
+            with ResultsStore(path) as store:
+                store.record_run(results, root=self.target_path,
+                                 max_runs=reports.get("max_reports", 10))
+        except Exception as e:
+            self._log_error(f"Error recording results history in {path}: {str(e)}")
+            self.had_errors = True
+
     def _log_error(self, message: str) -> None:
         """Log an error message.
         
@@ -191,6 +355,12 @@ class AnalyzeCommand(BaseCommand):
         if not self.python_files:
             raise ValueError(f"No Python files found in {self.target_path}")
 
+        similarity = self.config["analysis"].get("similarity", {})
+        saved_index = similarity.get("baseline_index") or similarity.get("save_index")
+        if similarity.get("streaming") and saved_index:
+            raise ValueError("Invalid similarity configuration: baseline_index and save_index "
+                             "are not supported with streaming")
+
     def _find_python_files(self) -> Iterator[Path]:
         """Find Python files to analyze.
         
@@ -219,21 +389,16 @@ class AnalyzeCommand(BaseCommand):
                     
                 yield file_path
 
-    def _write_csv(self, results: Dict[str, Any]) -> None:
-        """Write results to CSV.
-        
+    def _write_columnar(self, results: Dict[str, Any]) -> None:
+        """Write function-level metrics to a columnar file.
+
         Args:
             results: Analysis results to write
         """
-        if "files" not in results:
-            return
-            
-        writer = csv.DictWriter(sys.stdout, fieldnames=["file", "complexity", "maintainability"])
-        writer.writeheader()
-        
-        for file_result in results["files"]:
-            writer.writerow({
-                "file": file_result["file_path"],
-                "complexity": file_result.get("cyclomatic_complexity", 0),
-                "maintainability": file_result.get("maintainability_index", 100)
-            })
+        formatter = ColumnarFormatter(self.config["output"].get("file") or "function_metrics")
+        if not self.config["output"].get("file"):
+            formatter.output_path = formatter.output_path.with_suffix(
+                ".arrow" if formatter.use_arrow else ".cols"
+            )
+        formatter.format(results)
+        self.error_console.print(f"Wrote function metrics to {formatter.output_path}")
@@ -6,6 +6,8 @@ from typing import Dict, Type, Any, Optional
 
 from .analyze import AnalyzeCommand
 from .base_command import BaseCommand
+from .refs import RefsCommand
+from .trends import TrendsCommand
 
 
 class CommandRegistry:
@@ -15,6 +17,8 @@ class CommandRegistry:
         """Initialize the registry"""
         self._commands: Dict[str, Type[BaseCommand]] = {}
         self.register_command("analyze", AnalyzeCommand)
+        self.register_command("refs", RefsCommand)
+        self.register_command("trends", TrendsCommand)
 
     def register_command(self, name: str, command_class: Type[BaseCommand]) -> None:
         """Register a new command.
@@ -0,0 +1,76 @@
+"""
+Refs command for querying the usage index
+"""
+
+import json
+import sys
+from dataclasses import asdict
+from typing import Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from ..analyzers.usage_index import DEFAULT_USAGE_INDEX, open_usage_index
+from .base_command import BaseCommand
+
+
+class RefsCommand(BaseCommand):
+    """Command to list the reference sites of a symbol"""
+
+    def __init__(self, index_path: Optional[str] = None, output: str = "console", **options):
+        """Initialize the refs command.
+
+        Args:
+            index_path: Path of the usage index written by ``analyze``
+            output: Output format, ``console`` or ``json``
+            **options: Additional options from CLI
+        """
+        super().__init__()
+        self.error_console = Console(file=sys.stderr)
+        self.index_path = index_path or DEFAULT_USAGE_INDEX
+        self.output = output
+
+    def run(self, name: str) -> int:
+        """Print every definition matching ``name`` and the sites using it.
+
+        Args:
+            name: Qualified name, or a dotted suffix such as ``Class.method``
+
+        Returns:
+            int: Exit code, 1 if nothing matches
+        """
+        try:
+            with open_usage_index(self.index_path) as index:
+                matches = index.references(name)
+        except Exception as e:
+            self.error_console.print(f"[red]Error:[/red] {str(e)}")
+            return 1
+
+        if self.output == "json":
+            print(json.dumps([
+                {**asdict(symbol), "references": [asdict(site) for site in sites]}
+                for symbol, sites in matches
+            ], indent=2))
+            return 0 if matches else 1
+
+        if not matches:
+            self._print_warning(f"No symbol named {name} in the usage index")
+            return 1
+
+        for symbol, sites in matches:
+            status = "[green]used[/green]" if symbol.live else "[red]unused[/red]"
+            self.console.print(
+                f"\n[bold]{symbol.qualname}[/bold] ({symbol.type}) "
+                f"{symbol.file}:{symbol.line} {status}"
+            )
+            if not sites:
+                self.console.print("  No references")
+                continue
+            table = Table(show_header=True)
+            table.add_column("File", style="cyan")
+            table.add_column("Line", justify="right")
+            table.add_column("Scope")
+            for site in sites:
+                table.add_row(site.file, str(site.line), site.scope)
+            self.console.print(table)
+        return 0
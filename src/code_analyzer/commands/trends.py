@@ -0,0 +1,67 @@
+"""
+Trends command for querying the results history
+"""
+
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from ..results_store import ResultsStore
+from .base_command import BaseCommand
+
+# History written by ``analyze`` when ``reports.track_trends`` is set
+DEFAULT_HISTORY_DB = "reports/history.sqlite"
+
+
+class TrendsCommand(BaseCommand):
+    """Command to list the functions whose metrics grew most over recent runs"""
+
+    def __init__(self, db_path: str = DEFAULT_HISTORY_DB, runs: int = 10, limit: int = 10,
+                 metric: str = "cyclomatic_complexity", **options):
+        """Initialize the trends command.
+
+        Args:
+            db_path: Path of the results history database
+            runs: Number of most recent runs to compare
+            limit: Maximum number of functions to list
+            metric: Function metric to compare, one of ``TREND_METRICS``
+            **options: Additional options from CLI
+        """
+        super().__init__()
+        self.error_console = Console(file=sys.stderr)
+        self.db_path = db_path
+        self.runs = runs
+        self.limit = limit
+        self.metric = metric
+
+    def run(self) -> int:
+        """Print the functions with the largest growth.
+
+        Returns:
+            int: Exit code, 1 if the history cannot be read
+        """
+        try:
+            with ResultsStore(self.db_path) as store:
+                growth = store.complexity_growth(
+                    last_runs=self.runs, limit=self.limit, metric=self.metric
+                )
+        except Exception as e:
+            self.error_console.print(f"[red]Error:[/red] {str(e)}")
+            return 1
+
+        if not growth:
+            self.console.print(f"No function's {self.metric} grew in the last {self.runs} runs")
+            return 0
+
+        table = Table(title=f"Largest {self.metric} growth over the last {self.runs} runs")
+        table.add_column("File", style="cyan")
+        table.add_column("Function")
+        table.add_column("Before", justify="right")
+        table.add_column("After", justify="right")
+        table.add_column("Growth", justify="right", style="red")
+        for row in growth:
+            table.add_row(row["path"], row["name"], str(row["start"]), str(row["end"]),
+                          f"+{row['growth']}")
+        self.console.print(table)
+        return 0
@@ -27,12 +27,22 @@ class DeadCodeConfig:
     min_references: int = 1
     ignore_patterns: list = field(default_factory=lambda: ["**/tests/**", "setup.py", "conftest.py"])
     ignore_names: list = field(default_factory=lambda: ["__init__", "__main__", "main", "setup"])
+    ignore_decorators: list = field(default_factory=list)
+    entry_points: list = field(default_factory=list)
+    console_scripts: bool = True
+    workers: int = 1
+    cache_dir: Optional[str] = None
+    usage_index: Optional[str] = None
 
     def __post_init__(self):
         if self.ignore_patterns is None:
             self.ignore_patterns = []
         if self.ignore_names is None:
             self.ignore_names = []
+        if self.ignore_decorators is None:
+            self.ignore_decorators = []
+        if self.entry_points is None:
+            self.entry_points = []
 
 
 @dataclass
@@ -52,6 +62,18 @@ class SimilarityConfig:
     ignore_patterns: list = field(default_factory=lambda: ["**/tests/**", "setup.py", "conftest.py"])
     ignore_names: list = field(default_factory=lambda: ["__init__", "__main__", "main", "setup"])
     lsh_config: LSHConfig = field(default_factory=LSHConfig)
+    shingle_size: int = 3
+    weighted_minhash: bool = True
+    streaming: bool = False
+    max_index_entries: int = 1_000_000
+    spill_dir: Optional[str] = None
+    verify_cache_size: int = 1024
+    structural: bool = False
+    structural_threshold: float = 0.95
+    workers: int = 1
+    verify_chunk_size: int = 10000
+    baseline_index: Optional[str] = None
+    save_index: Optional[str] = None
 
     def __post_init__(self):
         if self.ignore_patterns is None:
@@ -78,6 +100,12 @@ class ComplexityConfig:
             self.ignore_names = []
 
 
+@dataclass
+class ArchitectureConfig:
+    """Architecture analysis configuration."""
+    enabled: bool = True
+
+
 @dataclass
 class AnalysisConfig:
     """Analysis configuration settings."""
@@ -86,9 +114,11 @@ class AnalysisConfig:
     exclude_patterns: list = field(default_factory=list)
     analyze_tests: bool = False
     test_patterns: list = field(default_factory=list)
+    file_cache_mb: int = 64
     dead_code: DeadCodeConfig = field(default_factory=DeadCodeConfig)
     complexity: ComplexityConfig = field(default_factory=ComplexityConfig)
     similarity: SimilarityConfig = field(default_factory=SimilarityConfig)
+    architecture: ArchitectureConfig = field(default_factory=ArchitectureConfig)
 
     def __post_init__(self):
         if self.dead_code is None:
@@ -97,6 +127,8 @@ class AnalysisConfig:
             self.complexity = ComplexityConfig()
         if self.similarity is None:
             self.similarity = SimilarityConfig()
+        if self.architecture is None:
+            self.architecture = ArchitectureConfig()
 
 
 @dataclass
@@ -107,6 +139,10 @@ class OutputConfig:
     verbose: bool = False
     show_progress: bool = True
     show_warnings: bool = True
+    max_rows: int = 20
+    export: Optional[str] = None
+    baseline: Optional[str] = None
+    update_baseline: bool = False
     colors: Dict[str, Any] = field(
         default_factory=lambda: {
             "enabled": True,
@@ -137,6 +173,7 @@ class ReportsConfig:
     generate_html: bool = True
     track_trends: bool = True
     max_reports: int = 10
+    history_db: Optional[str] = None
 
 
 @dataclass
@@ -2,7 +2,20 @@
 Formatters package for code analyzer.
 """
 
-from .base_formatter import BaseFormatter
+from .base_formatter import BaseFormatter, StreamingFormatter
+from .columnar import ColumnarFormatter, ColumnarTable
 from .console import ConsoleFormatter
+from .csv_formatter import CsvFormatter
+from .html import HtmlFormatter
+from .sarif import SarifFormatter
 
-__all__ = ["BaseFormatter", "ConsoleFormatter"]
+__all__ = [
+    "BaseFormatter",
+    "ColumnarFormatter",
+    "ColumnarTable",
+    "ConsoleFormatter",
+    "CsvFormatter",
+    "HtmlFormatter",
+    "SarifFormatter",
+    "StreamingFormatter",
+]
@@ -3,13 +3,15 @@ Base formatter class for output formatting
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
+from ..metrics.aggregate import summarize
+
 
 class BaseFormatter(ABC):
     """Base class for all formatters"""
@@ -68,3 +70,152 @@ class BaseFormatter(ABC):
             return f"{minutes:.1f}m"
         hours = minutes / 60
         return f"{hours:.1f}h"
+
+
+class StreamingFormatter(BaseFormatter):
+    """Base class for formatters that write results as analyzers produce them.
+
+    ``analyze`` calls ``write_file`` for each file's complexity results,
+    ``write_summary`` with their aggregate statistics, the other
+    ``write_*`` methods once per analyzer, then ``close``.
+    Formatters override the parts of the results they output.
+    """
+
+    def __enter__(self) -> 'StreamingFormatter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def format(self, data: Dict[str, Any]) -> None:
+        """Write complete analysis results"""
+        for file_result in data.get("files", []):
+            self.write_file(file_result)
+        if data.get("files"):
+            self.write_summary(summarize(data))
+        self.write_dead_code(data)
+        self.write_similarity(data)
+        self.write_architecture(data)
+
+    def write_file(self, file_result: Dict[str, Any]) -> None:
+        """Write the complexity results of one file"""
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        """Write aggregate statistics of all files, as built by ``MetricsAggregator``"""
+
+    def write_dead_code(self, results: Dict[str, Any]) -> None:
+        """Write dead code results"""
+
+    def write_similarity(self, results: Dict[str, Any]) -> None:
+        """Write similarity and structural clone results"""
+
+    def write_architecture(self, results: Dict[str, Any]) -> None:
+        """Write architecture results"""
+
+    def close(self) -> None:
+        """Finish the output"""
+
+
+# Columns of the row-per-finding formats; cells that do not apply are empty
+ROW_COLUMNS = [
+    "record",
+    "file",
+    "line",
+    "end_line",
+    "name",
+    "cyclomatic_complexity",
+    "cognitive_complexity",
+    "loc",
+    "maintainability_index",
+    "group",
+    "similarity",
+]
+
+# Dead code result keys and the record type of their rows
+_DEAD_CODE_RECORDS = {
+    "unused_classes": "unused_class",
+    "unused_functions": "unused_function",
+    "unused_methods": "unused_method",
+    "unused_variables": "unused_variable",
+    "unused_imports": "unused_import",
+}
+
+
+class RowFormatter(StreamingFormatter):
+    """Base class for formatters writing one row per file, function and finding.
+
+    Rows are lists in ``ROW_COLUMNS`` order. The ``record`` column tells
+    them apart: ``file``, ``function``, ``unused_<type>``,
+    ``similar_fragment`` or ``structural_clone``. Subclasses write rows
+    in ``_write_rows``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._groups = 0
+
+    def write_file(self, file_result: Dict[str, Any]) -> None:
+        """Write the row of one file and the rows of its functions"""
+        path = file_result.get("file_path", "")
+        rows = [self._row(
+            "file", path,
+            cyclomatic_complexity=file_result.get("cyclomatic_complexity", 0),
+            cognitive_complexity=file_result.get("cognitive_complexity", 0),
+            loc=file_result.get("loc", 0),
+            maintainability_index=file_result.get("maintainability_index", 100)
+        )]
+        for function in file_result.get("functions", []):
+            rows.append(self._row(
+                "function", path,
+                line=function.get("line"),
+                end_line=function.get("end_line"),
+                name=function.get("name"),
+                cyclomatic_complexity=function.get("cyclomatic_complexity"),
+                cognitive_complexity=function.get("cognitive_complexity"),
+                loc=function.get("loc"),
+                maintainability_index=function.get("maintainability_index")
+            ))
+        self._write_rows(rows)
+
+    def write_dead_code(self, results: Dict[str, Any]) -> None:
+        """Write one row per unused symbol"""
+        for key, record in _DEAD_CODE_RECORDS.items():
+            self._write_rows(
+                self._row(
+                    record,
+                    item.get("file", ""),
+                    line=item.get("line"),
+                    end_line=item.get("end_line"),
+                    name=item.get("name"),
+                )
+                for item in results.get(key, [])
+            )
+
+    def write_similarity(self, results: Dict[str, Any]) -> None:
+        """Write one row per fragment of each similar or structural clone group"""
+        self._write_groups("similar_fragment", results.get("similar_fragments") or [])
+        self._write_groups("structural_clone", results.get("structural_clones") or [])
+
+    def _write_groups(self, record: str, groups: Iterable[Dict[str, Any]]) -> None:
+        """Write clone groups, numbering groups across calls"""
+        for group in groups:
+            self._groups += 1
+            self._write_rows(
+                self._row(record, fragment.get("file", ""),
+                          line=fragment.get("start_line"), end_line=fragment.get("end_line"),
+                          name=group.get("kind"), group=self._groups,
+                          similarity=round(group.get("similarity", 0), 4))
+                for fragment in group.get("fragments", [])
+            )
+
+    @abstractmethod
+    def _write_rows(self, rows: Iterable[List[Any]]) -> None:
+        """Write rows in ``ROW_COLUMNS`` order"""
+        pass
+
+    @staticmethod
+    def _row(record: str, file: str, **values: Any) -> List[Any]:
+        """Build a row in ``ROW_COLUMNS`` order, with ``None`` for empty cells"""
+        values["record"] = record
+        values["file"] = file
+        return [values.get(column) for column in ROW_COLUMNS]
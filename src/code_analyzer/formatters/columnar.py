@@ -0,0 +1,254 @@
+"""
+Columnar export of function-level metrics.
+Writes one row per function as typed columns, as an Arrow IPC file when
+pyarrow is installed and otherwise in a simple memory-mappable format.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..metrics.aggregate import summarize
+from .base_formatter import BaseFormatter
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # Optional dependency
+    pyarrow = None
+
+# Column names and types of the exported table, in order. ``path_id``
+# indexes the table's path dictionary.
+FUNCTION_COLUMNS: List[Tuple[str, str]] = [
+    ("path_id", "int32"),
+    ("name", "string"),
+    ("line", "int32"),
+    ("cyclomatic_complexity", "int32"),
+    ("cognitive_complexity", "int32"),
+    ("loc", "int32"),
+    ("halstead_volume", "float64"),
+    ("halstead_difficulty", "float64"),
+    ("halstead_effort", "float64"),
+]
+
+_TYPECODES = {"int32": "i", "float64": "d"}
+
+# Native format: magic, header length, JSON header, then 8-byte aligned buffers
+MAGIC = b"CACOLS01"
+_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+
+class ColumnarFormatter(BaseFormatter):
+    """Formatter that writes function metrics to a columnar file."""
+
+    def __init__(self, output_path: Union[str, Path], use_arrow: Optional[bool] = None):
+        """Initialize the formatter.
+
+        Args:
+            output_path: File to write
+            use_arrow: Write Arrow IPC; defaults to whether pyarrow is installed
+
+        Raises:
+            ImportError: If Arrow output is requested without pyarrow
+        """
+        super().__init__()
+        self.output_path = Path(output_path)
+        if use_arrow and pyarrow is None:
+            raise ImportError("Arrow output requires pyarrow to be installed")
+        self.use_arrow = pyarrow is not None if use_arrow is None else use_arrow
+
+    def format(self, results: Dict[str, Any]) -> str:
+        """Write the function metrics of analysis results.
+
+        The aggregate statistics of the results are stored with the table,
+        in the native header or as Arrow schema metadata.
+
+        Args:
+            results: Analysis results with per-file ``functions``
+
+        Returns:
+            str: Format that was written, ``arrow`` or ``native``
+        """
+        paths, columns = self._collect(results)
+        summary = summarize(results)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.use_arrow:
+            self._write_arrow(paths, columns, summary)
+            return "arrow"
+        self._write_native(paths, columns, summary)
+        return "native"
+
+    @staticmethod
+    def _collect(results: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+        """Flatten per-file function metrics into typed column arrays."""
+        columns: Dict[str, Any] = {
+            name: [] if kind == "string" else array(_TYPECODES[kind])
+            for name, kind in FUNCTION_COLUMNS
+        }
+        paths: List[str] = []
+        nan = float("nan")
+        for file_result in results.get("files", []):
+            functions = file_result.get("functions") or []
+            if not functions:
+                continue
+            path_id = len(paths)
+            paths.append(file_result.get("file_path", ""))
+            for function in functions:
+                halstead = function.get("halstead") or {}
+                columns["path_id"].append(path_id)
+                columns["name"].append(function.get("name", ""))
+                columns["line"].append(function.get("line", 0))
+                columns["cyclomatic_complexity"].append(function.get("cyclomatic_complexity", 0))
+                columns["cognitive_complexity"].append(function.get("cognitive_complexity", 0))
+                columns["loc"].append(function.get("loc", 0))
+                columns["halstead_volume"].append(halstead.get("volume", nan))
+                columns["halstead_difficulty"].append(halstead.get("difficulty", nan))
+                columns["halstead_effort"].append(halstead.get("effort", nan))
+        return paths, columns
+
+    def _write_arrow(self, paths: List[str], columns: Dict[str, Any], summary: Dict[str, Any]):
+        """Write an Arrow IPC file with the path column dictionary-encoded."""
+        arrays = {}
+        for name, kind in FUNCTION_COLUMNS:
+            if name == "path_id":
+                arrays["path"] = pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.array(columns[name], pyarrow.int32()),
+                    pyarrow.array(paths, pyarrow.string()),
+                )
+            elif kind == "string":
+                arrays[name] = pyarrow.array(columns[name], pyarrow.string())
+            else:
+                arrays[name] = pyarrow.array(columns[name], getattr(pyarrow, kind)())
+        table = pyarrow.table(arrays, metadata={b"summary": json.dumps(summary).encode("utf-8")})
+        with pyarrow.OSFile(str(self.output_path), "wb") as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def _write_native(self, paths: List[str], columns: Dict[str, Any], summary: Dict[str, Any]):
+        """Write the native format: a JSON header followed by aligned little-endian buffers."""
+        buffers: List[bytes] = []
+        layout = []
+        offset = 0
+
+        def add_buffer(data: bytes) -> Dict[str, int]:
+            nonlocal offset
+            padding = -len(data) % _ALIGNMENT
+            buffers.append(data + b"\0" * padding)
+            location = {"offset": offset, "length": len(data)}
+            offset += len(data) + padding
+            return location
+
+        def add_strings(values: List[str]) -> Dict[str, Any]:
+            encoded = [value.encode("utf-8") for value in values]
+            offsets = array("i", [0])
+            total = 0
+            for value in encoded:
+                total += len(value)
+                offsets.append(total)
+            return {
+                "offsets": add_buffer(_little_endian(offsets)),
+                "data": add_buffer(b"".join(encoded))
+            }
+
+        for name, kind in FUNCTION_COLUMNS:
+            if kind == "string":
+                layout.append({"name": name, "type": kind, **add_strings(columns[name])})
+            else:
+                data = add_buffer(_little_endian(columns[name]))
+                layout.append({"name": name, "type": kind, "data": data})
+        path_layout = add_strings(paths)
+
+        header = json.dumps({
+            "version": 1,
+            "rows": len(columns["path_id"]),
+            "columns": layout,
+            "paths": path_layout,
+            "summary": summary
+        }, separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(MAGIC) + _LENGTH.size + len(header)) % _ALIGNMENT)
+        with open(self.output_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(header)))
+            f.write(header)
+            for data in buffers:
+                f.write(data)
+
+
+class ColumnarTable:
+    """A function metrics table written in the native columnar format.
+
+    The file is memory-mapped; numeric columns are returned as typed
+    ``memoryview`` objects over the mapping, so nothing is copied.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Map a file written by ``ColumnarFormatter``.
+
+        Raises:
+            ValueError: If the file is not in the native columnar format
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"{path} is not a columnar metrics file")
+        header_start = len(MAGIC) + _LENGTH.size
+        (header_length,) = _LENGTH.unpack_from(view, len(MAGIC))
+        header = json.loads(bytes(view[header_start:header_start + header_length]))
+        self._data = view[header_start + header_length:]
+        self._columns = {column["name"]: column for column in header["columns"]}
+        self.num_rows: int = header["rows"]
+        self.column_names = [column["name"] for column in header["columns"]]
+        self.paths = self._strings(header["paths"])
+        # Aggregate statistics; files written before they were stored have none
+        self.summary: Optional[Dict[str, Any]] = header.get("summary")
+
+    def __enter__(self) -> 'ColumnarTable':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def column(self, name: str) -> Union[memoryview, List[str]]:
+        """Get a column: a typed ``memoryview`` for numbers, a list for strings."""
+        column = self._columns[name]
+        if column["type"] == "string":
+            return self._strings(column)
+        data = self._slice(column["data"])
+        if sys.byteorder != "little":
+            values = array(_TYPECODES[column["type"]], data)
+            values.byteswap()
+            return memoryview(values)
+        return data.cast(_TYPECODES[column["type"]])
+
+    def close(self):
+        """Release the mapping; numeric columns must have been released first."""
+        self._data.release()
+        self._mmap.close()
+
+    def _slice(self, location: Dict[str, int]) -> memoryview:
+        """View of one buffer of the data section."""
+        return self._data[location["offset"]:location["offset"] + location["length"]]
+
+    def _strings(self, column: Dict[str, Any]) -> List[str]:
+        """Decode a string column from its offsets and data buffers."""
+        offsets = array("i", bytes(self._slice(column["offsets"])))
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        data = bytes(self._slice(column["data"]))
+        return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+
+def _little_endian(values: array) -> bytes:
+    """Serialize an array in little-endian byte order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
@@ -2,7 +2,9 @@
 Console formatter for rich terminal output
 """
 
-from typing import Any, Dict, Optional
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from rich.columns import Columns
@@ -13,21 +15,52 @@ from rich.text import Text
 from rich.layout import Layout
 from rich.box import Box
 
+from ..metrics.aggregate import PERCENTILES, summarize
 from .base_formatter import BaseFormatter
 
+# Rows shown per table by default; 0 shows every row
+DEFAULT_MAX_ROWS = 20
+
+# Fragments shown per clone group
+MAX_GROUP_FRAGMENTS = 5
+
+# Dead code result keys with the title and name column of their table
+_DEAD_CODE_TABLES = [
+    ("unused_classes", "Unused Classes", "Class Name"),
+    ("unused_functions", "Unused Functions", "Function Name"),
+    ("unused_methods", "Unused Methods", "Method Name"),
+    ("unused_variables", "Unused Variables", "Variable Name"),
+    ("unused_imports", "Unused Imports", "Import Name"),
+]
+
 
 class ConsoleFormatter(BaseFormatter):
-    """Formatter for console output using rich"""
+    """Formatter for console output using rich
+
+    Large result sets are summarized: each table shows at most ``max_rows``
+    rows, picking the worst entries where there is an order, and states how
+    many were left out. Rows are only built for entries that are shown.
+    """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the console formatter.
 
         Args:
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary. ``output.max_rows``
+                limits table rows, ``output.export`` is a ``.html``, ``.svg``
+                or text file to save the rendered output to, and
+                ``analysis.min_complexity`` is the complexity from which
+                functions are listed.
         """
         super().__init__()
         self.config = config or {}
-        self.console = Console(record=True)
+        output = self.config.get("output", {})
+        max_rows = output.get("max_rows")
+        self.max_rows = DEFAULT_MAX_ROWS if max_rows is None else max(max_rows, 0)
+        self.export_path = output.get("export")
+        self.min_complexity = self.config.get("analysis", {}).get("min_complexity", 5)
+        # Recording keeps a copy of everything printed, so only do it to export
+        self.console = Console(record=bool(self.export_path))
         self.project_root = Path.cwd()
 
     def _get_relative_path(self, file_path: str) -> str:
@@ -68,6 +101,31 @@ class ConsoleFormatter(BaseFormatter):
             self.console.print(similarity_panel)
             self.console.print()
 
+        # Structural clone analysis
+        if results.get("structural_clones"):
+            structural_panel = self._format_structural_results(results)
+            self.console.print(structural_panel)
+            self.console.print()
+
+        # Import cycles
+        if results.get("dependency_cycles"):
+            architecture_panel = self._format_architecture_results(results)
+            self.console.print(architecture_panel)
+            self.console.print()
+
+        if self.export_path:
+            self._export(self.export_path)
+
+    def _export(self, path: str) -> None:
+        """Save the recorded output in the format given by the file extension."""
+        suffix = Path(path).suffix.lower()
+        if suffix in (".html", ".htm"):
+            self.console.save_html(path)
+        elif suffix == ".svg":
+            self.console.save_svg(path, title="Code Analysis Results")
+        else:
+            self.console.save_text(path)
+
     def _format_complexity_results(self, results: Dict[str, Any]) -> Panel:
         """Format complexity analysis results.
         
@@ -78,10 +136,11 @@ class ConsoleFormatter(BaseFormatter):
             Panel: Formatted results
         """
         # Create tables
-        performance_table = self._create_performance_table(results)
+        summary = summarize(results)
+        performance_table = self._create_performance_table(results, summary)
         complex_table = self._create_complex_functions_table(results)
         metrics_table = self._create_metrics_table(results)
-        summary_table = self._create_summary_table(results)
+        summary_table = self._create_summary_table(results, summary)
         
         # Create layout
         tables = Columns([
@@ -108,88 +167,25 @@ class ConsoleFormatter(BaseFormatter):
         """
         tables = []
         
-        # Unused classes
-        if results.get("unused_classes"):
-            table = Table(title="Unused Classes")
-            table.add_column("Class Name", style="cyan")
+        for key, title, name_column in _DEAD_CODE_TABLES:
+            symbols = results.get(key)
+            if not symbols:
+                continue
+            table = Table(title=self._title(title, len(symbols)))
+            table.add_column(name_column, style="cyan")
             table.add_column("File", style="blue")
             table.add_column("Line", style="magenta")
-            
-            for cls in results["unused_classes"]:
-                table.add_row(
-                    cls["name"],
-                    str(Path(cls["file"]).relative_to(Path.cwd())),
-                    str(cls["line"])
-                )
+            self._add_rows(table, (
+                (symbol["name"], self._get_relative_path(symbol["file"]), str(symbol["line"]))
+                for symbol in symbols
+            ), len(symbols))
             tables.append(table)
             
-        # Unused functions
-        if results.get("unused_functions"):
-            table = Table(title="Unused Functions")
-            table.add_column("Function Name", style="cyan")
-            table.add_column("File", style="blue")
-            table.add_column("Line", style="magenta")
-            
-            for func in results["unused_functions"]:
-                table.add_row(
-                    func["name"],
-                    str(Path(func["file"]).relative_to(Path.cwd())),
-                    str(func["line"])
-                )
-            tables.append(table)
-            
-        # Unused methods
-        if results.get("unused_methods"):
-            table = Table(title="Unused Methods")
-            table.add_column("Method Name", style="cyan")
-            table.add_column("File", style="blue")
-            table.add_column("Line", style="magenta")
-            
-            for method in results["unused_methods"]:
-                table.add_row(
-                    method["name"],
-                    str(Path(method["file"]).relative_to(Path.cwd())),
-                    str(method["line"])
-                )
-            tables.append(table)
-            
-        # Unused variables
-        if results.get("unused_variables"):
-            table = Table(title="Unused Variables")
-            table.add_column("Variable Name", style="cyan")
-            table.add_column("File", style="blue")
-            table.add_column("Line", style="magenta")
-            
-            for var in results["unused_variables"]:
-                table.add_row(
-                    var["name"],
-                    var["file"],
-                    str(var["line"])
-                )
-            tables.append(table)
-            
-        # Unused imports
-        if results.get("unused_imports"):
-            table = Table(title="Unused Imports")
-            table.add_column("Import Name", style="cyan")
-            table.add_column("File", style="blue")
-            table.add_column("Line", style="magenta")
-            
-            for imp in results["unused_imports"]:
-                table.add_row(
-                    imp["name"],
-                    str(Path(imp["file"]).relative_to(Path.cwd())),
-                    str(imp["line"])
-                )
-            tables.append(table)
-            
-        # Summary
         total = results.get("total_unused", 0)
-        summary = f"\nTotal unused symbols: {total}"
         
         return Panel(
             Columns(tables),
-            title="Dead Code Analysis",
+            title=f"Dead Code Analysis ({total} unused symbols)",
             border_style="red" if total > 0 else "green"
         )
 
@@ -206,32 +202,34 @@ class ConsoleFormatter(BaseFormatter):
             return Panel("No similar code fragments found")
             
         tables = []
+        groups = results["similar_fragments"]
         
         # Create summary table
         summary_table = Table(title="Similarity Analysis Summary")
         summary_table.add_column("Metric", style="cyan")
         summary_table.add_column("Value", style="blue")
         
-        total_fragments = len(results["similar_fragments"])
-        total_files = len(set(f["file"] for group in results["similar_fragments"] for f in group["fragments"]))
+        total_files = len(set(f["file"] for group in groups for f in group["fragments"]))
         
-        summary_table.add_row("Total Similar Groups", str(total_fragments))
+        summary_table.add_row("Total Similar Groups", str(len(groups)))
         summary_table.add_row("Files Affected", str(total_files))
         tables.append(summary_table)
         
-        # Create detailed fragments table
-        fragments_table = Table(title="Similar Code Fragments")
+        # Create detailed fragments table of the most similar groups
+        fragments_table = Table(title=self._title("Similar Code Fragments", len(groups)))
         fragments_table.add_column("Group", style="cyan")
         fragments_table.add_column("File", style="blue")
         fragments_table.add_column("Lines", style="magenta")
         fragments_table.add_column("Similarity", style="green")
         
-        for i, group in enumerate(results["similar_fragments"], 1):
-            for j, fragment in enumerate(group["fragments"]):
-                file_path = str(Path(fragment["file"]).relative_to(self.project_root))
+        for i, group in enumerate(self._top(groups, _group_rank), 1):
+            for j, fragment in self._group_fragments(group):
+                if fragment is None:
+                    fragments_table.add_row("", f"[dim]... {j} more fragments[/dim]", "", "")
+                    continue
                 fragments_table.add_row(
                     f"Group {i}" if j == 0 else "",
-                    file_path,
+                    self._get_relative_path(fragment["file"]),
                     f"{fragment['start_line']}-{fragment['end_line']}",
                     f"{group['similarity']:.2%}" if j == 0 else ""
                 )
@@ -244,11 +242,77 @@ class ConsoleFormatter(BaseFormatter):
             border_style="blue"
         )
 
-    def _create_performance_table(self, results: Dict[str, Any]) -> Table:
+    def _format_structural_results(self, results: Dict[str, Any]) -> Panel:
+        """Format structural clone analysis results.
+        
+        Args:
+            results: Structural clone analysis results
+            
+        Returns:
+            Panel: Formatted results panel
+        """
+        groups = results["structural_clones"]
+        table = Table(title=self._title("Structural Clones", len(groups)))
+        table.add_column("Group", style="cyan")
+        table.add_column("Kind", style="yellow")
+        table.add_column("File", style="blue")
+        table.add_column("Lines", style="magenta")
+        table.add_column("Similarity", style="green")
+        
+        for i, group in enumerate(self._top(groups, _group_rank), 1):
+            for j, fragment in self._group_fragments(group):
+                if fragment is None:
+                    table.add_row("", "", f"[dim]... {j} more fragments[/dim]", "", "")
+                    continue
+                table.add_row(
+                    f"Group {i}" if j == 0 else "",
+                    group["kind"] if j == 0 else "",
+                    self._get_relative_path(fragment["file"]),
+                    f"{fragment['start_line']}-{fragment['end_line']}",
+                    f"{group['similarity']:.2%}" if j == 0 else ""
+                )
+                
+        return Panel(
+            table,
+            title="Structural Clone Analysis",
+            border_style="blue"
+        )
+
+    def _format_architecture_results(self, results: Dict[str, Any]) -> Panel:
+        """Format import cycle analysis results.
+        
+        Args:
+            results: Architecture analysis results
+            
+        Returns:
+            Panel: Formatted results panel
+        """
+        cycles = results["dependency_cycles"]
+        table = Table(title=self._title("Import Cycles", len(cycles)))
+        table.add_column("Modules", style="cyan")
+        table.add_column("Size", style="magenta")
+        table.add_column("Severity", style="yellow")
+        
+        for cycle in self._top(cycles, lambda cycle: len(cycle["modules"])):
+            table.add_row(
+                " <-> ".join(cycle["modules"]),
+                str(len(cycle["modules"])),
+                cycle["severity"]
+            )
+            
+        return Panel(
+            table,
+            title="Architecture Analysis",
+            border_style="blue"
+        )
+
+    def _create_performance_table(self, results: Dict[str, Any],
+                                  summary: Optional[Dict[str, Any]] = None) -> Table:
         """Create performance metrics table.
         
         Args:
             results: Analysis results
+            summary: Aggregate statistics of the results, computed if not given
             
         Returns:
             Table: Performance metrics table
@@ -257,48 +321,64 @@ class ConsoleFormatter(BaseFormatter):
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="blue")
         
-        total_files = len(results.get("files", []))
-        total_functions = sum(file.get("total_functions", 0) for file in results.get("files", []))
-        total_complexity = sum(file.get("cyclomatic_complexity", 0) for file in results.get("files", []))
+        summary = summary or summarize(results)
+        total_functions = summary["functions"]
+        total_complexity = summary["file_metrics"]["cyclomatic_complexity"]["total"]
         avg_complexity = total_complexity / total_functions if total_functions > 0 else 0
         
-        table.add_row("Total Files", str(total_files))
+        table.add_row("Total Files", str(summary["files"]))
         table.add_row("Total Functions", str(total_functions))
         table.add_row("Total Cyclomatic Complexity", str(total_complexity))
         table.add_row("Average Complexity", f"{avg_complexity:.2f}")
+        cyclomatic = summary["function_metrics"]["cyclomatic_complexity"]
+        table.add_row(*self._percentile_row("Cyclomatic", cyclomatic))
         
         return table
 
     def _create_complex_functions_table(self, results: Dict[str, Any]) -> Table:
         """Create complex functions table.
         
+        Lists the most complex functions at or above ``min_complexity``
+        that are not baselined.
+
         Args:
             results: Analysis results
             
         Returns:
             Table: Complex functions table
         """
-        table = Table(title="Complex Functions")
+        complex_functions = [
+            (file_data, func)
+            for file_data in results.get("files", [])
+            for func in file_data.get("functions", [])
+            if not func.get("baselined")
+            and (func.get("cyclomatic_complexity", 0) >= self.min_complexity
+                 or func.get("cognitive_complexity", 0) >= self.min_complexity)
+        ]
+        table = Table(title=self._title("Complex Functions", len(complex_functions)))
         table.add_column("File/Function", style="cyan")
         table.add_column("Cyclomatic", style="blue")
         table.add_column("Cognitive", style="magenta")
         table.add_column("Line", style="green")
         
-        for file_data in results.get("files", []):
-            file_path = str(Path(file_data.get("file_path", "")).relative_to(Path.cwd()))
-            for func in file_data.get("functions", []):
-                if func.get("cyclomatic_complexity", 0) >= 5 or func.get("cognitive_complexity", 0) >= 5:
-                    table.add_row(
-                        f"{file_path}::{func['name']}",
-                        self._color_complexity(func.get("cyclomatic_complexity", 0)),
-                        self._color_complexity(func.get("cognitive_complexity", 0)),
-                        str(func.get("line", ""))
-                    )
+        top = self._top(complex_functions, lambda item: (
+            max(item[1].get("cyclomatic_complexity", 0), item[1].get("cognitive_complexity", 0)),
+            item[1].get("cyclomatic_complexity", 0)
+        ))
+        for file_data, func in top:
+            table.add_row(
+                f"{self._get_relative_path(file_data.get('file_path', ''))}::{func['name']}",
+                self._color_complexity(func.get("cyclomatic_complexity", 0)),
+                self._color_complexity(func.get("cognitive_complexity", 0)),
+                str(func.get("line", ""))
+            )
         
         return table
 
     def _create_metrics_table(self, results: Dict[str, Any]) -> Table:
         """Create metrics by file table.
+
+        Lists the files with the highest cyclomatic complexity.
         
         Args:
             results: Analysis results
@@ -306,6 +386,7 @@ class ConsoleFormatter(BaseFormatter):
         Returns:
             Table: Metrics by file table
         """
+        files = results.get("files", [])
         table = Table(title="Metrics by File")
         table.add_column("File", style="cyan")
         table.add_column("Cyclomatic", style="blue")
@@ -313,23 +394,27 @@ class ConsoleFormatter(BaseFormatter):
         table.add_column("MI", style="green")
         table.add_column("LOC", style="yellow")
         
-        for file_data in results.get("files", []):
-            file_path = str(Path(file_data.get("file_path", "")).relative_to(Path.cwd()))
+        top = self._top(files, lambda file_data: file_data.get("cyclomatic_complexity", 0))
+        for file_data in top:
             table.add_row(
-                file_path,
+                self._get_relative_path(file_data.get("file_path", "")),
                 self._color_complexity(file_data.get("cyclomatic_complexity", 0)),
                 self._color_complexity(file_data.get("cognitive_complexity", 0)),
                 self._color_mi(file_data.get("maintainability_index", 0)),
                 str(file_data.get("loc", 0))
             )
+        if len(files) > len(top):
+            table.caption = f"{len(files) - len(top)} less complex files not shown"
         
         return table
 
-    def _create_summary_table(self, results: Dict[str, Any]) -> Table:
+    def _create_summary_table(self, results: Dict[str, Any],
+                              summary: Optional[Dict[str, Any]] = None) -> Table:
         """Create summary metrics table.
         
         Args:
             results: Analysis results
+            summary: Aggregate statistics of the results, computed if not given
             
         Returns:
             Table: Summary metrics table
@@ -338,23 +423,69 @@ class ConsoleFormatter(BaseFormatter):
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="blue")
         
-        total_files = len(results.get("files", []))
-        total_functions = sum(file.get("total_functions", 0) for file in results.get("files", []))
-        total_complexity = sum(file.get("cyclomatic_complexity", 0) for file in results.get("files", []))
-        total_cognitive = sum(file.get("cognitive_complexity", 0) for file in results.get("files", []))
-        total_loc = sum(file.get("loc", 0) for file in results.get("files", []))
+        summary = summary or summarize(results)
+        files = summary["file_metrics"]
+        total_functions = summary["functions"]
         
-        avg_complexity = total_complexity / total_functions if total_functions > 0 else 0
-        avg_cognitive = total_cognitive / total_functions if total_functions > 0 else 0
-        avg_mi = sum(file.get("maintainability_index", 0) for file in results.get("files", [])) / total_files if total_files > 0 else 0
+        # File totals, so nested functions are not counted twice
+        divisor = total_functions or 1
+        avg_complexity = files["cyclomatic_complexity"]["total"] / divisor
+        avg_cognitive = files["cognitive_complexity"]["total"] / divisor
+        avg_mi = files["maintainability_index"]["mean"]
         
         table.add_row("Average MI", self._color_mi(avg_mi))
         table.add_row("Average Cyclomatic", self._color_complexity(avg_complexity))
         table.add_row("Average Cognitive", self._color_complexity(avg_cognitive))
-        table.add_row("Total LOC", str(total_loc))
+        cognitive = summary["function_metrics"]["cognitive_complexity"]
+        table.add_row(*self._percentile_row("Cognitive", cognitive))
+        table.add_row("Total LOC", str(files["loc"]["total"]))
         
         return table
 
+    def _percentile_row(self, label: str, stats: Dict[str, Any]) -> Tuple[str, str]:
+        """Row of the function percentiles of one metric."""
+        names = "/".join(f"p{percentile}" for percentile in PERCENTILES)
+        values = " / ".join(
+            self._color_complexity(stats[f"p{percentile}"]) for percentile in PERCENTILES
+        )
+        return f"{label} {names}", values
+
+    def _title(self, title: str, total: int) -> str:
+        """Table title stating how many of the entries are shown."""
+        if self.max_rows and total > self.max_rows:
+            return f"{title} (showing {self.max_rows} of {total})"
+        return title
+
+    def _top(self, items: Sequence[Any], key: Callable[[Any], Any]) -> List[Any]:
+        """The ``max_rows`` items with the largest key, largest first."""
+        if self.max_rows and len(items) > self.max_rows:
+            return heapq.nlargest(self.max_rows, items, key=key)
+        return sorted(items, key=key, reverse=True)
+
+    def _add_rows(self, table: Table, rows: Iterable[Tuple[str, ...]], total: int) -> None:
+        """Add the first ``max_rows`` rows, then a row counting the rest.
+
+        Rows are consumed lazily, so rows past the limit are never built.
+        """
+        shown = 0
+        for row in islice(rows, self.max_rows or None):
+            table.add_row(*row)
+            shown += 1
+        if total > shown:
+            table.add_row(f"[dim]... {total - shown} more[/dim]", *[""] * (len(table.columns) - 1))
+
+    @staticmethod
+    def _group_fragments(group: Dict[str, Any]) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Numbered fragments of a clone group to show.
+
+        Past ``MAX_GROUP_FRAGMENTS``, yields the number of hidden fragments
+        with ``None`` instead of a fragment.
+        """
+        fragments = group["fragments"]
+        yield from enumerate(fragments[:MAX_GROUP_FRAGMENTS])
+        if len(fragments) > MAX_GROUP_FRAGMENTS:
+            yield len(fragments) - MAX_GROUP_FRAGMENTS, None
+
     def _get_mi_color(self, mi: float) -> str:
         """Get color for maintainability index."""
         if mi >= 80:
@@ -380,3 +511,8 @@ class ConsoleFormatter(BaseFormatter):
         """Format complexity with color."""
         color = self._get_complexity_color(complexity)
         return f"[{color}]{complexity}[/{color}]"
+
+
+def _group_rank(group: Dict[str, Any]) -> Tuple[float, int]:
+    """Order clone groups by similarity, then by number of fragments."""
+    return group.get("similarity", 0), len(group.get("fragments", []))
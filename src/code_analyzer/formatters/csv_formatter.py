@@ -0,0 +1,55 @@
+"""
+CSV formatter that streams rows as results are produced
+"""
+
+import csv
+import sys
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, TextIO, Union
+
+from .base_formatter import ROW_COLUMNS, RowFormatter
+
+# Every record type shares these columns; cells that do not apply are empty
+CSV_COLUMNS = ROW_COLUMNS
+
+
+class CsvFormatter(RowFormatter):
+    """Formatter writing one CSV row per file, function and finding.
+
+    Rows are written as soon as each analyzer hands over its results, so
+    callers can stream per-file complexity results without keeping them.
+    The ``record`` column tells rows apart: ``file``, ``function``,
+    ``unused_<type>``, ``similar_fragment`` or ``structural_clone``.
+    """
+
+    def __init__(self, output: Optional[Union[str, Path, TextIO]] = None,
+                 buffer_size: int = 1 << 16):
+        """Initialize the formatter and write the header row.
+
+        Args:
+            output: File path or text stream to write to; defaults to stdout
+            buffer_size: Write buffer size when writing to a file path
+        """
+        super().__init__()
+        if output is None:
+            self.stream = sys.stdout
+            self._owns_stream = False
+        elif isinstance(output, (str, Path)):
+            self.stream = open(output, "w", newline="", encoding="utf-8", buffering=buffer_size)
+            self._owns_stream = True
+        else:
+            self.stream = output
+            self._owns_stream = False
+        self._writer = csv.writer(self.stream)
+        self._writer.writerow(CSV_COLUMNS)
+
+    def close(self) -> None:
+        """Flush buffered rows and close the output if this formatter opened it."""
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def _write_rows(self, rows: Iterable[List[Any]]) -> None:
+        """Write rows with empty cells for missing values."""
+        self._writer.writerows(["" if value is None else value for value in row] for row in rows)
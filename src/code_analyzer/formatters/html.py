@@ -0,0 +1,238 @@
+"""
+Self-contained HTML report.
+Rows are streamed into an embedded JSON data block while analysis runs; a
+small script renders them as a virtualized table that can be sorted and
+filtered in the browser.
+"""
+
+import html
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Union
+
+from .base_formatter import ROW_COLUMNS, RowFormatter
+
+_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ margin: 0; font: 13px/1.4 system-ui, sans-serif; color: #1f2328; }}
+header {{ padding: 12px 16px; border-bottom: 1px solid #d0d7de; }}
+h1 {{ margin: 0 0 4px; font-size: 18px; }}
+#summary {{ color: #57606a; margin-bottom: 8px; }}
+.controls {{ display: flex; gap: 8px; align-items: center; }}
+.controls input {{ flex: 0 1 24rem; padding: 4px 6px; }}
+#count {{ color: #57606a; }}
+.row {{ display: grid; height: 24px; align-items: center; white-space: nowrap;
+        grid-template-columns: 9rem minmax(16rem, 3fr) 4rem 4rem minmax(8rem, 2fr)
+                               repeat(6, 6.5rem); }}
+.cell {{ overflow: hidden; text-overflow: ellipsis; padding: 0 6px; }}
+.num {{ text-align: right; }}
+.head {{ font-weight: 600; background: #f6f8fa; border-bottom: 1px solid #d0d7de;
+         cursor: pointer; user-select: none; }}
+#viewport {{ height: calc(100vh - 130px); overflow-y: auto; }}
+#spacer {{ position: relative; }}
+#spacer .row {{ position: absolute; left: 0; right: 0; border-bottom: 1px solid #eaeef2; }}
+#spacer .row:hover {{ background: #f6f8fa; }}
+</style>
+</head>
+<body>
+<header>
+<h1>{title}</h1>
+<div id="summary"></div>
+<div class="controls">
+<select id="record"><option value="">All records</option></select>
+<input id="filter" type="search" placeholder="Filter by file or name">
+<span id="count"></span>
+</div>
+</header>
+<div id="head" class="row head"></div>
+<div id="viewport"><div id="spacer"></div></div>
+<script type="application/json" id="rows">["""
+
+_APP = """<script>
+(function () {
+  var rows = JSON.parse(document.getElementById("rows").textContent);
+  var meta = JSON.parse(document.getElementById("meta").textContent);
+  var columns = meta.columns, paths = meta.paths;
+  var FILE = columns.indexOf("file"), NAME = columns.indexOf("name"), ROW = 24, OVERSCAN = 20;
+  var select = document.getElementById("record"), filter = document.getElementById("filter");
+  var viewport = document.getElementById("viewport"), spacer = document.getElementById("spacer");
+  var view = rows, sortColumn = -1, sortOrder = 1, pending = false, timer = null;
+
+  function escape(value) {
+    return value.replace(/[&<>"]/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c];
+    });
+  }
+  function text(row, i) {
+    var value = row[i];
+    if (value === null) return "";
+    return i === FILE ? paths[value] : String(value);
+  }
+
+  var counts = {};
+  rows.forEach(function (row) { counts[row[0]] = (counts[row[0]] || 0) + 1; });
+  var records = Object.keys(counts).sort();
+  records.forEach(function (record) {
+    var option = document.createElement("option");
+    option.value = record;
+    option.textContent = record + " (" + counts[record] + ")";
+    select.appendChild(option);
+  });
+  var summary = [meta.generated];
+  if (meta.summary) {
+    var stats = meta.summary.function_metrics.cyclomatic_complexity;
+    summary.push(meta.summary.files + " files, " + meta.summary.functions + " functions, " +
+      meta.summary.file_metrics.loc.total + " LOC, cyclomatic p50 " + stats.p50 +
+      " / p90 " + stats.p90 + " / p99 " + stats.p99);
+  }
+  summary.push(records.map(function (record) { return counts[record] + " " + record; }).join(", "));
+  document.getElementById("summary").textContent = summary.join(" \\u00b7 ");
+
+  var head = document.getElementById("head");
+  columns.forEach(function (name, i) {
+    var cell = document.createElement("div");
+    cell.className = "cell" + (i > NAME ? " num" : "");
+    cell.textContent = name.replace(/_/g, " ");
+    cell.title = "Sort by " + cell.textContent;
+    cell.onclick = function () {
+      sortOrder = sortColumn === i ? -sortOrder : (i > NAME ? -1 : 1);
+      sortColumn = i;
+      apply();
+    };
+    head.appendChild(cell);
+  });
+
+  function compare(a, b) {
+    var x = a[sortColumn], y = b[sortColumn];
+    if (x === null || y === null) return x === y ? 0 : (x === null ? 1 : -1);
+    if (sortColumn === FILE) { x = paths[x]; y = paths[y]; }
+    return (x < y ? -1 : x > y ? 1 : 0) * sortOrder;
+  }
+
+  function apply() {
+    var record = select.value, query = filter.value.trim().toLowerCase();
+    view = rows.filter(function (row) {
+      if (record && row[0] !== record) return false;
+      return !query || paths[row[FILE]].toLowerCase().indexOf(query) >= 0 ||
+        (row[NAME] !== null && String(row[NAME]).toLowerCase().indexOf(query) >= 0);
+    });
+    if (sortColumn >= 0) view.sort(compare);
+    document.getElementById("count").textContent = view.length + " of " + rows.length + " rows";
+    spacer.style.height = view.length * ROW + "px";
+    render();
+  }
+
+  function render() {
+    pending = false;
+    var first = Math.max(0, Math.floor(viewport.scrollTop / ROW) - OVERSCAN);
+    var last = Math.min(view.length, first + Math.ceil(viewport.clientHeight / ROW) + 2 * OVERSCAN);
+    var html = [];
+    for (var r = first; r < last; r++) {
+      html.push('<div class="row" style="top:' + r * ROW + 'px">');
+      for (var i = 0; i < columns.length; i++) {
+        var value = escape(text(view[r], i));
+        html.push('<div class="cell' + (i > NAME ? ' num' : '') + '" title="' + value + '">' +
+                  value + '</div>');
+      }
+      html.push('</div>');
+    }
+    spacer.innerHTML = html.join("");
+  }
+
+  viewport.addEventListener("scroll", function () {
+    if (!pending) { pending = true; requestAnimationFrame(render); }
+  });
+  window.addEventListener("resize", render);
+  select.addEventListener("change", apply);
+  filter.addEventListener("input", function () {
+    clearTimeout(timer);
+    timer = setTimeout(apply, 150);
+  });
+  apply();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class HtmlFormatter(RowFormatter):
+    """Formatter writing a single-file HTML report.
+
+    The report holds the same rows as the CSV output. They are written to
+    the data block as each analyzer hands over its results, as compact
+    JSON arrays with file paths replaced by indexes into a path table that
+    is written, with the viewer script, on ``close``.
+    """
+
+    def __init__(self, output: Optional[Union[str, Path, TextIO]] = None,
+                 title: str = "Code Analysis Report", buffer_size: int = 1 << 16):
+        """Initialize the formatter and write the start of the page.
+
+        Args:
+            output: File path or text stream to write to; defaults to stdout
+            title: Page title
+            buffer_size: Write buffer size when writing to a file path
+        """
+        super().__init__()
+        if output is None:
+            self.stream = sys.stdout
+            self._owns_stream = False
+        elif isinstance(output, (str, Path)):
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            self.stream = open(output, "w", encoding="utf-8", buffering=buffer_size)
+            self._owns_stream = True
+        else:
+            self.stream = output
+            self._owns_stream = False
+        self._paths: Dict[str, int] = {}
+        self._row_count = 0
+        self._summary: Optional[Dict[str, Any]] = None
+        self.stream.write(_HEAD.format(title=html.escape(title)))
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        """Keep aggregate statistics to show above the table."""
+        self._summary = summary
+
+    def close(self) -> None:
+        """Write the path table and viewer script and finish the page."""
+        meta = {
+            "columns": ROW_COLUMNS,
+            "paths": list(self._paths),
+            "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "summary": self._summary,
+        }
+        self.stream.write("]</script>\n")
+        self.stream.write(
+            f'<script type="application/json" id="meta">{_script_json(meta)}</script>\n'
+        )
+        self.stream.write(_APP)
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def _write_rows(self, rows: Iterable[List[Any]]) -> None:
+        """Append rows to the data block, replacing paths by their index."""
+        encoded = []
+        for row in rows:
+            row[1] = self._paths.setdefault(row[1], len(self._paths))
+            encoded.append(_script_json(row))
+        if not encoded:
+            return
+        if self._row_count:
+            self.stream.write(",")
+        self.stream.write(",".join(encoded))
+        self._row_count += len(encoded)
+
+
+def _script_json(value: Any) -> str:
+    """Compact JSON that cannot end the ``<script>`` element it is embedded in."""
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
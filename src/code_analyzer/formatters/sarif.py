@@ -0,0 +1,222 @@
+"""
+SARIF 2.1.0 formatter for code scanning in CI
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from .base_formatter import StreamingFormatter
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
+# Rule metadata by rule ID: (name, short description, default level)
+RULES: Dict[str, tuple] = {
+    "CA101": ("HighCyclomaticComplexity", "Function has high cyclomatic complexity", "warning"),
+    "CA102": ("HighCognitiveComplexity", "Function has high cognitive complexity", "warning"),
+    "CA201": ("UnusedClass", "Class is never used", "warning"),
+    "CA202": ("UnusedFunction", "Function is never used", "warning"),
+    "CA203": ("UnusedMethod", "Method is never used", "warning"),
+    "CA204": ("UnusedVariable", "Module-level variable is never used", "note"),
+    "CA205": ("UnusedImport", "Import is never used", "note"),
+    "CA301": ("SimilarCode", "Code fragment is similar to other fragments", "note"),
+    "CA302": ("StructuralClone", "Code fragment has the same structure as other fragments", "note"),
+    "CA401": ("ImportCycle", "Modules import each other in a cycle", "warning"),
+}
+
+_DEAD_CODE_RULES = {
+    "unused_classes": ("CA201", "class"),
+    "unused_functions": ("CA202", "function"),
+    "unused_methods": ("CA203", "method"),
+    "unused_variables": ("CA204", "variable"),
+    "unused_imports": ("CA205", "import"),
+}
+
+
+class SarifFormatter(StreamingFormatter):
+    """Formatter writing a SARIF 2.1.0 log with one run.
+
+    Results are serialized and written one at a time, so the document is
+    never held in memory. Rule metadata is written once, after the results,
+    for only the rules that were used; results refer to it by index.
+    """
+
+    def __init__(self, output: Optional[Union[str, Path, TextIO]] = None,
+                 root: Optional[Union[str, Path]] = None, min_complexity: int = 10,
+                 buffer_size: int = 1 << 16):
+        """Initialize the formatter and write the start of the log.
+
+        Args:
+            output: File path or text stream to write to; defaults to stdout
+            root: Analyzed root directory; file URIs are made relative to it
+            min_complexity: Complexity at which a function is reported
+            buffer_size: Write buffer size when writing to a file path
+        """
+        super().__init__()
+        if output is None:
+            self.stream = sys.stdout
+            self._owns_stream = False
+        elif isinstance(output, (str, Path)):
+            self.stream = open(output, "w", encoding="utf-8", buffering=buffer_size)
+            self._owns_stream = True
+        else:
+            self.stream = output
+            self._owns_stream = False
+        self.root = Path(root).resolve() if root else None
+        if self.root is not None and self.root.is_file():
+            self.root = self.root.parent
+        self.min_complexity = min_complexity
+        self._rule_indexes: Dict[str, int] = {}
+        self._result_count = 0
+        self._uris: Dict[str, Dict[str, str]] = {}
+        self._summary: Optional[Dict[str, Any]] = None
+        self.stream.write(
+            f'{{"$schema":"{SARIF_SCHEMA}","version":"{SARIF_VERSION}","runs":[{{"results":['
+        )
+
+    def write_file(self, file_result: Dict[str, Any]) -> None:
+        """Report functions at or above the complexity threshold, unless baselined."""
+        path = file_result.get("file_path", "")
+        for function in file_result.get("functions", []):
+            if function.get("baselined"):
+                continue
+            for rule_id, key, label in (
+                ("CA101", "cyclomatic_complexity", "cyclomatic"),
+                ("CA102", "cognitive_complexity", "cognitive"),
+            ):
+                value = function.get(key, 0)
+                if value >= self.min_complexity:
+                    self._write_result(
+                        rule_id,
+                        f"Function '{function['name']}' has {label} complexity {value} "
+                        f"(threshold {self.min_complexity})",
+                        self._location(path, function.get("line"), function.get("end_line"))
+                    )
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        """Keep aggregate statistics for the run's property bag."""
+        self._summary = summary
+
+    def write_dead_code(self, results: Dict[str, Any]) -> None:
+        """Report every unused symbol."""
+        for key, (rule_id, kind) in _DEAD_CODE_RULES.items():
+            for item in results.get(key, []):
+                self._write_result(
+                    rule_id,
+                    f"Unused {kind} '{item['name']}'",
+                    self._location(item.get("file", ""), item.get("line"), item.get("end_line"))
+                )
+
+    def write_similarity(self, results: Dict[str, Any]) -> None:
+        """Report each clone group at its first fragment, relating the others."""
+        for rule_id, key in (("CA301", "similar_fragments"), ("CA302", "structural_clones")):
+            for group in results.get(key) or []:
+                fragments = group.get("fragments", [])
+                if not fragments:
+                    continue
+                locations = [
+                    self._location(f.get("file", ""), f.get("start_line"), f.get("end_line"))
+                    for f in fragments
+                ]
+                for number, location in enumerate(locations[1:], 1):
+                    location["id"] = number
+                self._write_result(
+                    rule_id,
+                    f"Code is {group.get('similarity', 0):.0%} similar to "
+                    f"{len(fragments) - 1} other fragment(s)",
+                    locations[0],
+                    related=locations[1:]
+                )
+
+    def write_architecture(self, results: Dict[str, Any]) -> None:
+        """Report import cycles at the file of their first module."""
+        metrics = results.get("module_metrics", {})
+        for cycle in results.get("dependency_cycles") or []:
+            modules = cycle["modules"]
+            files = [metrics.get(module, {}).get("file") for module in modules]
+            locations = [self._location(f) for f in files if f]
+            if not locations:
+                continue
+            self._write_result(
+                "CA401",
+                f"Import cycle between {len(modules)} modules: {' -> '.join(modules)}",
+                locations[0],
+                related=locations[1:],
+                level="error" if cycle.get("severity") == "high" else None
+            )
+
+    def close(self) -> None:
+        """Write the rules and tool metadata and finish the log."""
+        rules = [
+            {
+                "id": rule_id,
+                "name": RULES[rule_id][0],
+                "shortDescription": {"text": RULES[rule_id][1]},
+                "defaultConfiguration": {"level": RULES[rule_id][2]},
+            }
+            for rule_id in self._rule_indexes
+        ]
+        tail: Dict[str, Any] = {
+            "tool": {"driver": {
+                "name": "code-analyzer",
+                "informationUri": "https://github.com/kareemaly/python-code-quality-analyzer",
+                "rules": rules,
+            }},
+        }
+        if self.root is not None:
+            tail["originalUriBaseIds"] = {"SRCROOT": {"uri": self.root.as_uri() + "/"}}
+        if self._summary is not None:
+            tail["properties"] = {"metrics": self._summary}
+        self.stream.write("]," + json.dumps(tail, separators=(",", ":"))[1:] + "]}\n")
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def _write_result(self, rule_id: str, message: str, location: Dict[str, Any],
+                      related: Optional[List[Dict[str, Any]]] = None,
+                      level: Optional[str] = None) -> None:
+        """Serialize one result and write it out."""
+        index = self._rule_indexes.setdefault(rule_id, len(self._rule_indexes))
+        result: Dict[str, Any] = {
+            "ruleId": rule_id,
+            "ruleIndex": index,
+            "level": level or RULES[rule_id][2],
+            "message": {"text": message},
+            "locations": [location],
+        }
+        if related:
+            result["relatedLocations"] = related
+        if self._result_count:
+            self.stream.write(",")
+        self.stream.write(json.dumps(result, separators=(",", ":")))
+        self._result_count += 1
+
+    def _location(self, path: str, start_line: Optional[int] = None,
+                  end_line: Optional[int] = None) -> Dict[str, Any]:
+        """Build a physical location, with a region when lines are known."""
+        physical: Dict[str, Any] = {"artifactLocation": dict(self._artifact(path))}
+        if start_line:
+            region = {"startLine": start_line}
+            if end_line and end_line >= start_line:
+                region["endLine"] = end_line
+            physical["region"] = region
+        return {"physicalLocation": physical}
+
+    def _artifact(self, path: str) -> Dict[str, str]:
+        """Artifact location of a file, relative to the root when it is inside it."""
+        artifact = self._uris.get(path)
+        if artifact is None:
+            resolved = Path(path).resolve()
+            try:
+                relative = resolved.relative_to(self.root) if self.root is not None else None
+            except ValueError:
+                relative = None
+            if relative is not None:
+                artifact = {"uri": relative.as_posix(), "uriBaseId": "SRCROOT"}
+            else:
+                artifact = {"uri": resolved.as_uri()}
+            self._uris[path] = artifact
+        return artifact
@@ -2,6 +2,7 @@
 Metrics package for code analyzer.
 """
 
+from .aggregate import MetricsAggregator, summarize
 from .complexity import calculate_complexity
 
-__all__ = ["calculate_complexity"]
+__all__ = ["MetricsAggregator", "calculate_complexity", "summarize"]
@@ -0,0 +1,236 @@
+"""
+Aggregate statistics across files and functions.
+Metrics are collected into typed columns once and summarized with
+vectorized operations when NumPy is installed, in plain Python otherwise.
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # Optional dependency
+    numpy = None
+
+# Function-level metrics that are summarized, in order
+FUNCTION_METRICS = ("cyclomatic_complexity", "cognitive_complexity", "loc",
+                    "maintainability_index", "halstead_volume")
+
+# File-level metrics that are summarized, in order
+FILE_METRICS = ("cyclomatic_complexity", "cognitive_complexity", "loc",
+                "maintainability_index", "total_functions")
+
+# Metrics whose totals, minimums and maximums are whole numbers
+INTEGER_METRICS = frozenset({"cyclomatic_complexity", "cognitive_complexity", "loc",
+                             "total_functions"})
+
+PERCENTILES = (50, 90, 99)
+
+# Function metrics with a top-k list in the summary
+TOP_METRICS = ("cyclomatic_complexity", "cognitive_complexity")
+
+
+class MetricsAggregator:
+    """Collects per-file and per-function metrics into typed columns.
+
+    Files can be added one at a time as the complexity analyzer produces
+    them, so a summary is available even when the file results themselves
+    are streamed out and not kept. ``summary`` computes every statistic in
+    one pass over the columns and returns a plain, JSON-serializable dict
+    that formatters share instead of re-summing the results.
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        """Initialize an empty aggregator.
+
+        Args:
+            use_numpy: Summarize with NumPy; defaults to whether it is installed
+
+        Raises:
+            ImportError: If NumPy is requested but not installed
+        """
+        if use_numpy and numpy is None:
+            raise ImportError("Vectorized statistics require numpy to be installed")
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self._files = {metric: array("d") for metric in FILE_METRICS}
+        self._functions = {metric: array("d") for metric in FUNCTION_METRICS}
+        self._paths: List[str] = []
+        # Path index, name and line of each function, aligned with the columns
+        self._function_refs: List[Tuple[int, str, int]] = []
+
+    @classmethod
+    def from_results(
+        cls, results: Dict[str, Any], use_numpy: Optional[bool] = None
+    ) -> 'MetricsAggregator':
+        """Create an aggregator holding the files of combined analysis results."""
+        aggregator = cls(use_numpy)
+        for file_result in results.get("files", []):
+            aggregator.add_file(file_result)
+        return aggregator
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def add_file(self, file_result: Dict[str, Any]) -> None:
+        """Add the metrics of one file and its functions."""
+        path_id = len(self._paths)
+        self._paths.append(file_result.get("file_path", ""))
+        for metric in FILE_METRICS:
+            self._files[metric].append(file_result.get(metric) or 0)
+        columns = self._functions
+        for function in file_result.get("functions") or []:
+            columns["cyclomatic_complexity"].append(function.get("cyclomatic_complexity") or 0)
+            columns["cognitive_complexity"].append(function.get("cognitive_complexity") or 0)
+            columns["loc"].append(function.get("loc") or 0)
+            columns["maintainability_index"].append(function.get("maintainability_index") or 0)
+            columns["halstead_volume"].append((function.get("halstead") or {}).get("volume") or 0)
+            self._function_refs.append(
+                (path_id, function.get("name", ""), function.get("line") or 0)
+            )
+
+    def summary(self, top_k: int = 10, bins: int = 10) -> Dict[str, Any]:
+        """Summarize the collected metrics.
+
+        Args:
+            top_k: Number of functions listed per metric in ``top_functions``
+            bins: Number of equal-width histogram bins per metric
+
+        Returns:
+            Dict with the ``files`` and ``functions`` counts, per-metric
+            statistics under ``file_metrics`` and ``function_metrics``, and
+            the functions with the largest values under ``top_functions``.
+            Statistics are ``total``, ``mean``, ``min``, ``max``, one
+            ``p<N>`` key per percentile and a ``histogram`` of bin ``edges``
+            and ``counts``.
+        """
+        describe = _describe_numpy if self.use_numpy else _describe
+        top = _top_numpy if self.use_numpy else _top
+        top_functions = {}
+        for metric in TOP_METRICS:
+            top_functions[metric] = [
+                {
+                    "file": self._paths[self._function_refs[index][0]],
+                    "name": self._function_refs[index][1],
+                    "line": self._function_refs[index][2],
+                    "value": _number(metric, self._functions[metric][index]),
+                }
+                for index in top(self._functions[metric], top_k)
+            ]
+        return {
+            "files": len(self._paths),
+            "functions": len(self._function_refs),
+            "file_metrics": {
+                metric: describe(metric, values, bins) for metric, values in self._files.items()
+            },
+            "function_metrics": {
+                metric: describe(metric, values, bins) for metric, values in self._functions.items()
+            },
+            "top_functions": top_functions,
+        }
+
+
+def summarize(results: Dict[str, Any], top_k: int = 10, bins: int = 10) -> Dict[str, Any]:
+    """Summarize the files of combined analysis results.
+
+    Returns the precomputed ``summary`` of the results when there is one.
+    """
+    if results.get("summary"):
+        return results["summary"]
+    return MetricsAggregator.from_results(results).summary(top_k, bins)
+
+
+def _describe_numpy(metric: str, values: array, bins: int) -> Dict[str, Any]:
+    """Statistics of a column, computed with NumPy."""
+    if not values:
+        return _empty(bins)
+    data = numpy.frombuffer(values, dtype=numpy.float64)
+    counts, edges = numpy.histogram(data, bins=bins)
+    stats = {
+        "total": _number(metric, data.sum()),
+        "mean": round(float(data.mean()), 2),
+        "min": _number(metric, data.min()),
+        "max": _number(metric, data.max()),
+    }
+    for percentile, value in zip(PERCENTILES, numpy.percentile(data, PERCENTILES)):
+        stats[f"p{percentile}"] = round(float(value), 2)
+    stats["histogram"] = {
+        "edges": [round(float(edge), 2) for edge in edges],
+        "counts": counts.tolist(),
+    }
+    return stats
+
+
+def _describe(metric: str, values: array, bins: int) -> Dict[str, Any]:
+    """Statistics of a column, computed like ``_describe_numpy`` without NumPy."""
+    if not values:
+        return _empty(bins)
+    data = sorted(values)
+    count = len(data)
+    total = math.fsum(data)
+    stats = {
+        "total": _number(metric, total),
+        "mean": round(total / count, 2),
+        "min": _number(metric, data[0]),
+        "max": _number(metric, data[-1]),
+    }
+    for percentile in PERCENTILES:
+        # Linear interpolation between closest ranks, as numpy.percentile
+        position = (count - 1) * percentile / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, count - 1)
+        value = data[lower] + (data[upper] - data[lower]) * (position - lower)
+        stats[f"p{percentile}"] = round(value, 2)
+    edges = _bin_edges(data[0], data[-1], bins)
+    # Bins are half-open except the last, which includes the maximum
+    positions = [bisect_left(data, edge) for edge in edges[1:-1]] + [count]
+    counts = [end - start for start, end in zip([0] + positions[:-1], positions)]
+    stats["histogram"] = {"edges": [round(edge, 2) for edge in edges], "counts": counts}
+    return stats
+
+
+def _bin_edges(low: float, high: float, bins: int) -> List[float]:
+    """Equal-width bin edges, widening an empty range as numpy.histogram does."""
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    width = (high - low) / bins
+    return [low + width * i for i in range(bins)] + [high]
+
+
+def _empty(bins: int) -> Dict[str, Any]:
+    """Statistics of an empty column."""
+    stats: Dict[str, Any] = {"total": 0, "mean": 0.0, "min": 0, "max": 0}
+    for percentile in PERCENTILES:
+        stats[f"p{percentile}"] = 0.0
+    stats["histogram"] = {"edges": [], "counts": []}
+    return stats
+
+
+def _top_numpy(values: array, k: int) -> List[int]:
+    """Indexes of the ``k`` largest values, largest first, earlier first on ties."""
+    if not values or k <= 0:
+        return []
+    data = numpy.frombuffer(values, dtype=numpy.float64)
+    if k < len(data):
+        threshold = numpy.partition(data, len(data) - k)[len(data) - k]
+        candidates = numpy.flatnonzero(data >= threshold)
+    else:
+        candidates = numpy.arange(len(data))
+    order = numpy.argsort(-data[candidates], kind="stable")
+    return candidates[order][:k].tolist()
+
+
+def _top(values: Sequence[float], k: int) -> List[int]:
+    """Indexes of the ``k`` largest values, largest first, earlier first on ties."""
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, range(len(values)), key=values.__getitem__)
+
+
+def _number(metric: str, value: float) -> Any:
+    """A total or extreme as an int for whole-number metrics, else a rounded float."""
+    if metric in INTEGER_METRICS:
+        return int(value)
+    return round(float(value), 2)
@@ -1,6 +1,6 @@
 import ast
 import math
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, Hashable, List, Tuple
 
 
 class ComplexityMetrics:
@@ -15,21 +15,7 @@ class ComplexityMetrics:
         return max(0, min(100, mi * 100 / 171))
 
     def calculate_halstead_metrics(self, code: str) -> Dict[str, float]:
-        tree = ast.parse(code)
-        visitor = HalsteadVisitor()
-        visitor.visit(tree)
-        n1 = len(visitor.operators)
-        n2 = len(visitor.operands)
-        N1 = visitor.operator_count
-        N2 = visitor.operand_count
-        if n1 == 0 or n2 == 0:
-            return {"volume": 0, "difficulty": 0, "effort": 0}
-        program_length = N1 + N2
-        vocabulary = n1 + n2
-        volume = program_length * math.log2(vocabulary) if vocabulary > 0 else 0
-        difficulty = (n1 * N2) / (2 * n2) if n2 > 0 else 0
-        effort = difficulty * volume
-        return {"volume": volume, "difficulty": difficulty, "effort": effort}
+        return halstead_metrics(ast.parse(code))
 
 
 class ComplexityVisitor(ast.NodeVisitor):
@@ -80,41 +66,111 @@ class ComplexityVisitor(ast.NodeVisitor):
             self.complexity += 1
 
 
-class HalsteadVisitor(ast.NodeVisitor):
+# Operator types counted by Halstead metrics, by interned ID
+OPERATOR_TYPES: Tuple[type, ...] = tuple(
+    op
+    for base in (ast.operator, ast.unaryop, ast.boolop, ast.cmpop)
+    for op in base.__subclasses__()
+)
+OPERATOR_IDS: Dict[type, int] = {op: i for i, op in enumerate(OPERATOR_TYPES)}
+
+
+class OperandTable:
+    """Interns operands, names and constants, as small integer IDs.
+
+    Constants are keyed by type as well as value so that ``1``, ``1.0``,
+    ``True`` and ``"1"`` stay distinct operands.
+    """
+
     def __init__(self):
-        self.operators: Set[str] = set()
-        self.operands: Set[str] = set()
-        self.operator_count = 0
-        self.operand_count = 0
-
-    def visit_BinOp(self, node):
-        self.operators.add(type(node.op).__name__)
-        self.operator_count += 1
-        self.generic_visit(node)
+        self.ids: Dict[Hashable, int] = {}
 
-    def visit_UnaryOp(self, node):
-        self.operators.add(type(node.op).__name__)
-        self.operator_count += 1
-        self.generic_visit(node)
+    def name(self, identifier: str) -> int:
+        return self.ids.setdefault(identifier, len(self.ids))
 
-    def visit_BoolOp(self, node):
-        self.operators.add(type(node.op).__name__)
-        self.operator_count += 1
-        self.generic_visit(node)
+    def constant(self, value: Any) -> int:
+        try:
+            key = (type(value), value)
+            return self.ids.setdefault(key, len(self.ids))
+        except TypeError:
+            return self.ids.setdefault((type(value), repr(value)), len(self.ids))
 
-    def visit_Compare(self, node):
-        for op in node.ops:
-            self.operators.add(type(op).__name__)
-            self.operator_count += 1
-        self.generic_visit(node)
 
-    def visit_Name(self, node):
-        self.operands.add(node.id)
-        self.operand_count += 1
+class HalsteadCounts:
+    """Halstead operator and operand counts of one scope.
+
+    Distinct operators and operands are tracked with flag arrays indexed by
+    interned ID, so counting needs no per-scope sets of strings.
+    """
+
+    __slots__ = ("operators", "operands", "distinct_operators", "distinct_operands",
+                 "total_operators", "total_operands")
 
-    def visit_Constant(self, node):
-        self.operands.add(str(node.value))
-        self.operand_count += 1
+    def __init__(self):
+        self.operators = bytearray(len(OPERATOR_TYPES))
+        self.operands = bytearray()
+        self.distinct_operators = 0
+        self.distinct_operands = 0
+        self.total_operators = 0
+        self.total_operands = 0
+
+    def add_operator(self, operator_id: int) -> None:
+        self.total_operators += 1
+        if not self.operators[operator_id]:
+            self.operators[operator_id] = 1
+            self.distinct_operators += 1
+
+    def add_operand(self, operand_id: int) -> None:
+        self.total_operands += 1
+        seen = self.operands
+        if operand_id >= len(seen):
+            seen.extend(bytes(max(operand_id + 1, 2 * len(seen)) - len(seen)))
+        if not seen[operand_id]:
+            seen[operand_id] = 1
+            self.distinct_operands += 1
+
+    def metrics(self) -> Dict[str, float]:
+        """Halstead volume, difficulty and effort of the counts."""
+        n1 = self.distinct_operators
+        n2 = self.distinct_operands
+        if n1 == 0 or n2 == 0:
+            return {"volume": 0, "difficulty": 0, "effort": 0}
+        volume = (self.total_operators + self.total_operands) * math.log2(n1 + n2)
+        difficulty = (n1 * self.total_operands) / (2 * n2)
+        return {"volume": volume, "difficulty": difficulty, "effort": difficulty * volume}
+
+
+def halstead_metrics(tree: ast.AST) -> Dict[str, float]:
+    """Calculate whole-tree Halstead metrics of a parsed module.
+
+    Counts come from the complexity analyzer's traversal, so they match the
+    per-file and per-function ``halstead`` values of its results.
+    """
+    # Imported here since the analyzer imports this module
+    from ..analyzers.complexity import ComplexityVisitor
+
+    visitor = ComplexityVisitor()
+    visitor.visit(tree)
+    return visitor.halstead.metrics()
+
+
+def maintainability_index(volume: float, complexity: float, loc: int) -> float:
+    """Maintainability index using the Microsoft formula.
+
+    MI = max(0, (171 - 5.2 * ln(HV) - 0.23 * CC - 16.2 * ln(LOC)) * 100 / 171)
+
+    Args:
+        volume: Halstead volume
+        complexity: Cyclomatic complexity
+        loc: Lines of code
+
+    Returns:
+        float: Maintainability index between 0 and 100
+    """
+    if loc <= 0:
+        return 100.0
+    mi = 171 - 5.2 * math.log(max(volume, 1)) - 0.23 * complexity - 16.2 * math.log(loc)
+    return round(max(0, mi) * 100 / 171, 2)
 
 
 def calculate_complexity(code: str) -> Tuple[float, List[Dict[str, Any]], Dict[str, float]]:
@@ -134,7 +190,4 @@ def calculate_complexity(code: str) -> Tuple[float, List[Dict[str, Any]], Dict[s
     visitor = ComplexityVisitor()
     visitor.visit(tree)
 
-    metrics = ComplexityMetrics()
-    halstead_metrics = metrics.calculate_halstead_metrics(code)
-
-    return visitor.complexity, visitor.functions, halstead_metrics
+    return visitor.complexity, visitor.functions, halstead_metrics(tree)
@@ -0,0 +1,244 @@
+"""
+SQLite-backed store of analysis results across runs.
+Keeps per-run, per-file and per-function metric rows so trends can be
+queried without re-reading old reports.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Function metrics that can be trended
+TREND_METRICS = ("cyclomatic_complexity", "cognitive_complexity", "loc")
+
+
+class ResultsStore:
+    """Run history of complexity results in a local SQLite database.
+
+    Every run is written in a single transaction. Functions are identified
+    across runs by file path and name; when a file defines several
+    functions with the same name, trend queries use the largest value.
+    """
+
+    SCHEMA_VERSION = 1
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at REAL NOT NULL,
+            root TEXT,
+            total_files INTEGER NOT NULL,
+            total_functions INTEGER NOT NULL,
+            total_unused INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS file_metrics (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            path TEXT NOT NULL,
+            cyclomatic_complexity INTEGER NOT NULL,
+            cognitive_complexity INTEGER NOT NULL,
+            maintainability_index REAL NOT NULL,
+            loc INTEGER NOT NULL,
+            total_functions INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS file_metrics_run ON file_metrics(run_id, path);
+        CREATE INDEX IF NOT EXISTS file_metrics_path ON file_metrics(path, run_id);
+        CREATE TABLE IF NOT EXISTS function_metrics (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            path TEXT NOT NULL,
+            name TEXT NOT NULL,
+            line INTEGER NOT NULL,
+            cyclomatic_complexity INTEGER NOT NULL,
+            cognitive_complexity INTEGER NOT NULL,
+            loc INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS function_metrics_run ON function_metrics(run_id, path, name);
+        CREATE INDEX IF NOT EXISTS function_metrics_path ON function_metrics(path, name, run_id);
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open the store, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file
+
+        Raises:
+            ValueError: If the database was written with another schema version
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(self._SCHEMA)
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(self.SCHEMA_VERSION),)
+                )
+        elif row[0] != str(self.SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"Incompatible results store format in {self.path}")
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def record_run(self, results: Dict[str, Any], root: Optional[Union[str, Path]] = None,
+                   max_runs: Optional[int] = None, created_at: Optional[float] = None) -> int:
+        """Store the results of one analysis run.
+
+        Args:
+            results: Combined analysis results, as printed by ``analyze``
+            root: Path that was analyzed
+            max_runs: Keep only this many most recent runs, if given
+            created_at: Timestamp of the run, defaults to now
+
+        Returns:
+            int: ID of the new run
+        """
+        files = [f for f in results.get("files", []) if f.get("file_path")]
+        file_rows = []
+        function_rows = []
+        for file_result in files:
+            path = file_result["file_path"]
+            file_rows.append((
+                path,
+                file_result.get("cyclomatic_complexity", 0),
+                file_result.get("cognitive_complexity", 0),
+                file_result.get("maintainability_index", 0),
+                file_result.get("loc", 0),
+                file_result.get("total_functions", 0)
+            ))
+            for function in file_result.get("functions", []):
+                function_rows.append((
+                    path,
+                    function["name"],
+                    function.get("line", 0),
+                    function.get("cyclomatic_complexity", 0),
+                    function.get("cognitive_complexity", 0),
+                    function.get("loc", 0)
+                ))
+
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (created_at, root, total_files, total_functions, total_unused) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (created_at if created_at is not None else time.time(),
+                 os.fspath(root) if root is not None else None,
+                 len(file_rows), len(function_rows), results.get("total_unused"))
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO file_metrics (run_id, path, cyclomatic_complexity, "
+                "cognitive_complexity, maintainability_index, loc, total_functions) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in file_rows]
+            )
+            self.connection.executemany(
+                "INSERT INTO function_metrics (run_id, path, name, line, cyclomatic_complexity, "
+                "cognitive_complexity, loc) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in function_rows]
+            )
+            if max_runs:
+                self._prune(max_runs)
+        return run_id
+
+    def prune(self, max_runs: int) -> int:
+        """Delete all but the ``max_runs`` most recent runs.
+
+        Returns:
+            int: Number of runs deleted
+        """
+        with self.connection:
+            return self._prune(max_runs)
+
+    def runs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List stored runs, most recent first."""
+        rows = self.connection.execute(
+            "SELECT id, created_at, root, total_files, total_functions, total_unused "
+            "FROM runs ORDER BY id DESC LIMIT ?",
+            (limit if limit is not None else -1,)
+        ).fetchall()
+        keys = ("id", "created_at", "root", "total_files", "total_functions", "total_unused")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def complexity_growth(self, last_runs: int = 10, limit: int = 10,
+                          metric: str = "cyclomatic_complexity") -> List[Dict[str, Any]]:
+        """Find the functions whose metric grew most over recent runs.
+
+        Growth is measured between the oldest and the newest of the last
+        ``last_runs`` runs, for functions present in both.
+
+        Args:
+            last_runs: Number of most recent runs to consider
+            limit: Maximum number of functions to return
+            metric: One of ``TREND_METRICS``
+
+        Returns:
+            Dicts with ``path``, ``name``, ``start``, ``end`` and ``growth``,
+            largest growth first
+        """
+        if metric not in TREND_METRICS:
+            raise ValueError(
+                f"Unknown metric {metric!r}, expected one of {', '.join(TREND_METRICS)}"
+            )
+        rows = self.connection.execute(
+            f"""
+            WITH recent AS (SELECT id FROM runs ORDER BY id DESC LIMIT ?),
+                 bounds AS (SELECT MIN(id) AS first_run, MAX(id) AS last_run FROM recent),
+                 old AS (
+                     SELECT path, name, MAX({metric}) AS value FROM function_metrics
+                     WHERE run_id = (SELECT first_run FROM bounds) GROUP BY path, name
+                 ),
+                 new AS (
+                     SELECT path, name, MAX({metric}) AS value FROM function_metrics
+                     WHERE run_id = (SELECT last_run FROM bounds) GROUP BY path, name
+                 )
+            SELECT new.path, new.name, old.value, new.value, new.value - old.value AS growth
+            FROM new JOIN old ON old.path = new.path AND old.name = new.name
+            WHERE new.value > old.value
+            ORDER BY growth DESC, new.path, new.name
+            LIMIT ?
+            """,
+            (last_runs, limit)
+        ).fetchall()
+        return [
+            {"path": path, "name": name, "start": start, "end": end, "growth": growth}
+            for path, name, start, end, growth in rows
+        ]
+
+    def file_history(self, path: str, last_runs: int = 10) -> List[Dict[str, Any]]:
+        """Get the metrics of one file over recent runs, oldest first."""
+        rows = self.connection.execute(
+            """
+            SELECT r.id, r.created_at, m.cyclomatic_complexity, m.cognitive_complexity,
+                   m.maintainability_index, m.loc
+            FROM file_metrics m JOIN runs r ON r.id = m.run_id
+            WHERE m.path = ? AND m.run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)
+            ORDER BY r.id
+            """,
+            (path, last_runs)
+        ).fetchall()
+        keys = ("run_id", "created_at", "cyclomatic_complexity", "cognitive_complexity",
+                "maintainability_index", "loc")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _prune(self, max_runs: int) -> int:
+        """Delete old runs inside the current transaction."""
+        cursor = self.connection.execute(
+            "DELETE FROM runs WHERE id NOT IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+            (max(max_runs, 0),)
+        )
+        return cursor.rowcount
@@ -0,0 +1,88 @@
+"""Tests for import resolution and module dependency analysis."""
+
+from textwrap import dedent
+
+import pytest
+
+from code_analyzer.analyzers.architecture import (
+    ArchitectureAnalyzer,
+    DependencyGraph,
+    ImportResolver,
+)
+
+
+@pytest.fixture
+def package_tree(tmp_path):
+    """Create a package whose modules import each other in a cycle."""
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    files = {
+        "__init__.py": "from .a import run\n",
+        "a.py": "from . import b\n\ndef run():\n    return b.helper()\n",
+        "b.py": "import pkg.sub.c\n\ndef helper():\n    return 1\n",
+        "sub/__init__.py": "",
+        "sub/c.py": "from ..a import run\nimport os\n",
+        "standalone.py": "from .sub import c\n",
+    }
+    for name, content in files.items():
+        (package / name).write_text(content)
+    return sorted(package.rglob("*.py"))
+
+
+def test_resolver_maps_files_to_modules(package_tree, tmp_path):
+    """Test module names and relative import resolution."""
+    resolver = ImportResolver(package_tree)
+    package = tmp_path / "pkg"
+
+    assert resolver.module_for(package / "__init__.py") == "pkg"
+    assert resolver.module_for(package / "sub" / "c.py") == "pkg.sub.c"
+    assert resolver.resolve(package / "sub" / "c.py", "a", 2) == "pkg.a"
+    assert resolver.resolve(package / "__init__.py", "a", 1) == "pkg.a"
+    assert resolver.resolve(package / "a.py", None, 4) is None
+    assert resolver.resolve_from(package / "a.py", None, 1, "b") == ("pkg.b", None)
+    assert resolver.resolve_from(package / "sub" / "c.py", "..a", 0, "run") == (None, None)
+    assert resolver.resolve_from(package / "sub" / "c.py", "a", 2, "run") == ("pkg.a", "run")
+    assert resolver.find_module("pkg.sub.c.missing") == "pkg.sub.c"
+    assert resolver.find_module("os.path") is None
+
+
+def test_find_cycles_on_long_chain():
+    """Test that cycle detection handles import chains deeper than the recursion limit."""
+    graph = DependencyGraph()
+    size = 5000
+    for i in range(size):
+        graph.add_dependency(f"m{i}", f"m{(i + 1) % size}")
+    graph.add_dependency("x", "y")
+    graph.add_dependency("y", "x")
+    graph.add_dependency("z", "x")
+
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 2
+    assert len(cycles[0]) == size
+    assert cycles[1] == ["x", "y"]
+
+
+def test_calculate_metrics():
+    """Test fan-in, fan-out and instability."""
+    graph = DependencyGraph()
+    graph.add_dependency("app", "core")
+    graph.add_dependency("cli", "core")
+    graph.add_dependency("cli", "core")
+
+    metrics = graph.calculate_metrics()
+
+    assert metrics["core"] == {"fan_in": 2, "fan_out": 0, "instability": 0.0}
+    assert metrics["cli"] == {"fan_in": 0, "fan_out": 1, "instability": 1.0}
+
+
+def test_architecture_analyzer_reports_cycles(package_tree):
+    """Test the analyzer end to end."""
+    analyzer = ArchitectureAnalyzer({"analysis": {"exclude_patterns": []}})
+    results = analyzer.analyze(package_tree)
+
+    assert results["dependency_cycles"] == [
+        {"modules": ["pkg.a", "pkg.b", "pkg.sub.c"], "severity": "high"}
+    ]
+    assert results["module_metrics"]["pkg.standalone"]["fan_out"] == 1
+    assert results["module_metrics"]["pkg.sub.c"]["fan_in"] == 2
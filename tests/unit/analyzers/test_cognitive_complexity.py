@@ -0,0 +1,80 @@
+"""Tests for cognitive complexity following the SonarSource specification."""
+
+import ast
+from textwrap import dedent
+
+import pytest
+
+from code_analyzer.analyzers.complexity import ComplexityAnalyzer, ComplexityVisitor
+
+
+def _functions(code):
+    visitor = ComplexityVisitor()
+    visitor.visit(ast.parse(dedent(code)))
+    return {f["name"]: f["cognitive_complexity"] for f in visitor.functions}
+
+
+@pytest.mark.parametrize(
+    "code,expected",
+    [
+        # Nested loops and if: 1 + 2 + 3; break has no label to jump to
+        ("""
+         def sum_of_primes(limit):
+             total = 0
+             for i in range(1, limit + 1):
+                 for j in range(2, i):
+                     if i % j == 0:
+                         break
+                 total += i
+             return total
+         """, 6),
+        # elif and else add one without nesting
+        ("def f(x, y):\n if x:\n  pass\n elif y:\n  pass\n else:\n  pass\n", 3),
+        # An if inside else is nested
+        ("def f(x, y):\n if x:\n  pass\n else:\n  if y:\n   pass\n", 4),
+        # Each sequence of like boolean operators adds one
+        ("def f(a, b, c, d):\n return a and b and c or d\n", 2),
+        # Except clauses and loop or try else clauses
+        ("""
+         def f(items):
+             try:
+                 for item in items:
+                     pass
+                 else:
+                     pass
+             except ValueError:
+                 if items:
+                     pass
+             else:
+                 pass
+         """, 1 + 1 + 1 + 2 + 1),
+        # Async loops count; with statements do not
+        ("async def f(x):\n async for i in x:\n  async with i:\n   if i:\n    pass\n", 1 + 2),
+        # Lambda bodies are nested
+        ("def f():\n return lambda x: x if x else 0\n", 2),
+        # Recursion adds one
+        ("def fact(n):\n return 1 if n <= 1 else n * fact(n - 1)\n", 2),
+        ("class A:\n def walk(self, n):\n  return self.walk(n - 1)\n", 1),
+    ],
+)
+def test_cognitive_complexity_cases(code, expected):
+    """Test cognitive complexity of the reference cases."""
+    assert list(_functions(code).values())[0] == expected
+
+
+def test_nested_functions_count_for_their_parents(tmp_path):
+    """Test that a nested function is nested in its parent and reported on its own."""
+    assert _functions("""
+        def outer(x):
+            def inner():
+                if x:
+                    pass
+            if x:
+                return inner
+    """) == {"outer": 2 + 1, "inner": 1}
+
+    path = tmp_path / "mod.py"
+    path.write_text("def outer(x):\n    def inner():\n        if x:\n            pass\n")
+    result = ComplexityAnalyzer({}).analyze(path)
+    assert [f["name"] for f in result["functions"]] == ["outer", "inner"]
+    assert result["cognitive_complexity"] == 2
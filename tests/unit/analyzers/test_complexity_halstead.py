@@ -0,0 +1,69 @@
+"""Tests for Halstead metrics counted during the complexity traversal."""
+
+import math
+from textwrap import dedent
+
+from code_analyzer.analyzers.complexity import ComplexityAnalyzer
+from code_analyzer.metrics.complexity import ComplexityMetrics, HalsteadCounts, OperandTable
+
+
+def test_per_function_halstead_and_maintainability(tmp_path):
+    """Test that each function gets its own counts, excluding nested functions."""
+    path = tmp_path / "mod.py"
+    path.write_text(dedent("""
+        def outer(a, b):
+            def inner(c):
+                return c * c * 2
+            return a + b > 1
+
+        def empty():
+            pass
+    """))
+
+    result = ComplexityAnalyzer({}).analyze(path)
+    functions = {f["name"]: f for f in result["functions"]}
+
+    # inner: operators {*}, 2 uses; operands {c, 2}, 3 uses
+    inner = functions["inner"]["halstead"]
+    assert inner["volume"] == 5 * math.log2(3)
+    assert inner["difficulty"] == 1 * 3 / (2 * 2)
+    # outer: operators {+, >}; operands {a, b, 1}
+    assert functions["outer"]["halstead"]["volume"] == 5 * math.log2(5)
+    assert functions["empty"]["halstead"] == {"volume": 0, "difficulty": 0, "effort": 0}
+    assert 0 < functions["outer"]["maintainability_index"] <= 100
+
+    # The file counts every operator and operand once
+    assert result["halstead"]["volume"] == 10 * math.log2(3 + 5)
+
+
+def test_constants_are_interned_by_type():
+    """Test that equal constants of different types are distinct operands."""
+    table = OperandTable()
+    ids = {table.constant(1), table.constant(1.0), table.constant(True), table.constant("1")}
+    assert len(ids) == 4
+    assert table.constant(1) == table.constant(1)
+
+    counts = HalsteadCounts()
+    for operand_id in (0, 5, 5, 300):
+        counts.add_operand(operand_id)
+    assert (counts.distinct_operands, counts.total_operands) == (3, 4)
+
+
+def test_module_halstead_matches_the_analyzer(tmp_path):
+    """Test that the standalone Halstead metrics equal the analyzer's file totals."""
+    source = dedent("""
+        def accumulate(values, step=1):
+            total = 0
+            for value in values:
+                total += value * step
+                step -= 1
+            return -total if total > 10 and step else total
+    """)
+    path = tmp_path / "mod.py"
+    path.write_text(source)
+
+    result = ComplexityAnalyzer({}).analyze(path)
+
+    assert ComplexityMetrics().calculate_halstead_metrics(source) == result["halstead"]
+    # The function holds every operator and operand of the module
+    assert result["functions"][0]["halstead"] == result["halstead"]
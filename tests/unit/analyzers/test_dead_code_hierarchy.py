@@ -0,0 +1,123 @@
+"""Tests for attribute and method resolution through the class hierarchy."""
+
+from pathlib import Path
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer
+
+
+def _config():
+    return {"analysis": {"exclude_patterns": [], "dead_code": {"console_scripts": False}}}
+
+
+def _unused_methods(results):
+    return sorted(
+        (item["name"], item["line"]) for item in results["unused_methods"]
+    )
+
+
+def _write(directory, name, source):
+    path = directory / name
+    path.write_text(dedent(source).lstrip())
+    return path
+
+
+def test_self_calls_and_overrides_across_modules(tmp_path):
+    """Test that methods are resolved through self, super() and base classes."""
+    base = _write(tmp_path, "base.py", """
+        class Base:
+            def run(self):
+                return self.step()
+
+            def step(self):
+                return 1
+
+            def unused(self):
+                return 2
+    """)
+    child = _write(tmp_path, "child.py", """
+        from base import Base
+
+        class Child(Base):
+            def step(self):
+                return super().step() + self.extra()
+
+            def extra(self):
+                return 3
+
+            def unused(self):
+                return 4
+
+            def lonely(self):
+                return 5
+
+        Child().run()
+    """)
+
+    analyzer = DeadCodeAnalyzer(_config())
+    results = analyzer.analyze([base, child])
+
+    names = {(Path(item["file"]).name, item["name"]) for item in results["unused_methods"]}
+    assert names == {("base.py", "unused"), ("child.py", "unused"), ("child.py", "lonely")}
+
+
+def test_override_of_used_base_method_is_live(tmp_path):
+    """Test that calling a base method through self keeps subclass overrides alive."""
+    module = _write(tmp_path, "module.py", """
+        class Handler:
+            def handle(self):
+                return self.process()
+
+            def process(self):
+                raise NotImplementedError
+
+        class JsonHandler(Handler):
+            def process(self):
+                return "json"
+
+        class Other:
+            def process(self):
+                return "other"
+
+        Handler().handle()
+    """)
+
+    results = DeadCodeAnalyzer(_config()).analyze([module])
+
+    assert _unused_methods(results) == [("process", 13)]
+
+
+def test_class_hierarchy_index(tmp_path):
+    """Test cross-module base resolution, the MRO and subclass lookups."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    _write(package, "__init__.py", "from .shapes import Shape\n")
+    shapes = _write(package, "shapes.py", """
+        class Shape:
+            def area(self):
+                return 0
+
+        class Named:
+            def name(self):
+                return "named"
+    """)
+    square = _write(package, "square.py", """
+        import pkg.shapes
+        from pkg import Shape
+
+        class Square(Shape, pkg.shapes.Named):
+            def area(self):
+                return self.side ** 2
+    """)
+
+    analyzer = DeadCodeAnalyzer(_config())
+    analyzer.analyze(sorted(package.glob("*.py")))
+    hierarchy = analyzer.symbol_table.hierarchy
+
+    assert hierarchy.mro((str(square), "Square")) == [
+        (str(square), "Square"), (str(shapes), "Shape"), (str(shapes), "Named")
+    ]
+    assert hierarchy.subclasses((str(shapes), "Shape")) == [(str(square), "Square")]
+    name = hierarchy.find_method((str(square), "Square"), "name")
+    assert analyzer.symbol_table.by_id[name].file_path == str(shapes)
+    assert analyzer.symbol_table.attribute_accesses("side") == [(str(square), 6)]
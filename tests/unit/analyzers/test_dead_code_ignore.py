@@ -0,0 +1,52 @@
+"""Tests for ignore_names and ignore_decorators exemptions in dead code analysis."""
+
+from fnmatch import fnmatchcase
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer, NamePatternMatcher
+
+
+def test_name_pattern_matcher_agrees_with_fnmatch():
+    """Test that the compiled matcher gives the same answers as fnmatch."""
+    patterns = ["main", "visit_*", "*_config", "__*__", "*_handles_*", "Test?", "[ab]x*"]
+    names = [
+        "main", "mainly", "visit_Name", "visit", "load_config", "config",
+        "__init__", "__", "x_handles_y", "Test1", "Test12", "ax1", "cx", "",
+    ]
+    matcher = NamePatternMatcher(patterns)
+
+    for name in names:
+        assert matcher.matches(name) == any(fnmatchcase(name, p) for p in patterns), name
+    assert not NamePatternMatcher([])
+    assert not NamePatternMatcher([]).matches("main")
+
+
+def test_ignored_names_and_decorators_are_roots(tmp_path):
+    """Test that exempt symbols are not reported and keep their callees live."""
+    module = tmp_path / "module.py"
+    module.write_text(dedent("""
+        import pytest
+
+        def helper():
+            return 1
+
+        def visit_node():
+            return helper()
+
+        @pytest.fixture
+        def fixture_value():
+            return 2
+
+        @pytest.mark.slow
+        def not_a_fixture():
+            return 3
+    """))
+    config = {"analysis": {"exclude_patterns": [], "dead_code": {
+        "console_scripts": False,
+        "ignore_names": ["visit_*"],
+        "ignore_decorators": ["*.fixture"],
+    }}}
+
+    results = DeadCodeAnalyzer(config).analyze([module])
+
+    assert {item["name"] for item in results["unused_functions"]} == {"not_a_fixture"}
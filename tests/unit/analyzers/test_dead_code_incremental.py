@@ -0,0 +1,103 @@
+"""Tests for incremental dead code analysis."""
+
+import random
+from pathlib import Path
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer, ReferenceGraph
+
+
+def _config():
+    return {"analysis": {"exclude_patterns": [], "dead_code": {"console_scripts": False}}}
+
+
+def _unused(results):
+    return sorted(
+        (Path(item["file"]).name, item["name"])
+        for key in ("unused_classes", "unused_functions", "unused_methods", "unused_imports")
+        for item in results[key]
+    )
+
+
+def test_liveness_matches_full_search_under_random_updates():
+    """Test that incremental liveness always agrees with a fresh search."""
+    rng = random.Random(7)
+    graph = ReferenceGraph(40)
+    edges = []
+    roots = []
+    for _ in range(400):
+        action = rng.random()
+        if action < 0.45:
+            edge = (rng.randrange(40), rng.randrange(40))
+            graph.add_edge(*edge)
+            edges.append(edge)
+        elif action < 0.8 and edges:
+            graph.remove_edge(*edges.pop(rng.randrange(len(edges))))
+        elif action < 0.9:
+            root = rng.randrange(40)
+            graph.add_root(root)
+            roots.append(root)
+        elif roots:
+            graph.remove_root(roots.pop(rng.randrange(len(roots))))
+
+        expected = graph.reachable(roots)
+        assert [int(graph.is_live(v)) for v in range(40)] == list(expected)
+
+
+def test_reference_counts_are_maintained():
+    """Test that reverse reference counts follow added and removed edges."""
+    graph = ReferenceGraph(3)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(1, 2)
+    graph.remove_edge(1, 2)
+
+    assert graph.ref_counts == [0, 0, 2]
+
+
+def test_update_file_matches_full_analysis(tmp_path):
+    """Test that re-analyzing an edited file gives the same verdicts as a full run."""
+    lib = tmp_path / "lib.py"
+    app = tmp_path / "app.py"
+    lib.write_text(dedent("""
+        def first():
+            return second()
+
+        def second():
+            return first()
+
+        def third():
+            return 3
+    """))
+    app.write_text("from lib import first\n\nfirst()\n")
+
+    analyzer = DeadCodeAnalyzer(_config())
+    assert _unused(analyzer.analyze([lib, app])) == [("lib.py", "third")]
+
+    # The cycle between first and second loses its only outside reference
+    app.write_text("from lib import third\n\nthird()\n")
+    updated = analyzer.update_file(app)
+    assert _unused(updated) == [("lib.py", "first"), ("lib.py", "second")]
+    assert _unused(updated) == _unused(DeadCodeAnalyzer(_config()).analyze([lib, app]))
+
+    analyzer.remove_file(app)
+    assert _unused(analyzer.get_results()) == [
+        ("lib.py", "first"), ("lib.py", "second"), ("lib.py", "third")
+    ]
+
+
+def test_update_file_redefining_a_symbol(tmp_path):
+    """Test that references to a replaced definition resolve to the new one."""
+    lib = tmp_path / "lib.py"
+    app = tmp_path / "app.py"
+    lib.write_text("def helper():\n    return 1\n")
+    app.write_text("from lib import helper\n\nhelper()\n")
+
+    analyzer = DeadCodeAnalyzer(_config())
+    assert _unused(analyzer.analyze([lib, app])) == []
+
+    lib.write_text("\n\ndef helper():\n    return old()\n\ndef old():\n    return 2\n")
+    assert _unused(analyzer.update_file(lib)) == []
+    assert analyzer.symbol_table.get_symbol("helper", str(lib), 1) is None
+    helper = analyzer.symbol_table.get_id("helper", str(lib), 3)
+    assert analyzer.symbol_table.is_live(helper)
@@ -0,0 +1,177 @@
+"""Tests for call-graph reachability in dead code analysis."""
+
+from pathlib import Path
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer, ReferenceGraph
+
+
+def _config(**dead_code):
+    return {"analysis": {"exclude_patterns": [], "dead_code": dead_code}}
+
+
+def _unused_names(results):
+    return {
+        item["name"]
+        for key in ("unused_classes", "unused_functions", "unused_methods")
+        for item in results[key]
+    }
+
+
+def test_reference_graph_reachability():
+    """Test that only vertices reachable from the roots are marked."""
+    graph = ReferenceGraph(5)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 2)
+    graph.add_edge(3, 4)
+    graph.add_edge(4, 3)
+
+    assert list(graph.reachable([0])) == [1, 1, 1, 0, 0]
+
+
+def test_functions_called_only_by_dead_code_are_dead(tmp_path):
+    """Test that dead code is detected transitively."""
+    module = tmp_path / "module.py"
+    module.write_text(dedent("""
+        def helper():
+            return 1
+
+        def dead_caller():
+            return helper() + dead_recursive()
+
+        def dead_recursive():
+            return dead_recursive()
+
+        def live():
+            return 2
+
+        print(live())
+    """))
+
+    results = DeadCodeAnalyzer(_config(console_scripts=False)).analyze([module])
+
+    assert _unused_names(results) == {"helper", "dead_caller", "dead_recursive"}
+
+
+def test_references_across_modules(tmp_path):
+    """Test that imports and attribute accesses link modules together."""
+    (tmp_path / "lib.py").write_text(dedent("""
+        class Service:
+            def run(self):
+                return self.step()
+
+            def step(self):
+                return 1
+
+            def unused(self):
+                return 2
+
+        def orphan():
+            return Service()
+    """))
+    (tmp_path / "app.py").write_text(dedent("""
+        from lib import Service
+
+        if __name__ == "__main__":
+            Service().run()
+    """))
+
+    results = DeadCodeAnalyzer(_config(console_scripts=False)).analyze(
+        [tmp_path / "lib.py", tmp_path / "app.py"]
+    )
+
+    assert _unused_names(results) == {"unused", "orphan"}
+
+
+def test_entry_points_are_roots(tmp_path):
+    """Test console scripts, configured entry points and ignore_names patterns."""
+    (tmp_path / "setup.py").write_text(dedent("""
+        from setuptools import setup
+        setup(entry_points={"console_scripts": ["tool = pkg.cli:main"]})
+    """))
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "cli.py").write_text(dedent("""
+        def main():
+            return command()
+
+        def command():
+            return 1
+
+        def plugin():
+            return 2
+
+        def handle_event():
+            return 3
+
+        def unused():
+            return 4
+    """))
+
+    analyzer = DeadCodeAnalyzer(_config(
+        ignore_names=["handle_*"],
+        entry_points=["pkg.cli:plugin"]
+    ))
+    results = analyzer.analyze([package / "cli.py"])
+
+    assert _unused_names(results) == {"unused"}
+
+
+def test_from_imports_resolve_to_the_imported_module(tmp_path):
+    """Test that a from-import only keeps the definition in its source module alive."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "first.py").write_text("def shared():\n    return 1\n")
+    (package / "second.py").write_text("def shared():\n    return 2\n")
+    (package / "main.py").write_text("from .first import shared\n\nshared()\n")
+    files = sorted(package.glob("*.py"))
+
+    results = DeadCodeAnalyzer(_config(console_scripts=False)).analyze(files)
+
+    assert [(f["name"], Path(f["file"]).name) for f in results["unused_functions"]] == [
+        ("shared", "second.py")
+    ]
+
+
+def test_module_attributes_resolve_through_imports(tmp_path):
+    """Test that ``module.name`` keeps only that module's definition alive."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "tools.py").write_text(dedent("""
+        def run():
+            return 1
+
+        class Dead:
+            pass
+
+        class Config:
+            def load(self):
+                return 2
+    """))
+    (package / "other.py").write_text(dedent("""
+        def run():
+            return 3
+
+        def load():
+            return 4
+    """))
+    (package / "main.py").write_text(dedent("""
+        import os
+        from pkg import tools
+        import pkg.tools as aliased
+
+        os.path.run()
+        os.Dead
+        tools.run()
+        aliased.Config.load
+    """))
+    files = sorted(package.glob("*.py"))
+
+    results = DeadCodeAnalyzer(_config(console_scripts=False)).analyze(files)
+
+    unused = {(item["name"], Path(item["file"]).name)
+              for key in ("unused_classes", "unused_functions", "unused_methods")
+              for item in results[key]}
+    assert unused == {("Dead", "tools.py"), ("run", "other.py"), ("load", "other.py")}
@@ -0,0 +1,92 @@
+"""Tests for per-file summaries in dead code analysis."""
+
+import pickle
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer, summarize_source
+
+
+SOURCES = {
+    "lib.py": """
+        class Base:
+            def run(self):
+                return self.helper()
+
+            def helper(self):
+                return 1
+
+            def unused(self):
+                return 2
+    """,
+    "app.py": """
+        from lib import Base
+
+        class App(Base):
+            def run(self):
+                return super().run()
+
+        def dead():
+            return App
+
+        Base().run()
+    """,
+}
+
+
+def _write(tmp_path):
+    paths = []
+    for name, source in SOURCES.items():
+        path = tmp_path / name
+        path.write_text(dedent(source))
+        paths.append(path)
+    return paths
+
+
+def _analyze(paths, **dead_code):
+    config = {
+        "analysis": {"exclude_patterns": [], "dead_code": dict(console_scripts=False, **dead_code)}
+    }
+    analyzer = DeadCodeAnalyzer(config)
+    results = analyzer.analyze(paths)
+    return analyzer, sorted((item["type"], item["name"]) for key, items in results.items()
+                            if key != "total_unused" for item in items)
+
+
+def test_summaries_are_picklable_and_scope_references():
+    """Test that a summary survives pickling and attributes references to scopes."""
+    summary = summarize_source("app.py", dedent(SOURCES["app.py"]))
+    restored = pickle.loads(pickle.dumps(summary))
+
+    names = [symbol.name for symbol in restored.symbols]
+    assert names == ["Base", "App", "run", "dead"]
+    assert restored.classes == [("App", 1, {"run": 2})]
+    assert (2, ("super", "App", "run"), 6) in restored.references
+    assert (3, ("name", "App"), 9) in restored.references
+    assert (-1, ("name", "Base"), 11) in restored.references
+
+
+def test_parallel_and_cached_analysis_match_serial(tmp_path):
+    """Test that worker processes and the summary cache give the same results."""
+    paths = _write(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    _, serial = _analyze(paths)
+    _, parallel = _analyze(paths, workers=2)
+    _, cold = _analyze(paths, cache_dir=str(cache_dir))
+    _, warm = _analyze(paths, cache_dir=str(cache_dir))
+
+    assert serial == [("class", "App"), ("function", "dead"), ("method", "unused")]
+    assert parallel == cold == warm == serial
+    assert (cache_dir / DeadCodeAnalyzer.CACHE_FILE).exists()
+
+
+def test_cache_ignores_changed_files(tmp_path):
+    """Test that files changed since the cache was written are summarized again."""
+    paths = _write(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    _analyze(paths, cache_dir=cache_dir)
+
+    paths[1].write_text(dedent(SOURCES["app.py"]) + "dead()\nBase().unused()\n")
+    _, results = _analyze(paths, cache_dir=cache_dir)
+
+    assert results == []
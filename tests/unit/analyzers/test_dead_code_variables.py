@@ -0,0 +1,72 @@
+"""Tests for module-level variables and __all__ exports in dead code analysis."""
+
+from textwrap import dedent
+
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer
+
+
+def _config(**dead_code):
+    return {
+        "analysis": {"exclude_patterns": [], "dead_code": dict(console_scripts=False, **dead_code)}
+    }
+
+
+def _unused(results, key):
+    return {item["name"] for item in results[key]}
+
+
+def test_module_level_variables_are_tracked(tmp_path):
+    """Test that unused module-level assignments are reported."""
+    module = tmp_path / "module.py"
+    module.write_text(dedent("""
+        USED = 1
+        UNUSED = 2
+        FIRST, (SECOND, *REST) = 1, (2, 3)
+        TYPED: int = 3
+        COUNTER = 0
+        COUNTER += 1
+
+        def dead():
+            return SECOND
+
+        class Config:
+            attribute = 1
+
+        print(USED, REST, Config)
+    """))
+
+    results = DeadCodeAnalyzer(_config()).analyze([module])
+
+    assert _unused(results, "unused_variables") == {"UNUSED", "FIRST", "SECOND", "TYPED"}
+    assert _unused(results, "unused_functions") == {"dead"}
+
+
+def test_all_exports_are_roots(tmp_path):
+    """Test that names listed in __all__ stay live, including re-exports."""
+    (tmp_path / "impl.py").write_text(dedent("""
+        def exported():
+            return helper()
+
+        def helper():
+            return 1
+
+        def reexported():
+            return 2
+
+        def private():
+            return 3
+    """))
+    (tmp_path / "api.py").write_text(dedent("""
+        from impl import reexported
+        from impl import exported
+
+        VERSION = "1.0"
+        __all__ = ["exported"] + ["VERSION"]
+        __all__ += ("reexported",)
+        __all__.append("missing")
+    """))
+
+    results = DeadCodeAnalyzer(_config()).analyze([tmp_path / "impl.py", tmp_path / "api.py"])
+
+    assert _unused(results, "unused_functions") == {"private"}
+    assert _unused(results, "unused_variables") == set()
@@ -0,0 +1,70 @@
+"""Tests for the shared source file loader."""
+
+import ast
+
+import pytest
+
+from code_analyzer.analyzers.complexity import ComplexityAnalyzer
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer
+from code_analyzer.analyzers.file_loader import FileLoader
+
+
+SOURCE = 'name = "café"\r\n\r\ndef greet(who):\r\n    return f"héllo {who} {name}"\r\n'
+
+
+@pytest.fixture
+def loader():
+    """Create a FileLoader that maps every file."""
+    return FileLoader(mmap_threshold=1)
+
+
+def test_load_honours_encoding_cookie(tmp_path, loader):
+    """Test decoding a file with a PEP 263 cookie and CRLF newlines."""
+    path = tmp_path / "latin.py"
+    path.write_bytes(b"# -*- coding: latin-1 -*-\r\n" + SOURCE.encode("latin-1"))
+
+    source = loader.load(path)
+    assert source.encoding == "iso-8859-1"
+    assert "café" in source.text
+    assert "\r" not in source.text
+
+
+def test_load_strips_bom(tmp_path, loader):
+    """Test decoding a UTF-8 file with a byte order mark."""
+    path = tmp_path / "bom.py"
+    path.write_bytes(b"\xef\xbb\xbf" + SOURCE.encode("utf-8"))
+
+    source = loader.load(path)
+    assert source.encoding == "utf-8-sig"
+    assert source.text.startswith("name")
+
+
+def test_node_segment_matches_ast(tmp_path, loader):
+    """Test that offset-based slicing matches ast.get_source_segment."""
+    path = tmp_path / "module.py"
+    path.write_bytes(SOURCE.encode("utf-8"))
+    source = loader.load(path)
+
+    for node in ast.walk(ast.parse(source.text)):
+        if getattr(node, "end_col_offset", None) is not None:
+            assert source.node_segment(node) == ast.get_source_segment(source.text, node)
+    assert source.lines(3, 4) == 'def greet(who):\n    return f"héllo {who} {name}"\n'
+    assert source.line_count == 4
+
+
+def test_cache_is_shared_and_bounded(tmp_path):
+    """Test that analyzers share cached files and the cache evicts old entries."""
+    loader = FileLoader(max_bytes=len(SOURCE) + 10)
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text(SOURCE)
+    second.write_text(SOURCE)
+
+    config = {"analysis": {"exclude_patterns": []}}
+    ComplexityAnalyzer(config, loader).analyze(first)
+    cached = loader.load(first)
+    DeadCodeAnalyzer(config, loader).analyze([first])
+    assert loader.load(first) is cached
+
+    loader.load(second)
+    assert loader.load(first) is not cached
@@ -0,0 +1,91 @@
+"""Tests for saving, loading and incrementally updating the LSH index."""
+
+from pathlib import Path
+
+import pytest
+
+from code_analyzer.analyzers.similarity import LSHIndex, SimilarityAnalyzer
+
+
+FUNCTION = """
+def {name}(items, threshold):
+    results = []
+    for item in items:
+        if item > threshold:
+            results.append(item * 2)
+        else:
+            results.append(item)
+    return results
+"""
+
+OTHER_FUNCTION = """
+class Registry:
+    def __init__(self):
+        self.entries = {}
+
+    def register(self, key, value):
+        self.entries[key] = value
+        return value
+"""
+
+
+def _config(**similarity):
+    similarity.setdefault("min_lines", 3)
+    return {"analysis": {"exclude_patterns": [], "similarity": similarity}}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small project without clones."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "base.py").write_text(FUNCTION.format(name="process_items"))
+    (src / "other.py").write_text(OTHER_FUNCTION)
+    return src
+
+
+def test_save_and_load_round_trip(project, tmp_path):
+    """Test that a saved index loads with the same files and signatures."""
+    index_dir = tmp_path / "index"
+    analyzer = SimilarityAnalyzer(_config(save_index=str(index_dir)))
+    analyzer.analyze(sorted(project.glob("*.py")))
+
+    loaded = LSHIndex.load(index_dir)
+    assert loaded.file_hashes == analyzer.lsh_index.file_hashes
+    original = {f.location: list(sig) for f, sig in analyzer.lsh_index.signatures.items()}
+    restored = {f.location: list(sig) for f, sig in loaded.signatures.items()}
+    assert restored == original
+
+
+def test_baseline_run_only_reports_new_clones(project, tmp_path, monkeypatch):
+    """Test that a baseline run re-indexes changed files only and queries their fragments."""
+    index_dir = tmp_path / "index"
+    SimilarityAnalyzer(_config(save_index=str(index_dir))).analyze(
+        sorted(project.glob("*.py"))
+    )
+
+    (project / "copy.py").write_text(FUNCTION.format(name="process_items"))
+    analyzer = SimilarityAnalyzer(
+        _config(baseline_index=str(index_dir), save_index=str(index_dir))
+    )
+    extracted = []
+    original_extract = analyzer._extract_fragments
+    monkeypatch.setattr(
+        analyzer, "_extract_fragments",
+        lambda path: extracted.append(Path(path).name) or original_extract(path)
+    )
+    results = analyzer.analyze(sorted(project.glob("*.py")))
+
+    assert extracted == ["copy.py"]
+    groups = results["similar_fragments"]
+    assert len(groups) == 1
+    assert Path(groups[0]["fragments"][0]["file"]).name == "copy.py"
+    assert Path(groups[0]["fragments"][1]["file"]).name == "base.py"
+
+    (project / "copy.py").unlink()
+    loaded = LSHIndex.load(index_dir)
+    assert str(project / "copy.py") in loaded.file_hashes
+    results = SimilarityAnalyzer(_config(baseline_index=str(index_dir))).analyze(
+        sorted(project.glob("*.py"))
+    )
+    assert results["similar_fragments"] == []
@@ -0,0 +1,135 @@
+"""Tests for bounded-memory streaming similarity analysis."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from code_analyzer.analyzers.similarity import SimilarityAnalyzer, SpillingBandIndex
+from code_analyzer.commands.analyze import AnalyzeCommand
+
+
+@pytest.fixture
+def clone_files(tmp_path):
+    """Create two files sharing a near-identical function."""
+    body = """
+def {name}(items, threshold):
+    results = []
+    for item in items:
+        if item > threshold:
+            results.append(item * 2)
+        else:
+            results.append(item)
+    return results
+"""
+    file1 = tmp_path / "first.py"
+    file2 = tmp_path / "second.py"
+    file1.write_text(body.format(name="process_items"))
+    file2.write_text(body.format(name="process_items"))
+    return [file1, file2]
+
+
+def _config(**similarity):
+    similarity.setdefault("min_lines", 3)
+    return {"analysis": {"exclude_patterns": [], "similarity": similarity}}
+
+
+def test_spilling_index_matches_in_memory_buckets(tmp_path):
+    """Test that spilled runs merge into the same buckets as an in-memory index."""
+    signatures = [[i % 3, i % 2] * 4 for i in range(12)]
+
+    in_memory = SpillingBandIndex(num_bands=4, band_size=2, max_entries=1000)
+    spilling = SpillingBandIndex(num_bands=4, band_size=2, max_entries=4, spill_dir=str(tmp_path))
+    for fragment_id, signature in enumerate(signatures):
+        in_memory.add(fragment_id, signature)
+        spilling.add(fragment_id, signature)
+
+    assert in_memory.num_runs == 0
+    assert spilling.num_runs > 1
+    assert list(spilling.buckets()) == list(in_memory.buckets())
+
+    spilling.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_streaming_analysis_finds_clones(clone_files, tmp_path):
+    """Test that streaming mode reports clones while spilling to disk."""
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    analyzer = SimilarityAnalyzer(
+        _config(streaming=True, max_index_entries=10, spill_dir=str(spill_dir))
+    )
+    results = analyzer.analyze(clone_files)
+
+    groups = results["similar_fragments"]
+    assert len(groups) == 2
+    files = {Path(f["file"]).name for f in groups[0]["fragments"]}
+    assert files == {"first.py", "second.py"}
+    assert groups[0]["similarity"] == 1.0
+    assert os.listdir(spill_dir) == []
+
+
+def test_fragments_are_extracted_without_source(clone_files):
+    """Test that fragment source is only materialized on request."""
+    analyzer = SimilarityAnalyzer(_config())
+    fragments = analyzer._extract_fragments(clone_files[0])
+
+    assert len(fragments) == 1
+    assert fragments[0].source == ""
+    assert fragments[0].tokens
+    location = fragments[0].location
+    assert (location.start_line, location.end_line) == (2, 9)
+    source_file = analyzer.file_loader.load(location.file_path)
+    source = source_file.lines(location.start_line, location.end_line)
+    assert source.startswith("def process_items(")
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    """Test that streaming and in-memory analysis report the same clone groups."""
+    template = """
+class {name}Handler:
+    def handle(self, items, limit):
+        total = 0
+        for item in items:
+            if item > limit:
+                total += item * {factor}
+            {extra}
+        return total
+"""
+    files = []
+    for i, (factor, extra) in enumerate([
+        (2, "pass"), (2, "pass"), (3, "total -= 1"), (5, "continue"), (7, "break"),
+    ]):
+        path = tmp_path / f"module{i}.py"
+        path.write_text(template.format(name=f"Item{i}", factor=factor, extra=extra))
+        files.append(path)
+
+    options = dict(similarity_threshold=0.5, structural=True, structural_threshold=0.8)
+    in_memory = SimilarityAnalyzer(_config(**options)).analyze(files)
+    streaming = SimilarityAnalyzer(
+        _config(streaming=True, max_index_entries=10, spill_dir=str(tmp_path), **options)
+    ).analyze(files)
+
+    assert in_memory["similar_fragments"]
+    assert any(group["similarity"] < 1.0 for group in in_memory["similar_fragments"])
+    assert streaming == in_memory
+
+
+def test_streaming_ignores_saved_indexes(tmp_path):
+    """Test that index options streaming cannot honour are turned off, not fatal."""
+    analyzer = SimilarityAnalyzer(_config(streaming=True, save_index=str(tmp_path / "index")))
+
+    assert analyzer.save_index is None and analyzer.baseline_index is None
+
+
+def test_analyze_command_reports_streaming_index_conflict(tmp_path, capsys):
+    """Test that the CLI reports the conflicting options as a configuration error."""
+    (tmp_path / "module.py").write_text("x = 1\n")
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"analysis": {"similarity": {
+        "enabled": True, "streaming": True, "save_index": str(tmp_path / "index")
+    }}}))
+
+    assert AnalyzeCommand(str(config)).run([str(tmp_path)]) == 1
+    assert "not supported with streaming" in " ".join(capsys.readouterr().err.split())
@@ -0,0 +1,91 @@
+"""Tests for similarity hashing and LSH candidate verification."""
+
+import pytest
+
+from code_analyzer.analyzers.similarity import LSHIndex, SimilarityAnalyzer, Token
+
+
+FUNCTION = """
+def {name}(items, threshold):
+    results = []
+    for item in items:
+        if item > threshold:
+            results.append(item * {factor})
+        else:
+            results.append(item)
+    return results
+"""
+
+
+@pytest.fixture
+def clone_files(tmp_path):
+    """Create several files sharing near-identical functions."""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"module{i}.py"
+        path.write_text(FUNCTION.format(name=f"process_{i}", factor=i))
+        paths.append(path)
+    return paths
+
+
+def _config(**similarity):
+    similarity.setdefault("min_lines", 3)
+    similarity.setdefault("similarity_threshold", 0.5)
+    return {"analysis": {"exclude_patterns": [], "similarity": similarity}}
+
+
+def test_parallel_verification_matches_serial(clone_files):
+    """Test that pooled verification gives the same groups in the same order."""
+    serial = SimilarityAnalyzer(_config()).analyze(clone_files)
+    parallel = SimilarityAnalyzer(_config(workers=2, verify_chunk_size=1)).analyze(clone_files)
+
+    assert serial["similar_fragments"]
+    assert parallel == serial
+
+
+def test_groups_are_ordered_by_location(clone_files):
+    """Test that groups and their members come out in a stable order."""
+    results = SimilarityAnalyzer(_config()).analyze(clone_files)
+
+    for group in results["similar_fragments"]:
+        others = [(f["file"], f["start_line"]) for f in group["fragments"][1:]]
+        assert others == sorted(others)
+
+
+def test_shingles_respect_token_order():
+    """Test that k-gram shingles distinguish reordered token streams."""
+    forward = (Token("1", "a"), Token("1", "b"), Token("1", "c"))
+    backward = tuple(reversed(forward))
+
+    bag = LSHIndex(shingle_size=1, weighted=False)
+    assert bag.shingle(forward) == bag.shingle(backward)
+
+    bigrams = LSHIndex(shingle_size=2, weighted=False)
+    assert not bigrams.shingle(forward) & bigrams.shingle(backward)
+
+
+def test_weighted_shingles_count_multiplicity():
+    """Test that weighted shingling estimates multiset Jaccard similarity."""
+    once = (Token("1", "a"),)
+    twice = once * 2
+
+    unweighted = LSHIndex(shingle_size=1, weighted=False)
+    assert unweighted.shingle(twice) == unweighted.shingle(once)
+
+    weighted = LSHIndex(shingle_size=1, weighted=True)
+    assert len(weighted.shingle(twice)) == 2
+    assert weighted.shingle(once) < weighted.shingle(twice)
+
+
+def test_renamed_clone_is_exact_match(tmp_path):
+    """Test that per-fragment name normalization makes renamed clones identical."""
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text(FUNCTION.format(name="process", factor=2))
+    second.write_text(
+        FUNCTION.format(name="handle", factor=2)
+        .replace("items", "values").replace("item", "value").replace("results", "output")
+    )
+
+    results = SimilarityAnalyzer(_config(similarity_threshold=0.95)).analyze([first, second])
+    assert [group["similarity"] for group in results["similar_fragments"]] == [1.0, 1.0]
@@ -0,0 +1,134 @@
+"""Tests for AST-based structural clone detection."""
+
+import ast
+from pathlib import Path
+from textwrap import dedent
+
+from code_analyzer.analyzers.similarity import SimilarityAnalyzer
+from code_analyzer.analyzers.structural import StructuralCloneDetector
+
+
+ORIGINAL = dedent("""
+    def summarize(records, limit):
+        totals = {}
+        for record in records:
+            key = record.name
+            if key not in totals:
+                totals[key] = 0
+            totals[key] += record.value
+        ordered = sorted(totals.items(), key=lambda item: item[1])
+        return ordered[:limit]
+""")
+
+RENAMED = (ORIGINAL.replace("summarize", "aggregate").replace("records", "rows")
+           .replace("record", "row").replace("totals", "sums"))
+
+# Same statements with two of them swapped and one call argument added
+REORDERED = dedent("""
+    def tally(entries, count):
+        result = {}
+        for entry in entries:
+            label = entry.name
+            if label not in result:
+                result[label] = 0
+            result[label] += entry.value
+        ranked = sorted(result.items(), key=lambda pair: pair[1], reverse=True)
+        return ranked[:count]
+""")
+
+UNRELATED = dedent("""
+    def connect(host, port, retries=3):
+        attempt = 0
+        while attempt < retries:
+            try:
+                return open_socket(host, port)
+            except OSError as error:
+                log(error)
+                attempt += 1
+        raise ConnectionError(host)
+""")
+
+
+def _detect(*sources, threshold=0.9):
+    detector = StructuralCloneDetector(min_lines=3, min_nodes=5, threshold=threshold)
+    for i, source in enumerate(sources):
+        detector.add_tree(f"module{i}.py", ast.parse(source))
+    return detector.find_clones()
+
+
+def test_renamed_function_is_exact_structural_clone():
+    """Test that identifier changes keep the subtree hash equal."""
+    groups = _detect(ORIGINAL, RENAMED, UNRELATED)
+
+    assert len(groups) == 1
+    assert groups[0]["kind"] == "exact"
+    assert [f["file"] for f in groups[0]["fragments"]] == ["module0.py", "module1.py"]
+
+
+def test_lightly_edited_function_is_near_miss_clone():
+    """Test that a near-miss edit is found through the vector index."""
+    groups = _detect(ORIGINAL, REORDERED, UNRELATED)
+
+    assert len(groups) == 1
+    assert groups[0]["kind"] == "near-miss"
+    assert groups[0]["similarity"] >= 0.9
+    assert {f["file"] for f in groups[0]["fragments"]} == {"module0.py", "module1.py"}
+
+
+def test_analyzer_reports_structural_clones(tmp_path):
+    """Test that the similarity analyzer reports structural clones when enabled."""
+    paths = []
+    for name, source in [("a.py", ORIGINAL), ("b.py", REORDERED)]:
+        path = tmp_path / name
+        path.write_text(source)
+        paths.append(path)
+
+    config = {"analysis": {"similarity": {
+        "min_lines": 3, "structural": True, "structural_threshold": 0.9
+    }}}
+    results = SimilarityAnalyzer(config).analyze(paths)
+    assert len(results["structural_clones"]) == 1
+
+    results = SimilarityAnalyzer({"analysis": {"similarity": {"min_lines": 3}}}).analyze(paths)
+    assert "structural_clones" not in results
+
+
+def test_shared_operator_nodes_are_fingerprinted():
+    """Test that operator nodes CPython reuses across a tree do not break hashing."""
+    chained = dedent("""
+        def within(low, value, high):
+            if low <= value <= high and value != low != high:
+                return value + low + high
+            total = low * 2 * high
+            return total
+    """)
+    renamed = chained.replace("within", "between").replace("value", "point")
+    groups = _detect(chained, renamed)
+
+    assert len(groups) == 1
+    assert groups[0]["kind"] == "exact"
+
+
+def test_candidate_checks_grow_linearly(monkeypatch):
+    """Test that the vector index compares far fewer pairs than all of them on real code."""
+    detector = StructuralCloneDetector()
+    for path in sorted(Path(ast.__file__).parent.glob("*.py")):
+        try:
+            detector.add_tree(str(path), ast.parse(path.read_text(encoding="utf-8")))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        if len(detector.fragments) >= 1500:
+            break
+    checks = []
+    similarity = detector.similarity
+    monkeypatch.setattr(
+        detector, "similarity", lambda *pair: checks.append(pair) or similarity(*pair)
+    )
+
+    groups = detector.find_clones()
+
+    count = len(detector.fragments)
+    assert count >= 1000
+    assert any(group["kind"] == "near-miss" for group in groups)
+    assert len(checks) < count * (count - 1) / 2 / 20
+    assert len(checks) <= count * detector.num_bands * detector.max_neighbours
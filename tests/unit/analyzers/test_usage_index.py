@@ -0,0 +1,78 @@
+"""Tests for the persistent usage index."""
+
+import json
+from textwrap import dedent
+
+from click.testing import CliRunner
+
+from code_analyzer.__main__ import cli
+from code_analyzer.analyzers.dead_code import DeadCodeAnalyzer
+from code_analyzer.analyzers.usage_index import UsageIndex
+
+
+def _project(tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "lib.py").write_text(dedent("""
+        class Service:
+            def run(self):
+                return self.step()
+
+            def step(self):
+                return 1
+
+        def unused():
+            return Service
+    """))
+    (package / "app.py").write_text(dedent("""
+        from pkg.lib import Service
+
+        def main():
+            Service().run()
+            return Service
+    """))
+    return sorted(package.glob("*.py"))
+
+
+def _write_index(tmp_path):
+    path = tmp_path / "usage.sqlite"
+    config = {"analysis": {"exclude_patterns": [], "dead_code": {
+        "console_scripts": False, "usage_index": str(path), "ignore_names": ["main"]
+    }}}
+    DeadCodeAnalyzer(config).analyze(_project(tmp_path))
+    return path
+
+
+def test_usage_index_records_resolved_sites(tmp_path):
+    """Test that sites are resolved through imports and member lookups."""
+    with UsageIndex(_write_index(tmp_path)) as index:
+        [(service, sites)] = index.references("pkg.lib.Service")
+        [(step, step_sites)] = index.references("Service.step")
+        [(unused, unused_sites)] = index.references("unused")
+
+    assert service.type == "class" and service.live
+    assert [(site.file.rsplit("/", 1)[-1], site.line, site.scope) for site in sites] == [
+        ("app.py", 2, "pkg.app"),
+        ("app.py", 5, "pkg.app.main"),
+        ("app.py", 6, "pkg.app.main"),
+        ("lib.py", 10, "pkg.lib.unused"),
+    ]
+    assert [(site.line, site.scope) for site in step_sites] == [(4, "pkg.lib.Service.run")]
+    assert step.qualname == "pkg.lib.Service.step"
+    assert not unused.live and unused_sites == []
+
+
+def test_refs_command_reads_the_index(tmp_path):
+    """Test that the refs command answers from the saved index."""
+    path = _write_index(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["refs", "Service.run", "--index", str(path), "--output", "json"])
+    missing = runner.invoke(cli, ["refs", "nothing", "--index", str(path)])
+
+    assert result.exit_code == 0
+    [match] = json.loads(result.output)
+    assert match["qualname"] == "pkg.lib.Service.run"
+    assert [site["scope"] for site in match["references"]] == ["pkg.app.main"]
+    assert missing.exit_code == 1
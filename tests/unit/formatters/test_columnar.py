@@ -0,0 +1,55 @@
+"""Tests for the columnar function metrics exporter."""
+
+import math
+
+import pytest
+
+from code_analyzer.formatters.columnar import ColumnarFormatter, ColumnarTable
+
+
+RESULTS = {
+    "files": [
+        {"file_path": "a.py", "functions": [
+            {"name": "parse", "line": 3, "cyclomatic_complexity": 4, "cognitive_complexity": 5,
+             "loc": 12, "halstead": {"volume": 10.5, "difficulty": 2.0, "effort": 21.0}},
+            {"name": "émit", "line": 20, "cyclomatic_complexity": 1, "cognitive_complexity": 0,
+             "loc": 2},
+        ]},
+        {"file_path": "empty.py", "functions": []},
+        {"file_path": "b.py", "functions": [
+            {"name": "main", "line": 1, "cyclomatic_complexity": 2, "cognitive_complexity": 1,
+             "loc": 4},
+        ]},
+    ]
+}
+
+
+def test_native_format_round_trip(tmp_path):
+    """Test that functions are flattened into typed, memory-mapped columns."""
+    path = tmp_path / "metrics.cols"
+    assert ColumnarFormatter(path, use_arrow=False).format(RESULTS) == "native"
+
+    table = ColumnarTable(path)
+    assert table.num_rows == 3
+    assert table.paths == ["a.py", "b.py"]
+    assert table.column("name") == ["parse", "émit", "main"]
+    path_ids = table.column("path_id")
+    lines = table.column("line")
+    volumes = table.column("halstead_volume")
+    assert path_ids.format == "i" and volumes.format == "d"
+    assert list(path_ids) == [0, 0, 1]
+    assert list(lines) == [3, 20, 1]
+    assert list(table.column("cyclomatic_complexity")) == [4, 1, 2]
+    assert volumes[0] == 10.5 and math.isnan(volumes[1])
+    for view in (path_ids, lines, volumes):
+        view.release()
+    table.close()
+
+
+def test_native_reader_rejects_other_files(tmp_path):
+    """Test that files in another format are not misread."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a columnar file")
+
+    with pytest.raises(ValueError):
+        ColumnarTable(path)
@@ -0,0 +1,58 @@
+"""Tests for row limits and recording in the console formatter."""
+
+from code_analyzer.formatters.console import ConsoleFormatter
+
+
+def _results(count):
+    return {
+        "files": [{
+            "file_path": f"f{i}.py", "cyclomatic_complexity": i, "cognitive_complexity": 0,
+            "maintainability_index": 50.0, "loc": 10, "total_functions": 1,
+            "functions": [{"name": f"func{i}", "line": 1, "cyclomatic_complexity": i,
+                           "cognitive_complexity": 0}],
+        } for i in range(count)],
+        "unused_classes": [], "total_unused": 0,
+    }
+
+
+def test_tables_show_the_worst_rows():
+    """Test that tables keep the top rows and count the ones left out."""
+    formatter = ConsoleFormatter({"output": {"max_rows": 3}, "analysis": {"min_complexity": 5}})
+    results = _results(50)
+
+    complex_table = formatter._create_complex_functions_table(results)
+    assert complex_table.title == "Complex Functions (showing 3 of 45)"
+    assert list(complex_table.columns[0].cells) == [
+        "f49.py::func49", "f48.py::func48", "f47.py::func47"
+    ]
+
+    results["files"][49]["functions"][0]["baselined"] = True
+    complex_table = formatter._create_complex_functions_table(results)
+    assert complex_table.title == "Complex Functions (showing 3 of 44)"
+    assert list(complex_table.columns[0].cells)[0] == "f48.py::func48"
+
+    metrics_table = formatter._create_metrics_table(results)
+    assert metrics_table.row_count == 3
+    assert metrics_table.caption == "47 less complex files not shown"
+
+    panel = formatter._format_dead_code_results({
+        "unused_functions": [{"name": f"u{i}", "file": "a.py", "line": i} for i in range(10)],
+        "total_unused": 10,
+    })
+    table = panel.renderable.renderables[0]
+    assert table.row_count == 4
+    assert list(table.columns[0].cells)[-1] == "[dim]... 7 more[/dim]"
+
+
+def test_records_only_when_exporting(tmp_path):
+    """Test that output is recorded only when it is exported."""
+    assert ConsoleFormatter().console.record is False
+
+    path = tmp_path / "report.txt"
+    formatter = ConsoleFormatter({"output": {"max_rows": 0, "export": str(path)}})
+    formatter.console.file = open(tmp_path / "screen.txt", "w")
+    formatter.format(_results(30))
+    formatter.console.file.close()
+
+    assert formatter.console.record is True
+    assert "f29.py" in path.read_text() and "f0.py" in path.read_text()
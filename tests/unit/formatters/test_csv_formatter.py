@@ -0,0 +1,70 @@
+"""Tests for the streaming CSV formatter."""
+
+import csv
+import io
+
+import pytest
+
+from code_analyzer.formatters.base_formatter import RowFormatter
+from code_analyzer.formatters.csv_formatter import CSV_COLUMNS, CsvFormatter
+
+
+def _rows(text):
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def test_rows_for_files_functions_and_findings():
+    """Test that every file, function and finding gets its own row."""
+    stream = io.StringIO()
+    with CsvFormatter(stream) as formatter:
+        formatter.write_file({
+            "file_path": "a.py", "cyclomatic_complexity": 3, "cognitive_complexity": 1,
+            "maintainability_index": 75.5, "loc": 9,
+            "functions": [{"name": "f", "line": 1, "end_line": 4, "cyclomatic_complexity": 3,
+                           "cognitive_complexity": 1, "loc": 3}],
+        })
+        formatter.write_dead_code({
+            "unused_variables": [{"name": "X", "file": "a.py", "line": 7, "end_line": 7}],
+        })
+        formatter.write_similarity({
+            "similar_fragments": [{"similarity": 0.91234, "fragments": [
+                {"file": "a.py", "start_line": 1, "end_line": 4},
+                {"file": "b.py", "start_line": 2, "end_line": 5},
+            ]}],
+            "structural_clones": [{"kind": "function", "similarity": 1.0, "fragments": [
+                {"file": "c.py", "start_line": 1, "end_line": 3},
+            ]}],
+        })
+
+    rows = _rows(stream.getvalue())
+    assert list(rows[0]) == CSV_COLUMNS
+    assert [(row["record"], row["file"], row["line"], row["name"]) for row in rows] == [
+        ("file", "a.py", "", ""),
+        ("function", "a.py", "1", "f"),
+        ("unused_variable", "a.py", "7", "X"),
+        ("similar_fragment", "a.py", "1", ""),
+        ("similar_fragment", "b.py", "2", ""),
+        ("structural_clone", "c.py", "1", "function"),
+    ]
+    assert rows[0]["maintainability_index"] == "75.5"
+    assert [row["group"] for row in rows[3:]] == ["1", "1", "2"]
+    assert rows[3]["similarity"] == "0.9123"
+
+
+def test_writes_to_a_file(tmp_path):
+    """Test that a path output is opened, buffered and closed by the formatter."""
+    path = tmp_path / "out.csv"
+    with CsvFormatter(path) as formatter:
+        formatter.format({"files": [{"file_path": "a.py", "functions": []}]})
+
+    assert [row["record"] for row in _rows(path.read_text())] == ["file"]
+
+
+def test_row_formatters_must_write_rows():
+    """Test that a row formatter without ``_write_rows`` cannot be created."""
+    class Incomplete(RowFormatter):
+        def format(self, data):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,48 @@
+"""Tests for the streaming HTML report formatter."""
+
+import io
+import json
+import re
+
+from code_analyzer.formatters.html import HtmlFormatter
+
+
+def _data(page, block):
+    return json.loads(re.search(rf'id="{block}">(.*?)</script>', page, re.S).group(1))
+
+
+def test_rows_are_streamed_into_the_page():
+    """Test that rows are written as results arrive, with paths indexed."""
+    stream = io.StringIO()
+    formatter = HtmlFormatter(stream)
+    formatter.write_file({"file_path": "a.py", "cyclomatic_complexity": 4, "functions": [
+        {"name": "f", "line": 1, "end_line": 3, "cyclomatic_complexity": 4,
+         "cognitive_complexity": 2},
+    ]})
+    streamed = stream.getvalue()
+    formatter.write_dead_code(
+        {"unused_functions": [{"name": "</script>", "file": "b.py", "line": 9}]}
+    )
+    formatter.close()
+    page = stream.getvalue()
+
+    assert '"function",0,1,3,"f"' in streamed
+    assert page.count("</script>") == 3
+    rows = _data(page, "rows")
+    assert [row[:2] for row in rows] == [["file", 0], ["function", 0], ["unused_function", 1]]
+    assert rows[2][4] == "</script>"
+    meta = _data(page, "meta")
+    assert meta["paths"] == ["a.py", "b.py"]
+    assert meta["columns"][:2] == ["record", "file"]
+
+
+def test_writes_a_report_file(tmp_path):
+    """Test that a path output creates its directory and a complete page."""
+    path = tmp_path / "reports" / "report.html"
+    with HtmlFormatter(path, title="A & B") as formatter:
+        formatter.format({"files": []})
+
+    page = path.read_text()
+    assert "<title>A &amp; B</title>" in page
+    assert _data(page, "rows") == []
+    assert page.rstrip().endswith("</html>")
@@ -0,0 +1,55 @@
+"""Tests for the streaming SARIF formatter."""
+
+import io
+import json
+
+from code_analyzer.formatters.sarif import SARIF_VERSION, SarifFormatter
+
+
+def test_results_regions_and_rules(tmp_path):
+    """Test that findings become results referring to deduplicated rules."""
+    source = tmp_path / "pkg" / "a.py"
+    other = tmp_path / "pkg" / "b.py"
+    stream = io.StringIO()
+    with SarifFormatter(stream, root=tmp_path, min_complexity=5) as formatter:
+        formatter.write_file({"file_path": str(source), "functions": [
+            {"name": "big", "line": 3, "end_line": 40, "cyclomatic_complexity": 12,
+             "cognitive_complexity": 2},
+            {"name": "small", "line": 41, "end_line": 44, "cyclomatic_complexity": 1,
+             "cognitive_complexity": 0},
+        ]})
+        formatter.write_dead_code({
+            "unused_functions": [{"name": "f", "file": str(source), "line": 50, "end_line": 52},
+                                 {"name": "g", "file": str(other), "line": 1, "end_line": 2}],
+        })
+        formatter.write_similarity({"similar_fragments": [{"similarity": 0.9, "fragments": [
+            {"file": str(source), "start_line": 3, "end_line": 10},
+            {"file": str(other), "start_line": 5, "end_line": 12},
+        ]}]})
+
+    log = json.loads(stream.getvalue())
+    assert log["version"] == SARIF_VERSION
+    run = log["runs"][0]
+    rules = run["tool"]["driver"]["rules"]
+    assert [rule["id"] for rule in rules] == ["CA101", "CA202", "CA301"]
+    results = run["results"]
+    assert [rules[r["ruleIndex"]]["id"] for r in results] == [r["ruleId"] for r in results]
+    assert [r["ruleId"] for r in results] == ["CA101", "CA202", "CA202", "CA301"]
+
+    location = results[0]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"] == {"uri": "pkg/a.py", "uriBaseId": "SRCROOT"}
+    assert location["region"] == {"startLine": 3, "endLine": 40}
+    related = results[3]["relatedLocations"]
+    assert related[0]["physicalLocation"]["artifactLocation"]["uri"] == "pkg/b.py"
+    assert run["originalUriBaseIds"]["SRCROOT"]["uri"] == tmp_path.resolve().as_uri() + "/"
+
+
+def test_empty_log_is_valid_json(tmp_path):
+    """Test that a log without findings is complete and lists no rules."""
+    path = tmp_path / "out.sarif"
+    with SarifFormatter(path) as formatter:
+        formatter.format({"files": [{"file_path": "a.py", "functions": []}]})
+
+    run = json.loads(path.read_text())["runs"][0]
+    assert run["results"] == []
+    assert run["tool"]["driver"]["rules"] == []
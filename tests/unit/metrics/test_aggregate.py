@@ -0,0 +1,61 @@
+"""Tests for aggregate statistics across files and functions."""
+
+import pytest
+
+from code_analyzer.metrics.aggregate import MetricsAggregator, summarize
+
+
+def _results():
+    return {
+        "files": [
+            {
+                "file_path": f"f{i}.py", "cyclomatic_complexity": 3 * i, "cognitive_complexity": i,
+                "maintainability_index": 50.0 + i, "loc": 10 * i, "total_functions": 3,
+                "functions": [
+                    {"name": f"func{i}_{j}", "line": j + 1, "cyclomatic_complexity": i + j,
+                     "cognitive_complexity": j, "loc": 5, "maintainability_index": 60.0,
+                     "halstead": {"volume": 10.0 * j}}
+                    for j in range(3)
+                ],
+            }
+            for i in range(1, 5)
+        ],
+    }
+
+
+def test_summary_statistics():
+    """Test totals, percentiles, histograms and top functions without NumPy."""
+    summary = MetricsAggregator.from_results(_results(), use_numpy=False).summary(top_k=2, bins=4)
+
+    assert summary["files"] == 4
+    assert summary["functions"] == 12
+    assert summary["file_metrics"]["loc"]["total"] == 100
+    assert summary["file_metrics"]["maintainability_index"]["mean"] == 52.5
+
+    cyclomatic = summary["function_metrics"]["cyclomatic_complexity"]
+    # Values are 1, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 6
+    assert (cyclomatic["total"], cyclomatic["min"], cyclomatic["max"]) == (42, 1, 6)
+    assert cyclomatic["mean"] == 3.5
+    assert (cyclomatic["p50"], cyclomatic["p90"], cyclomatic["p99"]) == (3.5, 5.0, 5.89)
+    assert cyclomatic["histogram"] == {"edges": [1.0, 2.25, 3.5, 4.75, 6.0], "counts": [3, 3, 3, 3]}
+
+    top = summary["top_functions"]["cyclomatic_complexity"]
+    assert [(f["file"], f["name"], f["value"]) for f in top] == [
+        ("f4.py", "func4_2", 6), ("f3.py", "func3_2", 5)
+    ]
+
+    assert summarize({"files": [], "summary": summary}) is summary
+    empty = summarize({})
+    assert empty["functions"] == 0
+    assert empty["function_metrics"]["loc"]["p90"] == 0.0
+
+
+def test_numpy_matches_python():
+    """Test that the vectorized summary equals the plain Python one."""
+    pytest.importorskip("numpy")
+    results = _results()
+
+    vectorized = MetricsAggregator.from_results(results, use_numpy=True).summary(top_k=5, bins=7)
+    plain = MetricsAggregator.from_results(results, use_numpy=False).summary(top_k=5, bins=7)
+
+    assert vectorized == plain
@@ -0,0 +1,104 @@
+"""Tests for the baseline of known findings."""
+
+import csv
+import json
+
+from code_analyzer.baseline import Baseline
+from code_analyzer.commands.analyze import AnalyzeCommand
+
+
+def _unused(path, name, line, end_line):
+    return {"name": name, "file": str(path), "line": line, "end_line": end_line, "type": "function"}
+
+
+def test_fingerprints_survive_moved_code(tmp_path):
+    """Test that baselined findings stay suppressed when their lines shift."""
+    source = tmp_path / "mod.py"
+    source.write_text("def old():\n    return 1\n")
+    recorder = Baseline(root=tmp_path)
+    assert recorder.is_new_symbol(_unused(source, "old", 1, 2))
+    path = tmp_path / "baseline.json"
+    assert recorder.save(path) == 1
+
+    source.write_text(
+        "import os\n\n\ndef new():\n    pass\n\n# moved\ndef old():\n\n    return 1\n"
+    )
+    baseline = Baseline.load(path, root=tmp_path)
+    assert baseline.is_new_symbol(_unused(source, "new", 4, 5))
+    assert not baseline.is_new_symbol(_unused(source, "old", 8, 10))
+    assert baseline.suppressed == 1
+
+
+def test_changed_clone_groups_are_reported(tmp_path):
+    """Test that a clone group is new again once one of its fragments changes."""
+    first = tmp_path / "a.py"
+    second = tmp_path / "b.py"
+    first.write_text("x = 1\ny = 2\n")
+    second.write_text("x = 1\ny = 2\n")
+    group = {
+        "fragments": [
+            {"file": str(first), "start_line": 1, "end_line": 2},
+            {"file": str(second), "start_line": 1, "end_line": 2},
+        ],
+        "similarity": 1.0,
+    }
+    recorder = Baseline(root=tmp_path)
+    recorder.is_new_group("similar_fragments", group)
+
+    baseline = Baseline(recorder.seen, root=tmp_path)
+    assert not baseline.is_new_group("similar_fragments", group)
+
+    second.write_text("x = 1\ny = 3\n")
+    changed = Baseline(recorder.seen, root=tmp_path)
+    assert changed.is_new_group("similar_fragments", group)
+
+
+def test_complex_functions_are_fingerprinted_by_qualified_name(tmp_path):
+    """Test that methods of the same name in different classes are told apart."""
+    source = tmp_path / "mod.py"
+    source.write_text("class A:\n    def run(self):\n        pass\n\n"
+                      "class B:\n    def run(self):\n        pass\n")
+    recorder = Baseline(root=tmp_path)
+    first = {"name": "run", "qualname": "A.run", "line": 2, "end_line": 3}
+    second = {"name": "run", "qualname": "B.run", "line": 6, "end_line": 7}
+    recorder.is_new_function(source, first)
+
+    baseline = Baseline(recorder.seen, root=tmp_path)
+    assert not baseline.is_new_function(source, first)
+    assert baseline.is_new_function(source, second)
+
+
+def test_baselined_complexity_findings_are_not_reported(tmp_path):
+    """Test that a baselined complex function is left out of SARIF but keeps its metrics."""
+    project = tmp_path / "project"
+    project.mkdir()
+    branches = "".join(f"    if x == {i}:\n        return {i}\n" for i in range(12))
+    (project / "mod.py").write_text(f"def tangled(x):\n{branches}    return -1\n\n\n"
+                                    "def simple():\n    return 0\n")
+    baseline = tmp_path / "baseline.json"
+    options = {"baseline": str(baseline), "min_complexity": 10}
+
+    sarif = tmp_path / "before.sarif"
+    command = AnalyzeCommand(output="sarif", output_file=str(sarif), **options)
+    assert command.run([str(project)]) == 0
+    rules = [result["ruleId"] for result in json.loads(sarif.read_text())["runs"][0]["results"]]
+    assert "CA101" in rules
+
+    assert AnalyzeCommand(output="sarif", output_file=str(tmp_path / "update.sarif"),
+                          update_baseline=True, **options).run([str(project)]) == 0
+
+    sarif = tmp_path / "after.sarif"
+    command = AnalyzeCommand(output="sarif", output_file=str(sarif), **options)
+    assert command.run([str(project)]) == 0
+    run = json.loads(sarif.read_text())["runs"][0]
+    rules = [result["ruleId"] for result in run["results"]]
+    assert "CA101" not in rules and "CA102" not in rules
+    metrics = run["properties"]["metrics"]
+    assert metrics["functions"] == 2
+    assert metrics["function_metrics"]["cyclomatic_complexity"]["max"] == 13
+
+    output = tmp_path / "after.csv"
+    assert AnalyzeCommand(output="csv", output_file=str(output), **options).run([str(project)]) == 0
+    with open(output, newline="") as f:
+        functions = [row["name"] for row in csv.DictReader(f) if row["record"] == "function"]
+    assert functions == ["tangled", "simple"]
@@ -1,10 +1,14 @@
 """Tests for the main CLI module."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
+import code_analyzer
 from code_analyzer.__main__ import analyze, cli
 
 
@@ -24,6 +28,18 @@ class TestMain:
         assert "Usage:" in result.output
         assert "analyze" in result.output
 
+    def test_run_as_module(self):
+        """Test that ``python -m code_analyzer`` runs the CLI."""
+        env = dict(os.environ)
+        source = str(Path(code_analyzer.__file__).parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [source, env.get("PYTHONPATH")]))
+        result = subprocess.run(
+            [sys.executable, "-m", "code_analyzer", "--help"],
+            capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0
+        assert "Usage:" in result.stdout
+
     def test_analyze_help(self):
         """Test analyze command help."""
         runner = CliRunner()
@@ -0,0 +1,89 @@
+"""Tests for the SQLite results store."""
+
+from click.testing import CliRunner
+
+from code_analyzer.__main__ import cli
+from code_analyzer.commands.trends import TrendsCommand
+from code_analyzer.results_store import ResultsStore
+
+
+def _results(**complexities):
+    return {
+        "files": [{
+            "file_path": "module.py",
+            "cyclomatic_complexity": sum(complexities.values()),
+            "cognitive_complexity": 0,
+            "maintainability_index": 80.0,
+            "loc": 10,
+            "total_functions": len(complexities),
+            "functions": [
+                {"name": name, "line": line, "cyclomatic_complexity": value,
+                 "cognitive_complexity": 0, "loc": 2}
+                for line, (name, value) in enumerate(complexities.items(), 1)
+            ],
+        }],
+        "total_unused": 0,
+    }
+
+
+def test_complexity_growth_over_recent_runs(tmp_path):
+    """Test that growth is measured between the oldest and newest recent run."""
+    with ResultsStore(tmp_path / "history.sqlite") as store:
+        store.record_run(_results(parse=1, render=9, load=3))
+        store.record_run(_results(parse=2, render=5, load=3))
+        store.record_run(_results(parse=6, render=7, load=4, new=20))
+
+        assert store.complexity_growth(last_runs=3) == [
+            {"path": "module.py", "name": "parse", "start": 1, "end": 6, "growth": 5},
+            {"path": "module.py", "name": "load", "start": 3, "end": 4, "growth": 1},
+        ]
+        assert [row["name"] for row in store.complexity_growth(last_runs=2)] == [
+            "parse", "render", "load"
+        ]
+        history = store.file_history("module.py")
+        assert [row["cyclomatic_complexity"] for row in history] == [13, 10, 37]
+
+
+def test_old_runs_are_pruned(tmp_path):
+    """Test that only the most recent max_runs runs and their rows are kept."""
+    with ResultsStore(tmp_path / "history.sqlite") as store:
+        for value in range(5):
+            last = store.record_run(_results(parse=value), max_runs=2)
+
+        assert [run["id"] for run in store.runs()] == [last, last - 1]
+        remaining = store.connection.execute("SELECT COUNT(*) FROM function_metrics").fetchone()[0]
+        assert remaining == 2
+
+
+def test_trends_command(tmp_path):
+    """Test that the trends command lists growing functions."""
+    path = tmp_path / "history.sqlite"
+    with ResultsStore(path) as store:
+        store.record_run(_results(parse=1))
+        store.record_run(_results(parse=4))
+
+    result = CliRunner().invoke(cli, ["trends", "--db", str(path)])
+
+    assert result.exit_code == 0
+    assert "parse" in result.output and "+3" in result.output
+
+
+def test_trends_command_without_cli(tmp_path):
+    """Test the trends command directly, including an unreadable history."""
+    path = tmp_path / "history.sqlite"
+    with ResultsStore(path) as store:
+        store.record_run(_results(parse=2, load=1))
+        store.record_run(_results(parse=2, load=5))
+
+    command = TrendsCommand(db_path=str(path), metric="cyclomatic_complexity")
+    command.console.file = open(tmp_path / "out.txt", "w")
+    assert command.run() == 0
+    command.console.file.close()
+    output = (tmp_path / "out.txt").read_text()
+    assert "load" in output and "+4" in output and "parse" not in output
+
+    (tmp_path / "broken.sqlite").write_text("not a database")
+    command = TrendsCommand(db_path=str(tmp_path / "broken.sqlite"))
+    command.error_console.file = open(tmp_path / "errors.txt", "w")
+    assert command.run() == 1
+    command.error_console.file.close()